@@ -78,9 +78,7 @@ def on_report(rpt: Report):
     print(f"    rpt.buf_ovfl: {rpt.buf_ovfl}")
     print(f"    rpt.conf_rev: {rpt.conf_rev}")
     print(f"    rpt.dataset_name: {rpt.dataset_name}")
-    print(
-        f"    rpt.entry_id: {tmp if (tmp:=rpt.entry_id) is None else ' '.join(format(val, '02x') for val in tmp)}"
-    )
+    print(f"    rpt.entry_id: {tmp if (tmp:=rpt.entry_id) is None else tmp.hex(' ')}")
     print(f"    rpt.more_seqments_follow: {rpt.more_seqments_follow}")
     print(f"    rpt.rcb_reference: {rpt.rcb_reference}")
     print(f"    rpt.rpt_id: {rpt.rpt_id}")
@@ -89,20 +87,16 @@ def on_report(rpt: Report):
     print(f"    rpt.timestamp: {rpt.timestamp}")
 
     print("    content of the report:")
-    values = rpt.dataset_values
-    for i in range(values.size()):
-        if (
-            rpt.has_reason_for_inclusion
-            and rpt.get_reason_for_inclusion(i) == ReasonForInclusion.NOT_INCLUDED
-        ):
+    for i, (value, reason, reference) in enumerate(rpt.snapshot()):
+        if reason == ReasonForInclusion.NOT_INCLUDED:
             print(f"        item: {i} not included")
             continue
 
         print(f"        item: {i}")
-        if rpt.has_data_reference:
-            print(f"            {rpt.get_data_reference(i)}")
-        print(f"            {rpt.get_reason_for_inclusion(i)}")
-        print(f"            {values.get_element(i)}")
+        if reference is not None:
+            print(f"            {reference}")
+        print(f"            {reason}")
+        print(f"            {value}")
 
 
 # ## Connection
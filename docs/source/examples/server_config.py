@@ -11,7 +11,6 @@
 
 # Create the model from a configuration file
 
-import datetime
 import os
 import time
 
@@ -61,11 +60,10 @@ val = 0.0
 
 while True:
     time.sleep(2)
-    ied_server.lock_data_model()
-    ied_server.update_utc_time(
-        temperatureTimestamp,  # type:ignore
-        datetime.datetime.now().astimezone(),
+    ied_server.update_batch(
+        [
+            (temperatureTimestamp, "utc_time_ns", time.time_ns()),  # type:ignore
+            (temperatureValue, "float", val),  # type:ignore
+        ]
     )
-    ied_server.update_float(temperatureValue, val)  # type:ignore
-    ied_server.unlock_data_model()
     val += 0.1
@@ -14,7 +14,7 @@
 import os
 import time
 
-from py61850.common import CdcControlModelOptions, MmsDataAccessError, MmsValue
+from py61850.common import CdcControlModelOptions, MmsDataAccessError, MmsValue, names
 from py61850.server import (
     CheckHandlerResult,
     ClientConnection,
@@ -183,9 +183,9 @@ def on_control_operate(
     print(f"    Originator category is {action.get_originator_category()}")
     # print(action.get_control_time())  # Not working ?
 
-    if data_object.name == b"Mod":
-        ied_server.update_utc_time(data_object.child("t"))
-        ied_server.update_int32(data_object.child("stVal"), ctl_value.get_value())
+    if data_object.name == names.MOD:
+        ied_server.update_utc_time(ld0_lln0_mod_t)
+        ied_server.update_int32(ld0_lln0_mod_stval, ctl_value.get_value())
 
     return ControlHandlerResult.OK
 
@@ -220,13 +220,13 @@ ld0_ptoc1 = ld0.create_logical_node("PTOC1")
 # Add some data object in logical nodes
 
 ld0_lln0_mod = ld0_lln0.create_cdc_inc(
-    "Mod",
+    names.MOD,
     control_options=CdcControlModelOptions.MODEL_SBO_ENHANCED,
 )
-ld0_lln0_beh = ld0_lln0.create_cdc_ins("Beh")
-ld0_lln0_health = ld0_lln0.create_cdc_ins("Health")
+ld0_lln0_beh = ld0_lln0.create_cdc_ins(names.BEH)
+ld0_lln0_health = ld0_lln0.create_cdc_ins(names.HEALTH)
 
-ld0_ptoc1_beh = ld0_ptoc1.create_cdc_ens("Beh")
+ld0_ptoc1_beh = ld0_ptoc1.create_cdc_ens(names.BEH)
 ld0_ptoc1_str = ld0_ptoc1.create_cdc_acd("Str")
 ld0_ptoc1_op = ld0_ptoc1.create_cdc_act("Op")
 ld0_ptoc1_strval = ld0_ptoc1.create_cdc_asg("StrVal", False)
@@ -256,10 +256,11 @@ brcba = ld0_lln0.create_report_control_block("BRCBA", "BRCBA01", True, dataset.n
 
 # Retrieve attribute for further operation
 
-ld0_lln0_mod_t: DataAttribute = ld0_lln0_mod.child("t")  # type:ignore
-ld0_ptoc1_str_t: DataAttribute = ld0_ptoc1_str.child("t")  # type:ignore
-ld0_ptoc1_str_general: DataAttribute = ld0_ptoc1_str.child("general")  # type:ignore
-ld0_ptoc1_ppdltmms_setval: DataAttribute = ld0_ptoc1_ppdltmms.child("setVal")  # type:ignore
+ld0_lln0_mod_t: DataAttribute = ld0_lln0_mod.child(names.T)  # type:ignore
+ld0_lln0_mod_stval: DataAttribute = ld0_lln0_mod.child(names.ST_VAL)  # type:ignore
+ld0_ptoc1_str_t: DataAttribute = ld0_ptoc1_str.child(names.T)  # type:ignore
+ld0_ptoc1_str_general: DataAttribute = ld0_ptoc1_str.child(names.GENERAL)  # type:ignore
+ld0_ptoc1_ppdltmms_setval: DataAttribute = ld0_ptoc1_ppdltmms.child(names.SET_VAL)  # type:ignore
 
 # Initialise some value before creating the server
 
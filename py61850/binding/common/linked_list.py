@@ -1,6 +1,8 @@
 """Module for C binding with common/inc/linked_list.h"""
 
-from ctypes import CDLL, POINTER, Structure, c_void_p
+from ctypes import POINTER, Structure, c_void_p
+
+from ..library import Library
 
 
 class SLinkedList(Structure):
@@ -11,19 +13,25 @@ SLinkedList._fields_ = [("data", c_void_p), ("next", POINTER(SLinkedList))]
 LinkedList = POINTER(SLinkedList)
 
 
-def setup_prototypes(lib: CDLL):
+# (function name, argtypes, restype) of each prototype of the module
+_PROTOTYPES = (
+    ("LinkedList_create", (), LinkedList),
+    (
+        "LinkedList_destroy",
+        (LinkedList,),  # LinkedList self
+        None,
+    ),
+    (
+        "LinkedList_add",
+        (
+            LinkedList,  # LinkedList self
+            c_void_p,  # void* data
+        ),
+        None,
+    ),
+)
+
+
+def setup_prototypes(lib: Library):
     """Add prototypes definition to the lib"""
-
-    lib.LinkedList_create.argtypes = []
-    lib.LinkedList_create.restype = LinkedList
-
-    lib.LinkedList_destroy.argtypes = [
-        LinkedList,  # LinkedList self
-    ]
-    lib.LinkedList_destroy.restype = None
-
-    lib.LinkedList_add.argtypes = [
-        LinkedList,  # LinkedList self
-        c_void_p,  # void* data
-    ]
-    lib.LinkedList_add.restype = None
+    lib.defer_prototypes(_PROTOTYPES)
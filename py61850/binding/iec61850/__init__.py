@@ -0,0 +1,20 @@
+import importlib.util
+import sys
+
+__all__ = []
+
+
+def _lazy_import(name: str):
+    """Import a submodule whose code is only executed on first attribute access"""
+    spec = importlib.util.find_spec(f"{__name__}.{name}")
+    assert spec is not None and spec.loader is not None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    loader.exec_module(module)
+    return module
+
+
+# The CDC table is only needed once the library is loaded or a CDC is created
+cdc = _lazy_import("cdc")
@@ -1,352 +1,169 @@
 """Module for C binding with iec61850/inc/iec61850_cdc.h"""
 
-from ctypes import CDLL, POINTER, c_bool, c_char_p, c_uint8, c_uint16, c_uint32
+from ctypes import POINTER, c_bool, c_char_p, c_uint8, c_uint16, c_uint32
 
+from ..library import Library, module_getattr
 from .iec61850_common import FunctionalConstraint
 from .model import DataAttribute, DataObject, ModelNode
 
+_P_MODEL_NODE = POINTER(ModelNode)
+_P_DATA_ATTRIBUTE = POINTER(DataAttribute)
+_P_DATA_OBJECT = POINTER(DataObject)
 
-def setup_prototypes(lib: CDLL):
-    """Add prototypes definition to the lib"""
+# Signatures shared by several CDC, the same tuple is given to each function
+_SIG_DOBJ_BASIC = (
+    c_char_p,  # const char* dataObjectName
+    _P_MODEL_NODE,  # ModelNode* parent
+    c_uint32,  # uint32_t options
+)
+_SIG_DOBJ_INT_OR_FLOAT = _SIG_DOBJ_BASIC + (c_bool,)  # bool isIntegerNotFloat
+_SIG_CTRL = _SIG_DOBJ_BASIC + (c_uint32,)  # uint32_t controlOptions
+_SIG_CTRL_TRANS = _SIG_CTRL + (c_bool,)  # bool hasTransientIndicator / bool isIntegerNotFloat
+_SIG_CTRL_WP = _SIG_CTRL + (
+    c_uint32,  # uint32_t wpOptions
+    c_bool,  # bool hasChaManRs / bool hasOldStatus / bool hasHisRs
+)
 
-    ####################################################
-    # Constructed Attribute Classes (CAC)
-    ####################################################
-
-    lib.CAC_AnalogueValue_create.argtypes = [
-        c_char_p,  # const char* name
-        POINTER(ModelNode),  # ModelNode* parent
-        FunctionalConstraint,  #  FunctionalConstraint fc
-        c_uint8,  #  uint8_t triggerOptions
-        c_bool,  # bool isIntegerNotFloat
-    ]
-    lib.CAC_AnalogueValue_create.restype = POINTER(DataAttribute)
-
-    lib.CAC_ValWithTrans_create.argtypes = [
-        c_char_p,  # const char* name
-        POINTER(ModelNode),  # ModelNode* parent
-        FunctionalConstraint,  #  FunctionalConstraint fc
-        c_uint8,  #  uint8_t triggerOptions
-        c_bool,  # bool hasTransientIndicator
-    ]
-    lib.CAC_ValWithTrans_create.restype = POINTER(DataAttribute)
-
-    lib.CAC_Vector_create.argtypes = [
-        c_char_p,  # const char* name
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  #  uint32_t options
-        FunctionalConstraint,  #  FunctionalConstraint fc
-        c_uint8,  #  uint8_t triggerOptions
-    ]
-    lib.CAC_Vector_create.restype = POINTER(DataAttribute)
 
-    lib.CAC_Point_create.argtypes = [
-        c_char_p,  # const char* name
-        POINTER(ModelNode),  # ModelNode* parent
-        FunctionalConstraint,  #  FunctionalConstraint fc
-        c_uint8,  #  uint8_t triggerOptions
-        c_bool,  # bool hasZVal
-    ]
-    lib.CAC_Point_create.restype = POINTER(DataAttribute)
+def _control_prototypes(signature: tuple, *cdcs: str) -> tuple:
+    """Prototypes of the ``CDC_<cdc>_create`` functions sharing a control signature"""
+    return tuple((f"CDC_{cdc}_create", signature, _P_DATA_OBJECT) for cdc in cdcs)
 
-    lib.CAC_ScaledValueConfig_create.argtypes = [
-        c_char_p,  # const char* name
-        POINTER(ModelNode),  # ModelNode* parent
-    ]
-    lib.CAC_ScaledValueConfig_create.restype = POINTER(DataAttribute)
-
-    lib.CAC_Unit_create.argtypes = [
-        c_char_p,  # const char* name
-        POINTER(ModelNode),  # ModelNode* parent
-        c_bool,  # bool hasMagnitude
-    ]
-    lib.CAC_Unit_create.restype = POINTER(DataAttribute)
 
+# (function name, argtypes, restype) of each prototype of the module
+_PROTOTYPES = (
+    ####################################################
+    # Constructed Attribute Classes (CAC)
+    ####################################################
+    (
+        "CAC_AnalogueValue_create",
+        (
+            c_char_p,  # const char* name
+            _P_MODEL_NODE,  # ModelNode* parent
+            FunctionalConstraint,  #  FunctionalConstraint fc
+            c_uint8,  #  uint8_t triggerOptions
+            c_bool,  # bool isIntegerNotFloat
+        ),
+        _P_DATA_ATTRIBUTE,
+    ),
+    (
+        "CAC_ValWithTrans_create",
+        (
+            c_char_p,  # const char* name
+            _P_MODEL_NODE,  # ModelNode* parent
+            FunctionalConstraint,  #  FunctionalConstraint fc
+            c_uint8,  #  uint8_t triggerOptions
+            c_bool,  # bool hasTransientIndicator
+        ),
+        _P_DATA_ATTRIBUTE,
+    ),
+    (
+        "CAC_Vector_create",
+        (
+            c_char_p,  # const char* name
+            _P_MODEL_NODE,  # ModelNode* parent
+            c_uint32,  #  uint32_t options
+            FunctionalConstraint,  #  FunctionalConstraint fc
+            c_uint8,  #  uint8_t triggerOptions
+        ),
+        _P_DATA_ATTRIBUTE,
+    ),
+    (
+        "CAC_Point_create",
+        (
+            c_char_p,  # const char* name
+            _P_MODEL_NODE,  # ModelNode* parent
+            FunctionalConstraint,  #  FunctionalConstraint fc
+            c_uint8,  #  uint8_t triggerOptions
+            c_bool,  # bool hasZVal
+        ),
+        _P_DATA_ATTRIBUTE,
+    ),
+    (
+        "CAC_ScaledValueConfig_create",
+        (
+            c_char_p,  # const char* name
+            _P_MODEL_NODE,  # ModelNode* parent
+        ),
+        _P_DATA_ATTRIBUTE,
+    ),
+    (
+        "CAC_Unit_create",
+        (
+            c_char_p,  # const char* name
+            _P_MODEL_NODE,  # ModelNode* parent
+            c_bool,  # bool hasMagnitude
+        ),
+        _P_DATA_ATTRIBUTE,
+    ),
     ####################################################
     # Common Data Classes (CDC)
     ####################################################
-
-    lib.CDC_SPS_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_SPS_create.restype = POINTER(DataObject)
-
-    lib.CDC_DPS_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_DPS_create.restype = POINTER(DataObject)
-
-    lib.CDC_INS_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_INS_create.restype = POINTER(DataObject)
-
-    lib.CDC_ENS_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_ENS_create.restype = POINTER(DataObject)
-
-    lib.CDC_BCR_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_BCR_create.restype = POINTER(DataObject)
-
-    lib.CDC_VSS_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_VSS_create.restype = POINTER(DataObject)
-
-    lib.CDC_SEC_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_SEC_create.restype = POINTER(DataObject)
-
-    lib.CDC_MV_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_bool,  # bool isIntegerNotFloat
-    ]
-    lib.CDC_MV_create.restype = POINTER(DataObject)
-
-    lib.CDC_CMV_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_CMV_create.restype = POINTER(DataObject)
-
-    lib.CDC_SAV_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_bool,  # bool isIntegerNotFloat
-    ]
-    lib.CDC_SAV_create.restype = POINTER(DataObject)
-
-    lib.CDC_LPL_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_LPL_create.restype = POINTER(DataObject)
-
-    lib.CDC_HST_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint16,  # uint16_t maxPts
-    ]
-    lib.CDC_HST_create.restype = POINTER(DataObject)
-
-    lib.CDC_ACD_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_ACD_create.restype = POINTER(DataObject)
-
-    lib.CDC_ACT_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_ACT_create.restype = POINTER(DataObject)
-
-    lib.CDC_SPG_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_SPG_create.restype = POINTER(DataObject)
-
-    lib.CDC_VSG_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_VSG_create.restype = POINTER(DataObject)
-
-    lib.CDC_ENG_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_ENG_create.restype = POINTER(DataObject)
-
-    lib.CDC_ING_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_ING_create.restype = POINTER(DataObject)
-
-    lib.CDC_ASG_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_bool,  # bool isIntegerNotFloat
-    ]
-    lib.CDC_ASG_create.restype = POINTER(DataObject)
-
-    lib.CDC_WYE_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_WYE_create.restype = POINTER(DataObject)
-
-    lib.CDC_DEL_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-    ]
-    lib.CDC_DEL_create.restype = POINTER(DataObject)
-
+    ("CDC_SPS_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_DPS_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_INS_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_ENS_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_BCR_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_VSS_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_SEC_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_MV_create", _SIG_DOBJ_INT_OR_FLOAT, _P_DATA_OBJECT),
+    ("CDC_CMV_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_SAV_create", _SIG_DOBJ_INT_OR_FLOAT, _P_DATA_OBJECT),
+    ("CDC_LPL_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    (
+        "CDC_HST_create",
+        (
+            c_char_p,  # const char* dataObjectName
+            _P_MODEL_NODE,  # ModelNode* parent
+            c_uint32,  # uint32_t options
+            c_uint16,  # uint16_t maxPts
+        ),
+        _P_DATA_OBJECT,
+    ),
+    ("CDC_ACD_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_ACT_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_SPG_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_VSG_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_ENG_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_ING_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_ASG_create", _SIG_DOBJ_INT_OR_FLOAT, _P_DATA_OBJECT),
+    ("CDC_WYE_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
+    ("CDC_DEL_create", _SIG_DOBJ_BASIC, _P_DATA_OBJECT),
     ####################################################
     # Controls
     ####################################################
-
-    lib.CDC_SPC_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-    ]
-    lib.CDC_SPC_create.restype = POINTER(DataObject)
-
-    lib.CDC_DPC_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-    ]
-    lib.CDC_DPC_create.restype = POINTER(DataObject)
-
-    lib.CDC_INC_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-    ]
-    lib.CDC_INC_create.restype = POINTER(DataObject)
-
-    lib.CDC_ENC_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-    ]
-    lib.CDC_ENC_create.restype = POINTER(DataObject)
-
-    lib.CDC_BSC_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-        c_bool,  # bool hasTransientIndicator
-    ]
-    lib.CDC_BSC_create.restype = POINTER(DataObject)
-
-    lib.CDC_ISC_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-        c_bool,  # bool hasTransientIndicator
-    ]
-    lib.CDC_ISC_create.restype = POINTER(DataObject)
-
-    lib.CDC_APC_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-        c_bool,  # bool isIntegerNotFloat
-    ]
-    lib.CDC_APC_create.restype = POINTER(DataObject)
-
-    lib.CDC_BAC_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-        c_bool,  # bool isIntegerNotFloat
-    ]
-    lib.CDC_BAC_create.restype = POINTER(DataObject)
-
-    lib.CDC_SPV_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-        c_uint32,  # uint32_t wpOptions
-        c_bool,  # bool hasChaManRs
-    ]
-    lib.CDC_SPV_create.restype = POINTER(DataObject)
-
-    lib.CDC_STV_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-        c_uint32,  # uint32_t wpOptions
-        c_bool,  # bool hasOldStatus
-    ]
-    lib.CDC_STV_create.restype = POINTER(DataObject)
-
-    lib.CDC_CMD_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-        c_uint32,  # uint32_t wpOptions
-        c_bool,  # bool hasOldStatus
-        c_bool,  # bool hasCmTm,
-        c_bool,  # bool hasCmCt
-    ]
-    lib.CDC_CMD_create.restype = POINTER(DataObject)
-
-    lib.CDC_ALM_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-        c_uint32,  # uint32_t wpOptions
-        c_bool,  # bool hasOldStatus
-    ]
-    lib.CDC_ALM_create.restype = POINTER(DataObject)
-
-    lib.CDC_CTE_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-        c_uint32,  # uint32_t wpOptions
-        c_bool,  # bool hasHisRs
-    ]
-    lib.CDC_CTE_create.restype = POINTER(DataObject)
-
-    lib.CDC_TMS_create.argtypes = [
-        c_char_p,  # const char* dataObjectName
-        POINTER(ModelNode),  # ModelNode* parent
-        c_uint32,  # uint32_t options
-        c_uint32,  # uint32_t controlOptions
-        c_uint32,  # uint32_t wpOptions
-        c_bool,  # bool hasHisRs
-    ]
-    lib.CDC_TMS_create.restype = POINTER(DataObject)
+    *_control_prototypes(_SIG_CTRL, "SPC", "DPC", "INC", "ENC"),
+    *_control_prototypes(_SIG_CTRL_TRANS, "BSC", "ISC", "APC", "BAC"),
+    ("CDC_SPV_create", _SIG_CTRL_WP, _P_DATA_OBJECT),
+    ("CDC_STV_create", _SIG_CTRL_WP, _P_DATA_OBJECT),
+    (
+        "CDC_CMD_create",
+        (
+            c_char_p,  # const char* dataObjectName
+            _P_MODEL_NODE,  # ModelNode* parent
+            c_uint32,  # uint32_t options
+            c_uint32,  # uint32_t controlOptions
+            c_uint32,  # uint32_t wpOptions
+            c_bool,  # bool hasOldStatus
+            c_bool,  # bool hasCmTm,
+            c_bool,  # bool hasCmCt
+        ),
+        _P_DATA_OBJECT,
+    ),
+    ("CDC_ALM_create", _SIG_CTRL_WP, _P_DATA_OBJECT),
+    ("CDC_CTE_create", _SIG_CTRL_WP, _P_DATA_OBJECT),
+    ("CDC_TMS_create", _SIG_CTRL_WP, _P_DATA_OBJECT),
+)
+
+
+def setup_prototypes(lib: Library):
+    """Add prototypes definition to the lib
+
+    The prototypes are only applied when the function is used for the
+    first time, most applications only use a few CDC.
+    """
+    lib.defer_prototypes(_PROTOTYPES)
+
+
+# Expose the CDC functions of the loaded library as module attributes
+__getattr__ = module_getattr(globals(), _PROTOTYPES)
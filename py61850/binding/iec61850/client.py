@@ -1,7 +1,6 @@
 """Module for C binding with iec61850/inc/iec61850_client.h"""
 
 from ctypes import (
-    CDLL,
     CFUNCTYPE,
     POINTER,
     Structure,
@@ -19,6 +18,7 @@ from ctypes import (
 )
 
 from ..common.linked_list import LinkedList
+from ..library import Library, accessor_names, module_getattr
 from ..mms import MmsType, MmsValue, MmsVariableSpecification
 from .iec61850_common import (
     ACSIClass,
@@ -94,6 +94,14 @@ class LastApplError(Structure):
     ]
 
 
+# Pointer types used by the prototypes
+_P_ERROR = POINTER(IedClientError)
+_P_MMS_VALUE = POINTER(MmsValue)
+_P_BOOL = POINTER(c_bool)
+_P_UINT8 = POINTER(c_uint8)
+_P_TIMESTAMP = POINTER(Timestamp)
+
+
 ControlObjectClient_ControlActionHandler = CFUNCTYPE(
     None,  # return type: void
     c_uint32,  # uint32_t invokeId,
@@ -112,7 +120,7 @@ CommandTerminationHandler = CFUNCTYPE(
 IedClientGetFileHandler = CFUNCTYPE(
     c_bool,  # return type: c_bool
     c_void_p,  # void* parameter
-    POINTER(c_uint8),  #  uint8_t* buffer
+    c_void_p,  # uint8_t* buffer, address given as an int to the callback
     c_uint32,  # uint32_t bytesRead
 )
 
@@ -127,7 +135,7 @@ IedConnection_FileDirectoryEntryHandler = CFUNCTYPE(
     c_uint32,  # uint32_t invokeId
     c_void_p,  # void* parameter
     IedClientError,  # IedClientError mmsError
-    LinkedList,  # char* filename
+    c_char_p,  # char* filename
     c_uint32,  #  uint32_t size
     c_uint64,  #  uint64_t lastModfified
     c_bool,  #  bool moreFollows
@@ -146,7 +154,7 @@ IedConnection_GetFileAsyncHandler = CFUNCTYPE(
     c_void_p,  #  void* parameter
     IedClientError,  # IedClientError err
     c_uint32,  # uint32_t originalInvokeId
-    POINTER(c_uint8),  # uint8_t* buffer
+    c_void_p,  # uint8_t* buffer, address given as an int to the callback
     c_uint32,  # uint32_t bytesRead
     c_bool,  # bool moreFollows
 )
@@ -190,7 +198,15 @@ IedConnection_ReadObjectHandler = CFUNCTYPE(
     c_uint32,  # uint32_t invokeId
     c_void_p,  #  void* parameter
     IedClientError,  # IedClientError err
-    POINTER(MmsValue),  # MmsValue* value
+    _P_MMS_VALUE,  # MmsValue* value
+)
+
+IedConnection_ReadDataSetHandler = CFUNCTYPE(
+    None,  # return type: void
+    c_uint32,  # uint32_t invokeId
+    c_void_p,  # void* parameter
+    IedClientError,  # IedClientError err
+    ClientDataSet,  # ClientDataSet dataSet
 )
 
 IedConnection_StateChangedHandler = CFUNCTYPE(
@@ -207,1132 +223,954 @@ ReportCallbackFunction = CFUNCTYPE(
 )
 
 
-def setup_prototypes(lib: CDLL):
-    """Add prototypes definition to the lib"""
+# Signatures shared by many functions, the same tuple is given to each function
+_SIG_CONNECTION = (IedConnection,)  # IedConnection self
+_SIG_GOCB = (ClientGooseControlBlock,)  # ClientGooseControlBlock self
+_SIG_RCB = (ClientReportControlBlock,)  # ClientReportControlBlock self
+_SIG_REPORT = (ClientReport,)  # ClientReport self
+_SIG_DATA_SET = (ClientDataSet,)  # ClientDataSet self
+_SIG_CONTROL = (ControlObjectClient,)  # ControlObjectClient self
+_SIG_FILE_ENTRY = (FileDirectoryEntry,)  # FileDirectoryEntry self
+_SIG_REFERENCE = (
+    IedConnection,  # IedConnection self
+    _P_ERROR,  # IedClientError* error
+    c_char_p,  # const char* objectReference / dataSetReference / ...
+)
+_SIG_READ = _SIG_REFERENCE + (FunctionalConstraint,)  # FunctionalConstraint fc
+_SIG_CONNECTION_ERROR = _SIG_REFERENCE[:2]  # IedConnection self, IedClientError* error
+_SIG_RCB_BOOL = _SIG_RCB + (c_bool,)  # bool value of the setter
+_SIG_CONTROL_BOOL = _SIG_CONTROL + (c_bool,)  # bool value of the setter
+
+# (function name, argtypes, restype) of each prototype of the module
+_PROTOTYPES = (
     ####################################################
     # Connection creation and destruction
     ####################################################
-
-    lib.IedConnection_create.argtypes = []
-    lib.IedConnection_create.restype = IedConnection
-
-    lib.IedConnection_destroy.argtypes = [IedConnection]
-    lib.IedConnection_destroy.restype = None
-
-    lib.IedConnection_destroy.argtypes = [IedConnection]
-    lib.IedConnection_destroy.restype = None
-
-    lib.IedConnection_setLocalAddress.argtypes = [
-        IedConnection,  # IedConnection self
-        c_char_p,  # const char* localIpAddress
-        c_int,  # int localPort
-    ]
-    lib.IedConnection_setLocalAddress.restype = None
-
-    lib.IedConnection_setConnectTimeout.argtypes = [
-        IedConnection,  # IedConnection self
-        c_uint32,  # uint32_t timeoutInMs
-    ]
-    lib.IedConnection_setConnectTimeout.restype = None
-
-    lib.IedConnection_setMaxOutstandingCalls.argtypes = [
-        IedConnection,  # IedConnection self
-        c_int,  # int calling
-        c_int,  # int called
-    ]
-    lib.IedConnection_setMaxOutstandingCalls.restype = None
-
-    lib.IedConnection_setRequestTimeout.argtypes = [
-        IedConnection,  # IedConnection self
-        c_uint32,  # uint32_t timeoutInMs
-    ]
-    lib.IedConnection_setRequestTimeout.restype = None
-
-    lib.IedConnection_getRequestTimeout.argtypes = [IedConnection]
-    lib.IedConnection_getRequestTimeout.restype = c_uint32
-
-    lib.IedConnection_setTimeQuality.argtypes = [
-        IedConnection,  # IedConnection self
-        c_bool,  # bool leapSecondKnown
-        c_bool,  # bool clockFailure
-        c_bool,  # bool clockNotSynchronized
-        c_int,  # int subsecondPrecision
-    ]
-    lib.IedConnection_setTimeQuality.restype = None
-
-    lib.IedConnection_tick.argtypes = [IedConnection]
-    lib.IedConnection_tick.restype = c_bool
-
+    ("IedConnection_create", (), IedConnection),
+    ("IedConnection_destroy", _SIG_CONNECTION, None),
+    (
+        "IedConnection_setLocalAddress",
+        (
+            IedConnection,  # IedConnection self
+            c_char_p,  # const char* localIpAddress
+            c_int,  # int localPort
+        ),
+        None,
+    ),
+    (
+        "IedConnection_setConnectTimeout",
+        (
+            IedConnection,  # IedConnection self
+            c_uint32,  # uint32_t timeoutInMs
+        ),
+        None,
+    ),
+    (
+        "IedConnection_setMaxOutstandingCalls",
+        (
+            IedConnection,  # IedConnection self
+            c_int,  # int calling
+            c_int,  # int called
+        ),
+        None,
+    ),
+    (
+        "IedConnection_setRequestTimeout",
+        (
+            IedConnection,  # IedConnection self
+            c_uint32,  # uint32_t timeoutInMs
+        ),
+        None,
+    ),
+    ("IedConnection_getRequestTimeout", _SIG_CONNECTION, c_uint32),
+    (
+        "IedConnection_setTimeQuality",
+        (
+            IedConnection,  # IedConnection self
+            c_bool,  # bool leapSecondKnown
+            c_bool,  # bool clockFailure
+            c_bool,  # bool clockNotSynchronized
+            c_int,  # int subsecondPrecision
+        ),
+        None,
+    ),
+    ("IedConnection_tick", _SIG_CONNECTION, c_bool),
     ####################################################
     # Association service
     ####################################################
-
-    lib.IedConnection_connect.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,
-        c_int,
-    ]
-    lib.IedConnection_connect.restype = None
-
-    lib.IedConnection_abort.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-    ]
-    lib.IedConnection_abort.restype = None
-
-    lib.IedConnection_release.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-    ]
-    lib.IedConnection_release.restype = None
-
-    lib.IedConnection_close.argtypes = [IedConnection]
-    lib.IedConnection_close.restype = None
-
-    lib.IedConnection_getState.argtypes = [IedConnection]
-    lib.IedConnection_getState.restype = IedConnectionState
-
-    lib.IedConnection_getLastApplError.argtypes = [IedConnection]
-    lib.IedConnection_getLastApplError.restype = LastApplError
-
-    lib.IedConnection_installConnectionClosedHandler.argtypes = [
-        IedConnection,  # IedConnection self
-        IedConnection_ClosedHandler,  # IedConnectionClosedHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_installConnectionClosedHandler.restype = None
-
-    lib.IedConnection_installStateChangedHandler.argtypes = [
-        IedConnection,  # IedConnection self
-        IedConnection_StateChangedHandler,  # IedConnection_StateChangedHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_installStateChangedHandler.restype = None
-
+    (
+        "IedConnection_connect",
+        (
+            IedConnection,
+            _P_ERROR,
+            c_char_p,
+            c_int,
+        ),
+        None,
+    ),
+    ("IedConnection_abort", _SIG_CONNECTION_ERROR, None),
+    ("IedConnection_release", _SIG_CONNECTION_ERROR, None),
+    ("IedConnection_close", _SIG_CONNECTION, None),
+    ("IedConnection_getState", _SIG_CONNECTION, IedConnectionState),
+    ("IedConnection_getLastApplError", _SIG_CONNECTION, LastApplError),
+    (
+        "IedConnection_installConnectionClosedHandler",
+        (
+            IedConnection,  # IedConnection self
+            IedConnection_ClosedHandler,  # IedConnectionClosedHandler handler
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedConnection_installStateChangedHandler",
+        (
+            IedConnection,  # IedConnection self
+            IedConnection_StateChangedHandler,  # IedConnection_StateChangedHandler handler
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
     ####################################################
     # GOOSE services handling (MMS part)
     ####################################################
-
     ####################################################
     # ClientGooseControlBlock class
     ####################################################
-
-    lib.ClientGooseControlBlock_create.argtypes = [
-        c_char_p,  # const char* dataAttributeReference
-    ]
-    lib.ClientGooseControlBlock_create.restype = ClientGooseControlBlock
-
-    lib.ClientGooseControlBlock_destroy.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-    ]
-    lib.ClientGooseControlBlock_destroy.restype = None
-
-    lib.ClientGooseControlBlock_getGoEna.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-    ]
-    lib.ClientGooseControlBlock_getGoEna.restype = c_bool
-
-    lib.ClientGooseControlBlock_setGoEna.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-        c_bool,  # bool goEna
-    ]
-    lib.ClientGooseControlBlock_setGoEna.restype = None
-
-    lib.ClientGooseControlBlock_getGoID.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-    ]
-    lib.ClientGooseControlBlock_getGoID.restype = c_char_p
-
-    lib.ClientGooseControlBlock_setGoID.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-        c_char_p,  # const char* goID
-    ]
-    lib.ClientGooseControlBlock_setGoID.restype = None
-
-    lib.ClientGooseControlBlock_getDatSet.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-    ]
-    lib.ClientGooseControlBlock_getDatSet.restype = c_char_p
-
-    lib.ClientGooseControlBlock_setDatSet.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-        c_char_p,  # const char* datSet
-    ]
-    lib.ClientGooseControlBlock_setDatSet.restype = None
-
-    lib.ClientGooseControlBlock_getConfRev.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-    ]
-    lib.ClientGooseControlBlock_getConfRev.restype = c_uint32
-
-    lib.ClientGooseControlBlock_getNdsComm.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-    ]
-    lib.ClientGooseControlBlock_getNdsComm.restype = c_bool
-
-    lib.ClientGooseControlBlock_getMinTime.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-    ]
-    lib.ClientGooseControlBlock_getMinTime.restype = c_uint32
-
-    lib.ClientGooseControlBlock_getMaxTime.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-    ]
-    lib.ClientGooseControlBlock_getMaxTime.restype = c_uint32
-
-    lib.ClientGooseControlBlock_getFixedOffs.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-    ]
-    lib.ClientGooseControlBlock_getFixedOffs.restype = c_bool
-
-    lib.ClientGooseControlBlock_getDstAddress.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-    ]
-    lib.ClientGooseControlBlock_getDstAddress.restype = PhyComAddress
-
-    lib.ClientGooseControlBlock_setDstAddress.argtypes = [
-        ClientGooseControlBlock,  # ClientGooseControlBlock self
-        PhyComAddress,  # PhyComAddress value
-    ]
-    lib.ClientGooseControlBlock_setDstAddress.restype = None
-
+    (
+        "ClientGooseControlBlock_create",
+        (c_char_p,),  # const char* dataAttributeReference
+        ClientGooseControlBlock,
+    ),
+    ("ClientGooseControlBlock_destroy", _SIG_GOCB, None),
+    ("ClientGooseControlBlock_getGoEna", _SIG_GOCB, c_bool),
+    (
+        "ClientGooseControlBlock_setGoEna",
+        (
+            ClientGooseControlBlock,  # ClientGooseControlBlock self
+            c_bool,  # bool goEna
+        ),
+        None,
+    ),
+    ("ClientGooseControlBlock_getGoID", _SIG_GOCB, c_char_p),
+    (
+        "ClientGooseControlBlock_setGoID",
+        (
+            ClientGooseControlBlock,  # ClientGooseControlBlock self
+            c_char_p,  # const char* goID
+        ),
+        None,
+    ),
+    ("ClientGooseControlBlock_getDatSet", _SIG_GOCB, c_char_p),
+    (
+        "ClientGooseControlBlock_setDatSet",
+        (
+            ClientGooseControlBlock,  # ClientGooseControlBlock self
+            c_char_p,  # const char* datSet
+        ),
+        None,
+    ),
+    ("ClientGooseControlBlock_getConfRev", _SIG_GOCB, c_uint32),
+    ("ClientGooseControlBlock_getNdsComm", _SIG_GOCB, c_bool),
+    ("ClientGooseControlBlock_getMinTime", _SIG_GOCB, c_uint32),
+    ("ClientGooseControlBlock_getMaxTime", _SIG_GOCB, c_uint32),
+    ("ClientGooseControlBlock_getFixedOffs", _SIG_GOCB, c_bool),
+    ("ClientGooseControlBlock_getDstAddress", _SIG_GOCB, PhyComAddress),
+    (
+        "ClientGooseControlBlock_setDstAddress",
+        (
+            ClientGooseControlBlock,  # ClientGooseControlBlock self
+            PhyComAddress,  # PhyComAddress value
+        ),
+        None,
+    ),
     ####################################################
     # GOOSE services (access to GOOSE Control Blocks (GoCB))
     ####################################################
-
-    lib.IedConnection_getGoCBValues.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* goCBReference
-        ClientGooseControlBlock,  # ClientGooseControlBlock updateGoCB
-    ]
-    lib.IedConnection_getGoCBValues.restype = ClientGooseControlBlock
-
-    lib.IedConnection_getGoCBValuesAsync.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* goCBReference
-        ClientGooseControlBlock,  # ClientGooseControlBlock updateGoCB
-        IedConnection_GetGoCBValuesHandler,  # IedConnection_GetGoCBValuesHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_getGoCBValuesAsync.restype = ClientGooseControlBlock
-
-    lib.IedConnection_setGoCBValues.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        ClientGooseControlBlock,  # ClientGooseControlBlock updateGoCB
-        c_uint32,  # uint32_t parametersMask,
-        c_bool,  # bool singleRequest
-    ]
-    lib.IedConnection_setGoCBValues.restype = None
-
-    lib.IedConnection_setGoCBValuesAsync.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        ClientGooseControlBlock,  # ClientGooseControlBlock updateGoCB
-        c_uint32,  # uint32_t parametersMask,
-        c_bool,  # bool singleRequest
-        IedConnection_GenericServiceHandler,  # IedConnection_GenericServiceHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_setGoCBValuesAsync.restype = None
-
+    (
+        "IedConnection_getGoCBValues",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* goCBReference
+            ClientGooseControlBlock,  # ClientGooseControlBlock updateGoCB
+        ),
+        ClientGooseControlBlock,
+    ),
+    (
+        "IedConnection_getGoCBValuesAsync",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* goCBReference
+            ClientGooseControlBlock,  # ClientGooseControlBlock updateGoCB
+            IedConnection_GetGoCBValuesHandler,  # IedConnection_GetGoCBValuesHandler handler
+            c_void_p,  # void* parameter
+        ),
+        ClientGooseControlBlock,
+    ),
+    (
+        "IedConnection_setGoCBValues",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            ClientGooseControlBlock,  # ClientGooseControlBlock updateGoCB
+            c_uint32,  # uint32_t parametersMask,
+            c_bool,  # bool singleRequest
+        ),
+        None,
+    ),
+    (
+        "IedConnection_setGoCBValuesAsync",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            ClientGooseControlBlock,  # ClientGooseControlBlock updateGoCB
+            c_uint32,  # uint32_t parametersMask,
+            c_bool,  # bool singleRequest
+            IedConnection_GenericServiceHandler,  # IedConnection_GenericServiceHandler handler
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
     ####################################################
     # Data model access services
     ####################################################
-
-    lib.IedConnection_readObject.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,  # dataAttributeReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-    ]
-    lib.IedConnection_readObject.restype = POINTER(MmsValue)
-
-    lib.IedConnection_readObjectAsync.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objRef
-        FunctionalConstraint,  # FunctionalConstraint fc
-        IedConnection_ReadObjectHandler,  # IedConnection_ReadObjectHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_readObjectAsync.restype = c_uint32
-
-    lib.IedConnection_writeObject.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* dataAttributeReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-        POINTER(MmsValue),  # MmsValue* value
-    ]
-    lib.IedConnection_writeObject.restype = None
-
-    lib.IedConnection_writeObjectAsync.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-        POINTER(MmsValue),  # MmsValue* value
-        IedConnection_GenericServiceHandler,  # IedConnection_GenericServiceHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_writeObjectAsync.restype = c_uint32
-
-    lib.IedConnection_readBooleanValue.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-    ]
-    lib.IedConnection_readBooleanValue.restype = c_bool
-
-    lib.IedConnection_readFloatValue.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-    ]
-    lib.IedConnection_readFloatValue.restype = c_float
-
-    lib.IedConnection_readStringValue.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-    ]
-    lib.IedConnection_readStringValue.restype = c_char_p
-
-    lib.IedConnection_readInt32Value.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-    ]
-    lib.IedConnection_readInt32Value.restype = c_int32
-
-    lib.IedConnection_readInt64Value.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-    ]
-    lib.IedConnection_readInt64Value.restype = c_int64
-
-    lib.IedConnection_readUnsigned32Value.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-    ]
-    lib.IedConnection_readUnsigned32Value.restype = c_uint32
-
-    lib.IedConnection_readTimestampValue.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-        POINTER(Timestamp),  # Timestamp* timeStamp
-    ]
-    lib.IedConnection_readTimestampValue.restype = POINTER(Timestamp)
-
-    lib.IedConnection_readQualityValue.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-    ]
-    lib.IedConnection_readQualityValue.restype = Quality
-
-    lib.IedConnection_writeBooleanValue.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-        c_bool,  # bool value
-    ]
-    lib.IedConnection_writeBooleanValue.restype = None
-
-    lib.IedConnection_writeInt32Value.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-        c_int32,  # int32_t value
-    ]
-    lib.IedConnection_writeInt32Value.restype = None
-
-    lib.IedConnection_writeUnsigned32Value.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-        c_uint32,  # uint32_t value
-    ]
-    lib.IedConnection_writeUnsigned32Value.restype = None
-
-    lib.IedConnection_writeFloatValue.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-        c_float,  # float value
-    ]
-    lib.IedConnection_writeFloatValue.restype = None
-
-    lib.IedConnection_writeVisibleStringValue.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-        c_char_p,  # char* value
-    ]
-    lib.IedConnection_writeVisibleStringValue.restype = None
-
-    lib.IedConnection_writeOctetString.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* objectReference
-        FunctionalConstraint,  # FunctionalConstraint fc
-        c_char_p,  # uint8_t* value
-        c_int,  # int valueLength
-    ]
-    lib.IedConnection_writeOctetString.restype = None
-
+    ("IedConnection_readObject", _SIG_READ, _P_MMS_VALUE),
+    (
+        "IedConnection_readObjectAsync",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* objRef
+            FunctionalConstraint,  # FunctionalConstraint fc
+            IedConnection_ReadObjectHandler,  # IedConnection_ReadObjectHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    (
+        "IedConnection_writeObject",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* dataAttributeReference
+            FunctionalConstraint,  # FunctionalConstraint fc
+            _P_MMS_VALUE,  # MmsValue* value
+        ),
+        None,
+    ),
+    (
+        "IedConnection_writeObjectAsync",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* objectReference
+            FunctionalConstraint,  # FunctionalConstraint fc
+            _P_MMS_VALUE,  # MmsValue* value
+            IedConnection_GenericServiceHandler,  # IedConnection_GenericServiceHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    ("IedConnection_readBooleanValue", _SIG_READ, c_bool),
+    ("IedConnection_readFloatValue", _SIG_READ, c_float),
+    ("IedConnection_readStringValue", _SIG_READ, c_char_p),
+    ("IedConnection_readInt32Value", _SIG_READ, c_int32),
+    ("IedConnection_readInt64Value", _SIG_READ, c_int64),
+    ("IedConnection_readUnsigned32Value", _SIG_READ, c_uint32),
+    (
+        "IedConnection_readTimestampValue",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* objectReference
+            FunctionalConstraint,  # FunctionalConstraint fc
+            _P_TIMESTAMP,  # Timestamp* timeStamp
+        ),
+        _P_TIMESTAMP,
+    ),
+    ("IedConnection_readQualityValue", _SIG_READ, Quality),
+    (
+        "IedConnection_writeBooleanValue",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* objectReference
+            FunctionalConstraint,  # FunctionalConstraint fc
+            c_bool,  # bool value
+        ),
+        None,
+    ),
+    (
+        "IedConnection_writeInt32Value",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* objectReference
+            FunctionalConstraint,  # FunctionalConstraint fc
+            c_int32,  # int32_t value
+        ),
+        None,
+    ),
+    (
+        "IedConnection_writeUnsigned32Value",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* objectReference
+            FunctionalConstraint,  # FunctionalConstraint fc
+            c_uint32,  # uint32_t value
+        ),
+        None,
+    ),
+    (
+        "IedConnection_writeFloatValue",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* objectReference
+            FunctionalConstraint,  # FunctionalConstraint fc
+            c_float,  # float value
+        ),
+        None,
+    ),
+    (
+        "IedConnection_writeVisibleStringValue",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* objectReference
+            FunctionalConstraint,  # FunctionalConstraint fc
+            c_char_p,  # char* value
+        ),
+        None,
+    ),
+    (
+        "IedConnection_writeOctetString",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* objectReference
+            FunctionalConstraint,  # FunctionalConstraint fc
+            _P_UINT8,  # uint8_t* value
+            c_int,  # int valueLength
+        ),
+        None,
+    ),
     ####################################################
     # Reporting services
     ####################################################
-
-    lib.IedConnection_getRCBValues.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,
+    (
+        "IedConnection_getRCBValues",
+        (
+            IedConnection,
+            _P_ERROR,
+            c_char_p,
+            ClientReportControlBlock,
+        ),
         ClientReportControlBlock,
-    ]
-    lib.IedConnection_getRCBValues.restype = ClientReportControlBlock
-
-    lib.IedConnection_setRCBValues.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        ClientReportControlBlock,  # ClientReportControlBlock rcb
-        c_uint32,  # uint32_t parametersMask
-        c_bool,  # bool singleRequest
-    ]
-    lib.IedConnection_setRCBValues.restype = None
-
-    lib.IedConnection_installReportHandler.argtypes = [
-        IedConnection,  # IedConnection self
-        c_char_p,  # const char* rcbReference
-        c_char_p,  #  const char* rptId
-        ReportCallbackFunction,  # ReportCallbackFunction handler
-        c_void_p,  # void* handlerParameter
-    ]
-    lib.IedConnection_installReportHandler.restype = None
-
-    lib.IedConnection_uninstallReportHandler.argtypes = [
-        IedConnection,  # IedConnection self
-        c_char_p,  # const char* rcbReference
-    ]
-    lib.IedConnection_uninstallReportHandler.restype = None
-
-    lib.IedConnection_triggerGIReport.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,
-    ]
-    lib.IedConnection_triggerGIReport.restype = None
-
+    ),
+    (
+        "IedConnection_setRCBValues",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            ClientReportControlBlock,  # ClientReportControlBlock rcb
+            c_uint32,  # uint32_t parametersMask
+            c_bool,  # bool singleRequest
+        ),
+        None,
+    ),
+    (
+        "IedConnection_installReportHandler",
+        (
+            IedConnection,  # IedConnection self
+            c_char_p,  # const char* rcbReference
+            c_char_p,  # const char* rptId
+            ReportCallbackFunction,  # ReportCallbackFunction handler
+            c_void_p,  # void* handlerParameter
+        ),
+        None,
+    ),
+    (
+        "IedConnection_uninstallReportHandler",
+        (
+            IedConnection,  # IedConnection self
+            c_char_p,  # const char* rcbReference
+        ),
+        None,
+    ),
+    ("IedConnection_triggerGIReport", _SIG_REFERENCE, None),
     ####################################################
     # Access to received reports
     ####################################################
-
-    lib.ClientReport_getDataSetName.argtypes = [ClientReport]
-    lib.ClientReport_getDataSetName.restype = c_char_p
-
-    lib.ClientReport_getDataSetValues.argtypes = [ClientReport]
-    lib.ClientReport_getDataSetValues.restype = POINTER(MmsValue)
-
-    lib.ClientReport_getRcbReference.argtypes = [ClientReport]
-    lib.ClientReport_getRcbReference.restype = c_char_p
-
-    lib.ClientReport_getRptId.argtypes = [ClientReport]
-    lib.ClientReport_getRptId.restype = c_char_p
-
-    lib.ClientReport_getReasonForInclusion.argtypes = [ClientReport, c_int]
-    lib.ClientReport_getReasonForInclusion.restype = ReasonForInclusion
-
-    lib.ClientReport_getEntryId.argtypes = [ClientReport]
-    lib.ClientReport_getEntryId.restype = POINTER(MmsValue)
-
-    lib.ClientReport_hasTimestamp.argtypes = [ClientReport]
-    lib.ClientReport_hasTimestamp.restype = c_bool
-
-    lib.ClientReport_hasSeqNum.argtypes = [ClientReport]
-    lib.ClientReport_hasSeqNum.restype = c_bool
-
-    lib.ClientReport_getSeqNum.argtypes = [ClientReport]
-    lib.ClientReport_getSeqNum.restype = c_uint16
-
-    lib.ClientReport_hasDataSetName.argtypes = [ClientReport]
-    lib.ClientReport_hasDataSetName.restype = c_bool
-
-    lib.ClientReport_hasReasonForInclusion.argtypes = [ClientReport]
-    lib.ClientReport_hasReasonForInclusion.restype = c_bool
-
-    lib.ClientReport_hasConfRev.argtypes = [ClientReport]
-    lib.ClientReport_hasConfRev.restype = c_bool
-
-    lib.ClientReport_getConfRev.argtypes = [ClientReport]
-    lib.ClientReport_getConfRev.restype = c_uint32
-
-    lib.ClientReport_hasBufOvfl.argtypes = [ClientReport]
-    lib.ClientReport_hasBufOvfl.restype = c_bool
-
-    lib.ClientReport_getBufOvfl.argtypes = [ClientReport]
-    lib.ClientReport_getBufOvfl.restype = c_bool
-
-    lib.ClientReport_hasDataReference.argtypes = [ClientReport]
-    lib.ClientReport_hasDataReference.restype = c_bool
-
-    lib.ClientReport_getDataReference.argtypes = [
-        ClientReport,  # ClientReport self
-        c_int,  # int elementIndex
-    ]
-    lib.ClientReport_getDataReference.restype = c_char_p
-
-    lib.ClientReport_getTimestamp.argtypes = [ClientReport]
-    lib.ClientReport_getTimestamp.restype = c_uint64
-
-    lib.ClientReport_hasSubSeqNum.argtypes = [ClientReport]
-    lib.ClientReport_hasSubSeqNum.restype = c_bool
-
-    lib.ClientReport_getSubSeqNum.argtypes = [ClientReport]
-    lib.ClientReport_getSubSeqNum.restype = c_uint16
-
-    lib.ClientReport_getMoreSeqmentsFollow.argtypes = [ClientReport]
-    lib.ClientReport_getMoreSeqmentsFollow.restype = c_bool
-
+    ("ClientReport_getDataSetName", _SIG_REPORT, c_char_p),
+    ("ClientReport_getDataSetValues", _SIG_REPORT, _P_MMS_VALUE),
+    ("ClientReport_getRcbReference", _SIG_REPORT, c_char_p),
+    ("ClientReport_getRptId", _SIG_REPORT, c_char_p),
+    (
+        "ClientReport_getReasonForInclusion",
+        (
+            ClientReport,
+            c_int,
+        ),
+        ReasonForInclusion,
+    ),
+    ("ClientReport_getEntryId", _SIG_REPORT, _P_MMS_VALUE),
+    ("ClientReport_hasTimestamp", _SIG_REPORT, c_bool),
+    ("ClientReport_hasSeqNum", _SIG_REPORT, c_bool),
+    ("ClientReport_getSeqNum", _SIG_REPORT, c_uint16),
+    ("ClientReport_hasDataSetName", _SIG_REPORT, c_bool),
+    ("ClientReport_hasReasonForInclusion", _SIG_REPORT, c_bool),
+    ("ClientReport_hasConfRev", _SIG_REPORT, c_bool),
+    ("ClientReport_getConfRev", _SIG_REPORT, c_uint32),
+    ("ClientReport_hasBufOvfl", _SIG_REPORT, c_bool),
+    ("ClientReport_getBufOvfl", _SIG_REPORT, c_bool),
+    ("ClientReport_hasDataReference", _SIG_REPORT, c_bool),
+    (
+        "ClientReport_getDataReference",
+        (
+            ClientReport,  # ClientReport self
+            c_int,  # int elementIndex
+        ),
+        c_char_p,
+    ),
+    ("ClientReport_getTimestamp", _SIG_REPORT, c_uint64),
+    ("ClientReport_hasSubSeqNum", _SIG_REPORT, c_bool),
+    ("ClientReport_getSubSeqNum", _SIG_REPORT, c_uint16),
+    ("ClientReport_getMoreSeqmentsFollow", _SIG_REPORT, c_bool),
     ####################################################
     # ClientReportControlBlock access class
     ####################################################
-
-    lib.ClientReportControlBlock_create.argtypes = [c_char_p]
-    lib.ClientReportControlBlock_create.restype = ClientReportControlBlock
-
-    lib.ClientReportControlBlock_destroy.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_destroy.restype = None
-
-    lib.ClientReportControlBlock_getObjectReference.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getObjectReference.restype = c_char_p
-
-    lib.ClientReportControlBlock_isBuffered.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_isBuffered.restype = c_bool
-
-    lib.ClientReportControlBlock_getRptId.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getRptId.restype = c_char_p
-
-    lib.ClientReportControlBlock_setRptId.argtypes = [
-        ClientReportControlBlock,
-        c_char_p,
-    ]
-    lib.ClientReportControlBlock_setRptId.restype = None
-
-    lib.ClientReportControlBlock_getRptEna.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getRptEna.restype = c_bool
-
-    lib.ClientReportControlBlock_setRptEna.argtypes = [
-        ClientReportControlBlock,
-        c_bool,
-    ]
-    lib.ClientReportControlBlock_setRptEna.restype = None
-
-    lib.ClientReportControlBlock_getResv.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getResv.restype = c_bool
-
-    lib.ClientReportControlBlock_setResv.argtypes = [
-        ClientReportControlBlock,
-        c_bool,
-    ]
-    lib.ClientReportControlBlock_setResv.restype = None
-
-    lib.ClientReportControlBlock_getDataSetReference.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getDataSetReference.restype = c_char_p
-
-    lib.ClientReportControlBlock_setDataSetReference.argtypes = [
-        ClientReportControlBlock,
-        c_char_p,
-    ]
-    lib.ClientReportControlBlock_setDataSetReference.restype = None
-
-    lib.ClientReportControlBlock_getConfRev.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getConfRev.restype = c_uint32
-
-    lib.ClientReportControlBlock_getOptFlds.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getOptFlds.restype = c_int
-
-    lib.ClientReportControlBlock_setOptFlds.argtypes = [
-        ClientReportControlBlock,
-        c_int,
-    ]
-    lib.ClientReportControlBlock_setOptFlds.restype = None
-
-    lib.ClientReportControlBlock_getBufTm.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getBufTm.restype = c_uint32
-
-    lib.ClientReportControlBlock_setBufTm.argtypes = [
-        ClientReportControlBlock,
-        c_uint32,
-    ]
-    lib.ClientReportControlBlock_setBufTm.restype = None
-
-    lib.ClientReportControlBlock_getSqNum.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getSqNum.restype = c_uint16
-
-    lib.ClientReportControlBlock_getTrgOps.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getTrgOps.restype = c_int
-
-    lib.ClientReportControlBlock_setTrgOps.argtypes = [
-        ClientReportControlBlock,
-        c_int,
-    ]
-    lib.ClientReportControlBlock_setTrgOps.restype = None
-
-    lib.ClientReportControlBlock_getIntgPd.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getIntgPd.restype = c_uint32
-
-    lib.ClientReportControlBlock_setIntgPd.argtypes = [
-        ClientReportControlBlock,
-        c_uint32,
-    ]
-    lib.ClientReportControlBlock_setIntgPd.restype = None
-
-    lib.ClientReportControlBlock_getGI.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getGI.restype = c_bool
-
-    lib.ClientReportControlBlock_setGI.argtypes = [ClientReportControlBlock, c_bool]
-    lib.ClientReportControlBlock_setGI.restype = None
-
-    lib.ClientReportControlBlock_getPurgeBuf.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getPurgeBuf.restype = c_bool
-
-    lib.ClientReportControlBlock_setPurgeBuf.argtypes = [
-        ClientReportControlBlock,
-        c_bool,
-    ]
-    lib.ClientReportControlBlock_setPurgeBuf.restype = None
-
-    lib.ClientReportControlBlock_hasResvTms.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_hasResvTms.restype = c_bool
-
-    lib.ClientReportControlBlock_getResvTms.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getResvTms.restype = c_uint16
-
-    lib.ClientReportControlBlock_setResvTms.argtypes = [
-        ClientReportControlBlock,
-        c_uint16,
-    ]
-    lib.ClientReportControlBlock_setResvTms.restype = None
-
-    lib.ClientReportControlBlock_getEntryId.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getEntryId.restype = POINTER(MmsValue)
-
-    lib.ClientReportControlBlock_setEntryId.argtypes = [
-        ClientReportControlBlock,
-        c_void_p,
-    ]
-    lib.ClientReportControlBlock_setEntryId.restype = None
-
-    lib.ClientReportControlBlock_getEntryTime.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getEntryTime.restype = c_uint64
-
-    lib.ClientReportControlBlock_getOwner.argtypes = [ClientReportControlBlock]
-    lib.ClientReportControlBlock_getOwner.restype = POINTER(MmsValue)
-
+    ("ClientReportControlBlock_create", (c_char_p,), ClientReportControlBlock),
+    ("ClientReportControlBlock_destroy", _SIG_RCB, None),
+    ("ClientReportControlBlock_getObjectReference", _SIG_RCB, c_char_p),
+    ("ClientReportControlBlock_isBuffered", _SIG_RCB, c_bool),
+    ("ClientReportControlBlock_getRptId", _SIG_RCB, c_char_p),
+    (
+        "ClientReportControlBlock_setRptId",
+        (
+            ClientReportControlBlock,
+            c_char_p,
+        ),
+        None,
+    ),
+    ("ClientReportControlBlock_getRptEna", _SIG_RCB, c_bool),
+    ("ClientReportControlBlock_setRptEna", _SIG_RCB_BOOL, None),
+    ("ClientReportControlBlock_getResv", _SIG_RCB, c_bool),
+    ("ClientReportControlBlock_setResv", _SIG_RCB_BOOL, None),
+    ("ClientReportControlBlock_getDataSetReference", _SIG_RCB, c_char_p),
+    (
+        "ClientReportControlBlock_setDataSetReference",
+        (
+            ClientReportControlBlock,
+            c_char_p,
+        ),
+        None,
+    ),
+    ("ClientReportControlBlock_getConfRev", _SIG_RCB, c_uint32),
+    ("ClientReportControlBlock_getOptFlds", _SIG_RCB, c_int),
+    (
+        "ClientReportControlBlock_setOptFlds",
+        (
+            ClientReportControlBlock,
+            c_int,
+        ),
+        None,
+    ),
+    ("ClientReportControlBlock_getBufTm", _SIG_RCB, c_uint32),
+    (
+        "ClientReportControlBlock_setBufTm",
+        (
+            ClientReportControlBlock,
+            c_uint32,
+        ),
+        None,
+    ),
+    ("ClientReportControlBlock_getSqNum", _SIG_RCB, c_uint16),
+    ("ClientReportControlBlock_getTrgOps", _SIG_RCB, c_int),
+    (
+        "ClientReportControlBlock_setTrgOps",
+        (
+            ClientReportControlBlock,
+            c_int,
+        ),
+        None,
+    ),
+    ("ClientReportControlBlock_getIntgPd", _SIG_RCB, c_uint32),
+    (
+        "ClientReportControlBlock_setIntgPd",
+        (
+            ClientReportControlBlock,
+            c_uint32,
+        ),
+        None,
+    ),
+    ("ClientReportControlBlock_getGI", _SIG_RCB, c_bool),
+    ("ClientReportControlBlock_setGI", _SIG_RCB_BOOL, None),
+    ("ClientReportControlBlock_getPurgeBuf", _SIG_RCB, c_bool),
+    ("ClientReportControlBlock_setPurgeBuf", _SIG_RCB_BOOL, None),
+    ("ClientReportControlBlock_hasResvTms", _SIG_RCB, c_bool),
+    ("ClientReportControlBlock_getResvTms", _SIG_RCB, c_uint16),
+    (
+        "ClientReportControlBlock_setResvTms",
+        (
+            ClientReportControlBlock,
+            c_uint16,
+        ),
+        None,
+    ),
+    ("ClientReportControlBlock_getEntryId", _SIG_RCB, _P_MMS_VALUE),
+    (
+        "ClientReportControlBlock_setEntryId",
+        (
+            ClientReportControlBlock,
+            c_void_p,
+        ),
+        None,
+    ),
+    ("ClientReportControlBlock_getEntryTime", _SIG_RCB, c_uint64),
+    ("ClientReportControlBlock_getOwner", _SIG_RCB, _P_MMS_VALUE),
     ####################################################
     # Data set handling
     ####################################################
-
-    lib.IedConnection_readDataSetValues.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,
+    (
+        "IedConnection_readDataSetValues",
+        (
+            IedConnection,
+            _P_ERROR,
+            c_char_p,
+            ClientDataSet,
+        ),
         ClientDataSet,
-    ]
-    lib.IedConnection_readDataSetValues.restype = ClientDataSet
-
-    lib.IedConnection_createDataSet.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* dataSetReference
-        LinkedList,  # LinkedList /* char* */ dataSetElements
-    ]
-    lib.IedConnection_createDataSet.restype = None
-
-    lib.IedConnection_deleteDataSet.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* dataSetReference
-    ]
-    lib.IedConnection_deleteDataSet.restype = c_bool
-
-    lib.IedConnection_getDataSetDirectory.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* dataSetReference
-        POINTER(c_bool),  # bool* isDeletable
-    ]
-    lib.IedConnection_getDataSetDirectory.restype = LinkedList
-
+    ),
+    (
+        "IedConnection_readDataSetValuesAsync",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* dataSetReference
+            ClientDataSet,  # ClientDataSet dataSet
+            IedConnection_ReadDataSetHandler,  # IedConnection_ReadDataSetHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    (
+        "IedConnection_createDataSet",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* dataSetReference
+            LinkedList,  # LinkedList /* char* */ dataSetElements
+        ),
+        None,
+    ),
+    ("IedConnection_deleteDataSet", _SIG_REFERENCE, c_bool),
+    (
+        "IedConnection_getDataSetDirectory",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* dataSetReference
+            _P_BOOL,  # bool* isDeletable
+        ),
+        LinkedList,
+    ),
     ####################################################
     # Data set object (local representation of a data set)
     ####################################################
-
-    lib.ClientDataSet_destroy.argtypes = [
-        ClientDataSet,  # ClientDataSet self
-    ]
-    lib.ClientDataSet_destroy.restype = None
-
-    lib.ClientDataSet_getValues.argtypes = [
-        ClientDataSet,  # ClientDataSet self
-    ]
-    lib.ClientDataSet_getValues.restype = POINTER(MmsValue)
-
-    lib.ClientDataSet_getReference.argtypes = [
-        ClientDataSet,  # ClientDataSet self
-    ]
-    lib.ClientDataSet_getReference.restype = c_char_p
-
-    lib.ClientDataSet_getDataSetSize.argtypes = [
-        ClientDataSet,  # ClientDataSet self
-    ]
-    lib.ClientDataSet_getDataSetSize.restype = c_int
-
+    ("ClientDataSet_destroy", _SIG_DATA_SET, None),
+    ("ClientDataSet_getValues", _SIG_DATA_SET, _P_MMS_VALUE),
+    ("ClientDataSet_getReference", _SIG_DATA_SET, c_char_p),
+    ("ClientDataSet_getDataSetSize", _SIG_DATA_SET, c_int),
     ####################################################
     # Control service functions
     ####################################################
-
-    lib.ControlObjectClient_create.argtypes = [
-        c_char_p,  # const char* objectReference
-        IedConnection,  # IedConnection connection
-    ]
-    lib.ControlObjectClient_create.restype = ControlObjectClient
-
-    lib.ControlObjectClient_createEx.argtypes = [
-        c_char_p,  # const char* objectReference
-        IedConnection,  # IedConnection connection
-        ControlModel,  # ControlModel ctlModel
-        MmsVariableSpecification,  # MmsVariableSpecification* controlObjectSpec
-    ]
-    lib.ControlObjectClient_createEx.restype = ControlObjectClient
-
-    lib.ControlObjectClient_destroy.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-    ]
-    lib.ControlObjectClient_destroy.restype = None
-
-    lib.ControlObjectClient_getObjectReference.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-    ]
-    lib.ControlObjectClient_getObjectReference.restype = c_char_p
-
-    lib.ControlObjectClient_getControlModel.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-    ]
-    lib.ControlObjectClient_getControlModel.restype = ControlModel
-
-    lib.ControlObjectClient_setControlModel.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        ControlModel,  # ControlModel ctlModel
-    ]
-    lib.ControlObjectClient_setControlModel.restype = None
-
-    lib.ControlObjectClient_changeServerControlModel.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        ControlModel,  # ControlModel ctlModel
-    ]
-    lib.ControlObjectClient_changeServerControlModel.restype = None
-
-    lib.ControlObjectClient_getCtlValType.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-    ]
-    lib.ControlObjectClient_getCtlValType.restype = MmsType
-
-    lib.ControlObjectClient_getLastError.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-    ]
-    lib.ControlObjectClient_getLastError.restype = IedClientError
-
-    lib.ControlObjectClient_operate.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        POINTER(MmsValue),  # MmsValue* ctlVal,
-        c_uint64,  # uint64_t operTime
-    ]
-    lib.ControlObjectClient_operate.restype = c_bool
-
-    lib.ControlObjectClient_select.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-    ]
-    lib.ControlObjectClient_select.restype = c_bool
-
-    lib.ControlObjectClient_selectWithValue.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        POINTER(MmsValue),  # MmsValue* ctlVal,
-    ]
-    lib.ControlObjectClient_selectWithValue.restype = c_bool
-
-    lib.ControlObjectClient_cancel.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-    ]
-    lib.ControlObjectClient_cancel.restype = c_bool
-
-    lib.ControlObjectClient_operateAsync.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        POINTER(IedClientError),  # IedClientError* err,
-        POINTER(MmsValue),  # MmsValue* ctlVal,
-        c_uint64,  # uint64_t operTime
-        ControlObjectClient_ControlActionHandler,  # ControlObjectClient_ControlActionHandler handler,
-        c_void_p,  # void* parameter
-    ]
-    lib.ControlObjectClient_operateAsync.restype = c_uint32
-
-    lib.ControlObjectClient_selectAsync.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        POINTER(IedClientError),  # IedClientError* err,
-        ControlObjectClient_ControlActionHandler,  # ControlObjectClient_ControlActionHandler handler,
-        c_void_p,  # void* parameter
-    ]
-    lib.ControlObjectClient_selectAsync.restype = c_uint32
-
-    lib.ControlObjectClient_selectWithValueAsync.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        POINTER(IedClientError),  # IedClientError* err
-        POINTER(MmsValue),  # MmsValue* ctlVal
-        ControlObjectClient_ControlActionHandler,  # ControlObjectClient_ControlActionHandler handler
-        c_void_p,  #  void* parameter
-    ]
-    lib.ControlObjectClient_selectWithValueAsync.restype = c_uint32
-
-    lib.ControlObjectClient_cancelAsync.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        POINTER(IedClientError),  # IedClientError* err
-        ControlObjectClient_ControlActionHandler,  # ControlObjectClient_ControlActionHandler handler
-        c_void_p,  #  void* parameter
-    ]
-    lib.ControlObjectClient_cancelAsync.restype = c_uint32
-
-    lib.ControlObjectClient_getLastApplError.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-    ]
-    lib.ControlObjectClient_getLastApplError.restype = LastApplError
-
-    lib.ControlObjectClient_setTestMode.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        c_bool,  # bool value
-    ]
-    lib.ControlObjectClient_setTestMode.restype = None
-
-    lib.ControlObjectClient_setOrigin.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        c_char_p,  # const char* orIdent
-        c_int,  # int orCat
-    ]
-    lib.ControlObjectClient_setOrigin.restype = None
-
-    lib.ControlObjectClient_useConstantT.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        c_bool,  # bool useConstantT
-    ]
-    lib.ControlObjectClient_useConstantT.restype = None
-
-    lib.ControlObjectClient_setInterlockCheck.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        c_bool,  # bool value
-    ]
-    lib.ControlObjectClient_setInterlockCheck.restype = None
-
-    lib.ControlObjectClient_setSynchroCheck.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        c_bool,  # bool value
-    ]
-    lib.ControlObjectClient_setSynchroCheck.restype = None
-
-    lib.ControlObjectClient_setCommandTerminationHandler.argtypes = [
-        ControlObjectClient,  # ControlObjectClient self
-        CommandTerminationHandler,  # CommandTerminationHandler handler
-        c_void_p,  # void* handlerParameter
-    ]
-    lib.ControlObjectClient_setCommandTerminationHandler.restype = None
-
+    (
+        "ControlObjectClient_create",
+        (
+            c_char_p,  # const char* objectReference
+            IedConnection,  # IedConnection connection
+        ),
+        ControlObjectClient,
+    ),
+    (
+        "ControlObjectClient_createEx",
+        (
+            c_char_p,  # const char* objectReference
+            IedConnection,  # IedConnection connection
+            ControlModel,  # ControlModel ctlModel
+            MmsVariableSpecification,  # MmsVariableSpecification* controlObjectSpec
+        ),
+        ControlObjectClient,
+    ),
+    ("ControlObjectClient_destroy", _SIG_CONTROL, None),
+    ("ControlObjectClient_getObjectReference", _SIG_CONTROL, c_char_p),
+    ("ControlObjectClient_getControlModel", _SIG_CONTROL, ControlModel),
+    (
+        "ControlObjectClient_setControlModel",
+        (
+            ControlObjectClient,  # ControlObjectClient self
+            ControlModel,  # ControlModel ctlModel
+        ),
+        None,
+    ),
+    (
+        "ControlObjectClient_changeServerControlModel",
+        (
+            ControlObjectClient,  # ControlObjectClient self
+            ControlModel,  # ControlModel ctlModel
+        ),
+        None,
+    ),
+    ("ControlObjectClient_getCtlValType", _SIG_CONTROL, MmsType),
+    ("ControlObjectClient_getLastError", _SIG_CONTROL, IedClientError),
+    (
+        "ControlObjectClient_operate",
+        (
+            ControlObjectClient,  # ControlObjectClient self
+            _P_MMS_VALUE,  # MmsValue* ctlVal,
+            c_uint64,  # uint64_t operTime
+        ),
+        c_bool,
+    ),
+    ("ControlObjectClient_select", _SIG_CONTROL, c_bool),
+    (
+        "ControlObjectClient_selectWithValue",
+        (
+            ControlObjectClient,  # ControlObjectClient self
+            _P_MMS_VALUE,  # MmsValue* ctlVal,
+        ),
+        c_bool,
+    ),
+    ("ControlObjectClient_cancel", _SIG_CONTROL, c_bool),
+    (
+        "ControlObjectClient_operateAsync",
+        (
+            ControlObjectClient,  # ControlObjectClient self
+            _P_ERROR,  # IedClientError* err,
+            _P_MMS_VALUE,  # MmsValue* ctlVal,
+            c_uint64,  # uint64_t operTime
+            ControlObjectClient_ControlActionHandler,  # ControlObjectClient_ControlActionHandler handler,
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    (
+        "ControlObjectClient_selectAsync",
+        (
+            ControlObjectClient,  # ControlObjectClient self
+            _P_ERROR,  # IedClientError* err,
+            ControlObjectClient_ControlActionHandler,  # ControlObjectClient_ControlActionHandler handler,
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    (
+        "ControlObjectClient_selectWithValueAsync",
+        (
+            ControlObjectClient,  # ControlObjectClient self
+            _P_ERROR,  # IedClientError* err
+            _P_MMS_VALUE,  # MmsValue* ctlVal
+            ControlObjectClient_ControlActionHandler,  # ControlObjectClient_ControlActionHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    (
+        "ControlObjectClient_cancelAsync",
+        (
+            ControlObjectClient,  # ControlObjectClient self
+            _P_ERROR,  # IedClientError* err
+            ControlObjectClient_ControlActionHandler,  # ControlObjectClient_ControlActionHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    ("ControlObjectClient_getLastApplError", _SIG_CONTROL, LastApplError),
+    ("ControlObjectClient_setTestMode", _SIG_CONTROL_BOOL, None),
+    (
+        "ControlObjectClient_setOrigin",
+        (
+            ControlObjectClient,  # ControlObjectClient self
+            c_char_p,  # const char* orIdent
+            c_int,  # int orCat
+        ),
+        None,
+    ),
+    ("ControlObjectClient_useConstantT", _SIG_CONTROL_BOOL, None),
+    ("ControlObjectClient_setInterlockCheck", _SIG_CONTROL_BOOL, None),
+    ("ControlObjectClient_setSynchroCheck", _SIG_CONTROL_BOOL, None),
+    (
+        "ControlObjectClient_setCommandTerminationHandler",
+        (
+            ControlObjectClient,  # ControlObjectClient self
+            CommandTerminationHandler,  # CommandTerminationHandler handler
+            c_void_p,  # void* handlerParameter
+        ),
+        None,
+    ),
     ####################################################
     # Model discovery services
     ####################################################
-
-    lib.IedConnection_getServerDirectory.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_bool,
-    ]
-    lib.IedConnection_getServerDirectory.restype = LinkedList
-
-    lib.IedConnection_getLogicalDeviceDirectory.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,
-    ]
-    lib.IedConnection_getLogicalDeviceDirectory.restype = LinkedList
-
-    lib.IedConnection_getLogicalNodeVariables.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,
-    ]
-    lib.IedConnection_getLogicalNodeVariables.restype = LinkedList
-
-    lib.IedConnection_getLogicalNodeDirectory.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,
-        ACSIClass,
-    ]
-    lib.IedConnection_getLogicalNodeDirectory.restype = LinkedList
-
-    lib.IedConnection_getDataDirectory.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,
-    ]
-    lib.IedConnection_getDataDirectory.restype = LinkedList
-
-    lib.IedConnection_getDataDirectoryFC.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,
-    ]
-    lib.IedConnection_getDataDirectoryFC.restype = LinkedList
-
-    lib.IedConnection_getDataDirectoryByFC.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,
-        FunctionalConstraint,
-    ]
-    lib.IedConnection_getDataDirectoryByFC.restype = LinkedList
-
-    lib.IedConnection_getLogicalDeviceVariables.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,
-    ]
-    lib.IedConnection_getLogicalDeviceVariables.restype = LinkedList
-
-    lib.IedConnection_getLogicalDeviceDataSets.argtypes = [
-        IedConnection,
-        POINTER(IedClientError),
-        c_char_p,
-    ]
-    lib.IedConnection_getLogicalDeviceDataSets.restype = LinkedList
-
+    (
+        "IedConnection_getServerDirectory",
+        (
+            IedConnection,
+            _P_ERROR,
+            c_bool,
+        ),
+        LinkedList,
+    ),
+    ("IedConnection_getLogicalDeviceDirectory", _SIG_REFERENCE, LinkedList),
+    ("IedConnection_getLogicalNodeVariables", _SIG_REFERENCE, LinkedList),
+    (
+        "IedConnection_getLogicalNodeDirectory",
+        (
+            IedConnection,
+            _P_ERROR,
+            c_char_p,
+            ACSIClass,
+        ),
+        LinkedList,
+    ),
+    ("IedConnection_getDataDirectory", _SIG_REFERENCE, LinkedList),
+    ("IedConnection_getDataDirectoryFC", _SIG_REFERENCE, LinkedList),
+    ("IedConnection_getDataDirectoryByFC", _SIG_READ, LinkedList),
+    ("IedConnection_getLogicalDeviceVariables", _SIG_REFERENCE, LinkedList),
+    ("IedConnection_getLogicalDeviceDataSets", _SIG_REFERENCE, LinkedList),
     ####################################################
     # Asynchronous model discovery functions
     ####################################################
-
-    lib.IedConnection_getServerDirectoryAsync.argtypes = [
-        IedConnection,  # IedConnection self,
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* continueAfter
-        LinkedList,  # LinkedList result
-        IedConnection_GetNameListHandler,  # IedConnection_GetNameListHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_getServerDirectoryAsync.restype = c_uint32
-
-    lib.IedConnection_getLogicalDeviceVariablesAsync.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* ldName
-        c_char_p,  # const char* continueAfter
-        LinkedList,  # LinkedList result
-        IedConnection_GetNameListHandler,  # IedConnection_GetNameListHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_getLogicalDeviceVariablesAsync.restype = c_uint32
-
-    lib.IedConnection_getLogicalDeviceDataSetsAsync.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* ldName
-        c_char_p,  #  const char* continueAfter
-        LinkedList,  # LinkedList result
-        IedConnection_GetNameListHandler,  # IedConnection_GetNameListHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_getLogicalDeviceDataSetsAsync.restype = c_uint32
-
-    lib.IedConnection_getVariableSpecificationAsync.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* dataAttributeReference
-        FunctionalConstraint,  #  FunctionalConstraint fc
-        IedConnection_GetVariableSpecificationHandler,  # IedConnection_GetVariableSpecificationHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_getVariableSpecificationAsync.restype = c_uint32
-
-    lib.IedConnection_queryLogByTime.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* logReference
-        c_uint64,  #  uint64_t startTime
-        c_uint64,  # uint64_t endTime
-        POINTER(c_bool),  # bool* moreFollows
-    ]
-    lib.IedConnection_queryLogByTime.restype = LinkedList
-
-    lib.IedConnection_queryLogAfter.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* logReference
-        POINTER(MmsValue),  #  MmsValue* entryID
-        c_uint64,  # uint64_t timeStamp
-        POINTER(c_bool),  # bool* moreFollows
-    ]
-    lib.IedConnection_queryLogAfter.restype = LinkedList
-
-    lib.IedConnection_queryLogByTimeAsync.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* logReference
-        c_uint64,  #  uint64_t startTime
-        c_uint64,  # uint64_t endTime
-        IedConnection_QueryLogHandler,  # IedConnection_QueryLogHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_queryLogByTimeAsync.restype = c_uint32
-
-    lib.IedConnection_queryLogAfterAsync.argtypes = [
-        IedConnection,  # IedConnection self
-        POINTER(IedClientError),  # IedClientError* error
-        c_char_p,  # const char* logReference
-        POINTER(MmsValue),  #  MmsValue* entryID
-        c_uint64,  # uint64_t timeStamp
-        IedConnection_QueryLogHandler,  # IedConnection_QueryLogHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_queryLogAfterAsync.restype = c_uint32
-
+    (
+        "IedConnection_getServerDirectoryAsync",
+        (
+            IedConnection,  # IedConnection self,
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* continueAfter
+            LinkedList,  # LinkedList result
+            IedConnection_GetNameListHandler,  # IedConnection_GetNameListHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    (
+        "IedConnection_getLogicalDeviceVariablesAsync",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* ldName
+            c_char_p,  # const char* continueAfter
+            LinkedList,  # LinkedList result
+            IedConnection_GetNameListHandler,  # IedConnection_GetNameListHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    (
+        "IedConnection_getLogicalDeviceDataSetsAsync",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* ldName
+            c_char_p,  # const char* continueAfter
+            LinkedList,  # LinkedList result
+            IedConnection_GetNameListHandler,  # IedConnection_GetNameListHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    (
+        "IedConnection_getVariableSpecificationAsync",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* dataAttributeReference
+            FunctionalConstraint,  # FunctionalConstraint fc
+            IedConnection_GetVariableSpecificationHandler,  # IedConnection_GetVariableSpecificationHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    (
+        "IedConnection_queryLogByTime",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* logReference
+            c_uint64,  # uint64_t startTime
+            c_uint64,  # uint64_t endTime
+            _P_BOOL,  # bool* moreFollows
+        ),
+        LinkedList,
+    ),
+    (
+        "IedConnection_queryLogAfter",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* logReference
+            _P_MMS_VALUE,  # MmsValue* entryID
+            c_uint64,  # uint64_t timeStamp
+            _P_BOOL,  # bool* moreFollows
+        ),
+        LinkedList,
+    ),
+    (
+        "IedConnection_queryLogByTimeAsync",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* logReference
+            c_uint64,  # uint64_t startTime
+            c_uint64,  # uint64_t endTime
+            IedConnection_QueryLogHandler,  # IedConnection_QueryLogHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    (
+        "IedConnection_queryLogAfterAsync",
+        (
+            IedConnection,  # IedConnection self
+            _P_ERROR,  # IedClientError* error
+            c_char_p,  # const char* logReference
+            _P_MMS_VALUE,  # MmsValue* entryID
+            c_uint64,  # uint64_t timeStamp
+            IedConnection_QueryLogHandler,  # IedConnection_QueryLogHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
     ####################################################
     # File directory
     ####################################################
+    (
+        "FileDirectoryEntry_create",
+        (
+            c_char_p,  # const char* fileName
+            c_uint32,  # uint32_t fileSize
+            c_uint64,  # uint64_t lastModified
+        ),
+        FileDirectoryEntry,
+    ),
+    ("FileDirectoryEntry_destroy", _SIG_FILE_ENTRY, None),
+    ("FileDirectoryEntry_getFileName", _SIG_FILE_ENTRY, c_char_p),
+    ("FileDirectoryEntry_getFileSize", _SIG_FILE_ENTRY, c_uint32),
+    ("FileDirectoryEntry_getLastModified", _SIG_FILE_ENTRY, c_uint64),
+    ("IedConnection_getFileDirectory", _SIG_REFERENCE, LinkedList),
+    (
+        "IedConnection_getFileDirectoryEx",
+        (
+            IedConnection,  # IedConnection self,
+            _P_ERROR,  # IedClientError* error,
+            c_char_p,  # const char* directoryName
+            c_char_p,  # const char* continueAfter
+            _P_BOOL,  # bool* moreFollows
+        ),
+        LinkedList,
+    ),
+    (
+        "IedConnection_getFileDirectoryAsyncEx",
+        (
+            IedConnection,  # IedConnection self,
+            _P_ERROR,  # IedClientError* error,
+            c_char_p,  # const char* directoryName
+            c_char_p,  # const char* continueAfter
+            IedConnection_FileDirectoryEntryHandler,  # IedConnection_FileDirectoryEntryHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    (
+        "IedConnection_getFile",
+        (
+            IedConnection,  # IedConnection self,
+            _P_ERROR,  # IedClientError* error,
+            c_char_p,  # const char* fileName,
+            IedClientGetFileHandler,  # IedClientGetFileHandler handler,
+            c_void_p,  # void* handlerParameter
+        ),
+        c_uint32,
+    ),
+    (
+        "IedConnection_getFileAsync",
+        (
+            IedConnection,  # IedConnection self,
+            _P_ERROR,  # IedClientError* error,
+            c_char_p,  # const char* fileName,
+            IedConnection_GetFileAsyncHandler,  # IedConnection_GetFileAsyncHandler handler,
+            c_void_p,  # void* hanparameterdlerParameter
+        ),
+        c_uint32,
+    ),
+    (
+        "IedConnection_setFilestoreBasepath",
+        (
+            IedConnection,  # IedConnection self,
+            c_char_p,  # const char* basepath
+        ),
+        None,
+    ),
+    (
+        "IedConnection_setFile",
+        (
+            IedConnection,  # IedConnection self,
+            _P_ERROR,  # IedClientError* error,
+            c_char_p,  # const char* sourceFilename,
+            c_char_p,  # const char* destinationFilename
+        ),
+        None,
+    ),
+    (
+        "IedConnection_setFileAsync",
+        (
+            IedConnection,  # IedConnection self,
+            _P_ERROR,  # IedClientError* error,
+            c_char_p,  # const char* sourceFilename,
+            c_char_p,  # const char* destinationFilename
+            IedConnection_GenericServiceHandler,  # IedConnection_GenericServiceHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+    ("IedConnection_deleteFile", _SIG_REFERENCE, None),
+    (
+        "IedConnection_deleteFileAsync",
+        (
+            IedConnection,  # IedConnection self,
+            _P_ERROR,  # IedClientError* error,
+            c_char_p,  # const char* fileName,
+            IedConnection_GenericServiceHandler,  # IedConnection_GenericServiceHandler handler
+            c_void_p,  # void* parameter
+        ),
+        c_uint32,
+    ),
+)
 
-    lib.FileDirectoryEntry_create.argtypes = [
-        c_char_p,  # const char* fileName
-        c_uint32,  # uint32_t fileSize
-        c_uint64,  # uint64_t lastModified
-    ]
-    lib.FileDirectoryEntry_create.restype = FileDirectoryEntry
-
-    lib.FileDirectoryEntry_destroy.argtypes = [
-        FileDirectoryEntry,  # FileDirectoryEntry self
-    ]
-    lib.FileDirectoryEntry_destroy.restype = None
-
-    lib.FileDirectoryEntry_getFileName.argtypes = [
-        FileDirectoryEntry,  # FileDirectoryEntry self
-    ]
-    lib.FileDirectoryEntry_getFileName.restype = c_char_p
-
-    lib.FileDirectoryEntry_getFileSize.argtypes = [
-        FileDirectoryEntry,  # FileDirectoryEntry self
-    ]
-    lib.FileDirectoryEntry_getFileSize.restype = c_uint32
-
-    lib.FileDirectoryEntry_getLastModified.argtypes = [
-        FileDirectoryEntry,  # FileDirectoryEntry self
-    ]
-    lib.FileDirectoryEntry_getLastModified.restype = c_uint64
-
-    lib.IedConnection_getFileDirectory.argtypes = [
-        IedConnection,  # IedConnection self,
-        POINTER(IedClientError),  # IedClientError* error,
-        c_char_p,  # const char* directoryName
-    ]
-    lib.IedConnection_getFileDirectory.restype = LinkedList
-
-    lib.IedConnection_getFileDirectoryEx.argtypes = [
-        IedConnection,  # IedConnection self,
-        POINTER(IedClientError),  # IedClientError* error,
-        c_char_p,  # const char* directoryName
-        c_char_p,  # const char* continueAfter
-        POINTER(c_bool),  # bool* moreFollows
-    ]
-    lib.IedConnection_getFileDirectoryEx.restype = LinkedList
-
-    lib.IedConnection_getFileDirectoryAsyncEx.argtypes = [
-        IedConnection,  # IedConnection self,
-        POINTER(IedClientError),  # IedClientError* error,
-        c_char_p,  # const char* directoryName
-        c_char_p,  # const char* continueAfter
-        IedConnection_FileDirectoryEntryHandler,  # IedConnection_FileDirectoryEntryHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_getFileDirectoryAsyncEx.restype = c_uint32
-
-    lib.IedConnection_getFile.argtypes = [
-        IedConnection,  # IedConnection self,
-        POINTER(IedClientError),  # IedClientError* error,
-        c_char_p,  # const char* fileName,
-        IedClientGetFileHandler,  # IedClientGetFileHandler handler,
-        c_void_p,  # void* handlerParameter
-    ]
-    lib.IedConnection_getFile.restype = c_uint32
 
-    lib.IedConnection_getFileAsync.argtypes = [
-        IedConnection,  # IedConnection self,
-        POINTER(IedClientError),  # IedClientError* error,
-        c_char_p,  # const char* fileName,
-        IedConnection_GetFileAsyncHandler,  # IedConnection_GetFileAsyncHandler handler,
-        c_void_p,  # void* hanparameterdlerParameter
-    ]
-    lib.IedConnection_getFileAsync.restype = c_uint32
+# Getters of the client objects, they only read memory of the object and
+# never block, so there is no need to release the GIL while calling them
+_ACCESSORS = accessor_names(
+    _PROTOTYPES,
+    r"(ClientReport|ClientReportControlBlock|ClientGooseControlBlock|ClientDataSet"
+    r"|ControlObjectClient|FileDirectoryEntry)_(get|has|is)",
+)
 
-    lib.IedConnection_setFilestoreBasepath.argtypes = [
-        IedConnection,  # IedConnection self,
-        c_char_p,  # const char* basepath
-    ]
-    lib.IedConnection_setFilestoreBasepath.restype = None
 
-    lib.IedConnection_setFile.argtypes = [
-        IedConnection,  # IedConnection self,
-        POINTER(IedClientError),  # IedClientError* error,
-        c_char_p,  # const char* sourceFilename,
-        c_char_p,  # const char* destinationFilename
-    ]
-    lib.IedConnection_setFile.restype = None
+def setup_prototypes(lib: Library):
+    """Add prototypes definition to the lib
 
-    lib.IedConnection_setFileAsync.argtypes = [
-        IedConnection,  # IedConnection self,
-        POINTER(IedClientError),  # IedClientError* error,
-        c_char_p,  # const char* sourceFilename,
-        c_char_p,  # const char* destinationFilename
-        IedConnection_GenericServiceHandler,  # IedConnection_GenericServiceHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_setFileAsync.restype = c_uint32
+    The prototypes are applied when the function is used for the first
+    time, see :meth:`Library.defer_prototypes`. Apart from the accessors,
+    the functions release the GIL during the call, so a thread blocked on
+    a service of one connection, e.g. ``IedConnection_getFile``, does not
+    stop the threads handling other connections.
+    """
+    lib.defer_prototypes(_PROTOTYPES, accessors=_ACCESSORS)
 
-    lib.IedConnection_deleteFile.argtypes = [
-        IedConnection,  # IedConnection self,
-        POINTER(IedClientError),  # IedClientError* error,
-        c_char_p,  # const char* fileName,
-    ]
-    lib.IedConnection_deleteFile.restype = None
 
-    lib.IedConnection_deleteFileAsync.argtypes = [
-        IedConnection,  # IedConnection self,
-        POINTER(IedClientError),  # IedClientError* error,
-        c_char_p,  # const char* fileName,
-        IedConnection_GenericServiceHandler,  # IedConnection_GenericServiceHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedConnection_deleteFileAsync.restype = c_uint32
+# Expose the client functions of the loaded library as module attributes
+__getattr__ = module_getattr(globals(), _PROTOTYPES)
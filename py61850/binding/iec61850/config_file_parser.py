@@ -1,21 +1,28 @@
 """Module for C binding with iec61850/inc/iec61850_config_file_parser.h"""
 
-from ctypes import CDLL, POINTER, c_char_p, c_void_p
+from ctypes import POINTER, c_char_p, c_void_p
 
+from ..library import Library
 from .model import IedModel
 
 FileHandle = c_void_p
 
 
-def setup_prototypes(lib: CDLL):
-    """Add prototypes definition to the lib"""
+# (function name, argtypes, restype) of each prototype of the module
+_PROTOTYPES = (
+    (
+        "ConfigFileParser_createModelFromConfigFileEx",
+        (c_char_p,),  # const char* filename
+        POINTER(IedModel),
+    ),
+    (
+        "ConfigFileParser_createModelFromConfigFile",
+        (FileHandle,),  # FileHandle fileHandle
+        POINTER(IedModel),
+    ),
+)
 
-    lib.ConfigFileParser_createModelFromConfigFileEx.argtypes = [
-        c_char_p,  # const char* filename
-    ]
-    lib.ConfigFileParser_createModelFromConfigFileEx.restype = POINTER(IedModel)
 
-    lib.ConfigFileParser_createModelFromConfigFile.argtypes = [
-        FileHandle,  # FileHandle fileHandle
-    ]
-    lib.ConfigFileParser_createModelFromConfigFile.restype = POINTER(IedModel)
+def setup_prototypes(lib: Library):
+    """Add prototypes definition to the lib"""
+    lib.defer_prototypes(_PROTOTYPES)
@@ -1,7 +1,6 @@
 """Module for C binding with iec61850/inc/iec61850_dynamic_model.h"""
 
 from ctypes import (
-    CDLL,
     POINTER,
     c_bool,
     c_char_p,
@@ -10,8 +9,10 @@ from ctypes import (
     c_uint16,
     c_uint32,
     c_uint64,
+    c_void_p,
 )
 
+from ..library import Library, module_getattr
 from ..mms import MmsValue
 from .iec61850_common import FunctionalConstraint, PhyComAddress
 from .model import (
@@ -32,315 +33,414 @@ from .model import (
     SVControlBlock,
 )
 
+# Pointer types of the prototypes, resolved once
+_P_DATA_ATTRIBUTE = POINTER(DataAttribute)
+_P_DATA_OBJECT = POINTER(DataObject)
+_P_DATA_SET = POINTER(DataSet)
+_P_DATA_SET_ENTRY = POINTER(DataSetEntry)
+_P_GSE_CONTROL_BLOCK = POINTER(GSEControlBlock)
+_P_IED_MODEL = POINTER(IedModel)
+_P_LOG = POINTER(Log)
+_P_LOGICAL_DEVICE = POINTER(LogicalDevice)
+_P_LOGICAL_NODE = POINTER(LogicalNode)
+_P_LOG_CONTROL_BLOCK = POINTER(LogControlBlock)
+_P_MMS_VALUE = POINTER(MmsValue)
+_P_MODEL_NODE = POINTER(ModelNode)
+_P_PHY_COM_ADDRESS = POINTER(PhyComAddress)
+_P_REPORT_CONTROL_BLOCK = POINTER(ReportControlBlock)
+_P_SETTING_GROUP_CONTROL_BLOCK = POINTER(SettingGroupControlBlock)
+_P_SV_CONTROL_BLOCK = POINTER(SVControlBlock)
+_P_UINT8 = POINTER(c_uint8)
+
+
+# (function name, argtypes, restype) of each prototype of the module
+_PROTOTYPES = (
+    (
+        "IedModel_create",
+        (c_char_p,),  # const char* name
+        _P_IED_MODEL,
+    ),
+    (
+        "IedModel_setIedNameForDynamicModel",
+        (
+            _P_IED_MODEL,  # IedModel* self
+            c_char_p,  # const char* name
+        ),
+        None,
+    ),
+    (
+        "IedModel_destroy",
+        (_P_IED_MODEL,),  # IedModel* self
+        None,
+    ),
+    (
+        "LogicalDevice_create",
+        (
+            c_char_p,  # const char* inst
+            _P_IED_MODEL,  # IedModel* parent
+        ),
+        _P_LOGICAL_DEVICE,
+    ),
+    (
+        "LogicalDevice_createEx",
+        (
+            c_char_p,  # const char* inst
+            _P_IED_MODEL,  # IedModel* parent
+            c_char_p,  # const char* ldName
+        ),
+        _P_LOGICAL_DEVICE,
+    ),
+    (
+        "LogicalNode_create",
+        (
+            c_char_p,  # const char* name
+            _P_LOGICAL_DEVICE,  # LogicalDevice* parent
+        ),
+        _P_LOGICAL_NODE,
+    ),
+    (
+        "DataObject_create",
+        (
+            c_char_p,  # const char* name
+            _P_MODEL_NODE,  # ModelNode* name
+            c_int,  # int arrayElements
+        ),
+        _P_DATA_OBJECT,
+    ),
+    (
+        "DataAttribute_create",
+        (
+            c_char_p,  # const char* name
+            _P_MODEL_NODE,  # ModelNode* parent
+            DataAttributeType,  # DataAttributeType type
+            FunctionalConstraint,  # FunctionalConstraint fc
+            c_uint8,  # uint8_t triggerOptions
+            c_int,  #  int arrayElements
+            c_uint32,  #  uint32_t sAddr
+        ),
+        _P_DATA_ATTRIBUTE,
+    ),
+    (
+        "DataAttribute_getType",
+        (_P_DATA_ATTRIBUTE,),  # DataAttribute* self
+        DataAttributeType,
+    ),
+    (
+        "DataAttribute_getFC",
+        (_P_DATA_ATTRIBUTE,),  # DataAttribute* self
+        FunctionalConstraint,
+    ),
+    (
+        "DataAttribute_getTrgOps",
+        (_P_DATA_ATTRIBUTE,),  # DataAttribute* self
+        c_uint8,
+    ),
+    (
+        "DataAttribute_setValue",
+        # Declared with void pointers so the address of the attribute can be
+        # given as an int, without building a _P_DATA_ATTRIBUTE
+        (
+            c_void_p,  # DataAttribute* self
+            c_void_p,  # MmsValue* value
+        ),
+        None,
+    ),
+    (
+        "ReportControlBlock_create",
+        (
+            c_char_p,  # const char* name,
+            _P_LOGICAL_NODE,  # LogicalNode* parent,
+            c_char_p,  # const char* rptId,
+            c_bool,  #  bool isBuffered,
+            c_char_p,  # const char* dataSetName,
+            c_uint32,  #  uint32_t confRef,
+            c_uint8,  #  uint8_t trgOps,
+            c_uint8,  # uint8_t options,
+            c_uint32,  #  uint32_t bufTm,
+            c_uint32,  # uint32_t intgPd
+        ),
+        _P_REPORT_CONTROL_BLOCK,
+    ),
+    (
+        "ReportControlBlock_setPreconfiguredClient",
+        (
+            _P_REPORT_CONTROL_BLOCK,  # ReportControlBlock* self
+            c_uint8,  # uint8_t clientType
+            _P_UINT8,  # const uint8_t* clientAddress
+        ),
+        None,
+    ),
+    (
+        "ReportControlBlock_getName",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_char_p,
+    ),
+    (
+        "ReportControlBlock_isBuffered",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_bool,
+    ),
+    (
+        "ReportControlBlock_getParent",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        _P_LOGICAL_NODE,
+    ),
+    (
+        "ReportControlBlock_getRptID",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_char_p,
+    ),
+    (
+        "ReportControlBlock_getRptEna",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_bool,
+    ),
+    (
+        "ReportControlBlock_getDataSet",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_char_p,
+    ),
+    (
+        "ReportControlBlock_getConfRev",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_uint32,
+    ),
+    (
+        "ReportControlBlock_getOptFlds",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_uint32,
+    ),
+    (
+        "ReportControlBlock_getBufTm",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_uint32,
+    ),
+    (
+        "ReportControlBlock_getSqNum",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_uint16,
+    ),
+    (
+        "ReportControlBlock_getTrgOps",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_uint32,
+    ),
+    (
+        "ReportControlBlock_getIntgPd",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_uint32,
+    ),
+    (
+        "ReportControlBlock_getGI",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_bool,
+    ),
+    (
+        "ReportControlBlock_getPurgeBuf",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_bool,
+    ),
+    (
+        "ReportControlBlock_getEntryId",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        _P_MMS_VALUE,
+    ),
+    (
+        "ReportControlBlock_getTimeofEntry",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_uint64,
+    ),
+    (
+        "ReportControlBlock_getResvTms",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_uint16,
+    ),
+    (
+        "ReportControlBlock_getResv",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        c_bool,
+    ),
+    (
+        "ReportControlBlock_getOwner",
+        (_P_REPORT_CONTROL_BLOCK,),  # ReportControlBlock* self
+        _P_MMS_VALUE,
+    ),
+    (
+        "LogControlBlock_create",
+        (
+            c_char_p,  # const char* name,
+            _P_LOGICAL_NODE,  # LogicalNode* parent,
+            c_char_p,  #  const char* dataSetName,
+            c_char_p,  # const char* logRef,
+            c_uint8,  # uint8_t trgOps,
+            c_uint32,  # uint32_t intgPd,
+            c_bool,  #  bool logEna,
+            c_bool,  # bool reasonCode
+        ),
+        _P_LOG_CONTROL_BLOCK,
+    ),
+    (
+        "LogControlBlock_getName",
+        (_P_LOG_CONTROL_BLOCK,),  # LogControlBlock* self
+        c_char_p,
+    ),
+    (
+        "LogControlBlock_getParent",
+        (_P_LOG_CONTROL_BLOCK,),  # LogControlBlock* self
+        _P_LOGICAL_NODE,
+    ),
+    (
+        "Log_create",
+        (
+            c_char_p,  # const char* name,
+            _P_LOGICAL_NODE,  # LogicalNode* parent,
+        ),
+        _P_LOG,
+    ),
+    (
+        "SettingGroupControlBlock_create",
+        (
+            _P_LOGICAL_NODE,  # LogicalNode* parent,
+            c_uint8,  # uint8_t actSG,
+            c_uint8,  # uint8_t numOfSGs
+        ),
+        _P_SETTING_GROUP_CONTROL_BLOCK,
+    ),
+    (
+        "GSEControlBlock_create",
+        (
+            c_char_p,  # const char* name,
+            _P_LOGICAL_NODE,  # LogicalNode* parent,
+            c_char_p,  #  const char* appId,
+            c_char_p,  # const char* dataSet,
+            c_uint32,  #  uint32_t confRev,
+            c_bool,  # bool fixedOffs,
+            c_int,  # int minTime,
+            c_int,  # int maxTime
+        ),
+        _P_GSE_CONTROL_BLOCK,
+    ),
+    (
+        "SVControlBlock_create",
+        (
+            c_char_p,  # const char* name
+            _P_LOGICAL_NODE,  # LogicalNode* parent
+            c_char_p,  # c const char* svID
+            c_char_p,  # const char* dataSet
+            c_uint32,  # uint32_t confRev
+            c_uint8,  # uint8_t smpMod
+            c_uint16,  # uint16_t smpRate
+            c_uint8,  # uint8_t optFlds
+            c_bool,  #  bool isUnicast
+        ),
+        _P_SV_CONTROL_BLOCK,
+    ),
+    (
+        "SVControlBlock_getName",
+        (_P_SV_CONTROL_BLOCK,),  # SVControlBlock* self
+        c_char_p,
+    ),
+    (
+        "SVControlBlock_addPhyComAddress",
+        (
+            _P_SV_CONTROL_BLOCK,  # SVControlBlock* self
+            _P_PHY_COM_ADDRESS,  # PhyComAddress* phyComAddress
+        ),
+        None,
+    ),
+    (
+        "GSEControlBlock_addPhyComAddress",
+        (
+            _P_GSE_CONTROL_BLOCK,  # GSEControlBlock* self
+            _P_PHY_COM_ADDRESS,  # PhyComAddress* phyComAddress
+        ),
+        None,
+    ),
+    (
+        "PhyComAddress_create",
+        (
+            c_uint8,  # uint8_t vlanPriority
+            c_uint16,  # uint16_t vlanId
+            c_uint16,  # uint16_t appId
+            # The 6 bytes of the MAC address are given as a bytes object, the
+            # library copies them, no (c_uint8 * 6) array has to be built
+            c_char_p,  # uint8_t dstAddress[]
+        ),
+        _P_PHY_COM_ADDRESS,
+    ),
+    (
+        "DataSet_create",
+        (
+            c_char_p,  # const char* name
+            _P_LOGICAL_NODE,  # LogicalNode* parent
+        ),
+        _P_DATA_SET,
+    ),
+    (
+        "DataSet_getName",
+        (_P_DATA_SET,),  # DataSet* self
+        c_char_p,
+    ),
+    (
+        "DataSet_getSize",
+        (_P_DATA_SET,),  # DataSet* self
+        c_int,
+    ),
+    (
+        "DataSet_getFirstEntry",
+        (_P_DATA_SET,),  # DataSet* self
+        _P_DATA_SET_ENTRY,
+    ),
+    (
+        "DataSetEntry_getNext",
+        (_P_DATA_SET_ENTRY,),  # DataSetEntry* self
+        _P_DATA_SET_ENTRY,
+    ),
+    (
+        "DataSetEntry_create",
+        (
+            _P_DATA_SET,  # DataSet* dataSet
+            c_char_p,  # const char* variable
+            c_int,  # int index
+            c_char_p,  # const char* component
+        ),
+        _P_DATA_SET_ENTRY,
+    ),
+)
 
-def setup_prototypes(lib: CDLL):
-    """Add prototypes definition to the lib"""
-
-    lib.IedModel_create.argtypes = [
-        c_char_p,  # const char* name
-    ]
-    lib.IedModel_create.restype = POINTER(IedModel)
-
-    lib.IedModel_setIedNameForDynamicModel.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-        c_char_p,  # const char* name
-    ]
-    lib.IedModel_setIedNameForDynamicModel.restype = None
-
-    lib.IedModel_destroy.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-    ]
-    lib.IedModel_destroy.restype = None
-
-    lib.LogicalDevice_create.argtypes = [
-        c_char_p,  # const char* inst
-        POINTER(IedModel),  # IedModel* parent
-    ]
-    lib.LogicalDevice_create.restype = POINTER(LogicalDevice)
-
-    lib.LogicalDevice_createEx.argtypes = [
-        c_char_p,  # const char* inst
-        POINTER(IedModel),  # IedModel* parent
-        c_char_p,  # const char* ldName
-    ]
-    lib.LogicalDevice_createEx.restype = POINTER(LogicalDevice)
-
-    lib.LogicalNode_create.argtypes = [
-        c_char_p,  # const char* name
-        POINTER(LogicalDevice),  # LogicalDevice* parent
-    ]
-    lib.LogicalNode_create.restype = POINTER(LogicalNode)
-
-    lib.DataObject_create.argtypes = [
-        c_char_p,  # const char* name
-        POINTER(ModelNode),  # ModelNode* name
-        c_int,  # int arrayElements
-    ]
-    lib.DataObject_create.restype = POINTER(DataObject)
-
-    lib.DataAttribute_create.argtypes = [
-        c_char_p,  # const char* name
-        POINTER(ModelNode),  # ModelNode* parent
-        DataAttributeType,  # DataAttributeType type
-        FunctionalConstraint,  # FunctionalConstraint fc
-        c_uint8,  # uint8_t triggerOptions
-        c_int,  #  int arrayElements
-        c_uint32,  #  uint32_t sAddr
-    ]
-    lib.DataAttribute_create.restype = POINTER(DataAttribute)
-
-    lib.DataAttribute_getType.argtypes = [
-        POINTER(DataAttribute),  # DataAttribute* self
-    ]
-    lib.DataAttribute_getType.restype = DataAttributeType
-
-    lib.DataAttribute_getFC.argtypes = [
-        POINTER(DataAttribute),  # DataAttribute* self
-    ]
-    lib.DataAttribute_getFC.restype = FunctionalConstraint
-
-    lib.DataAttribute_getTrgOps.argtypes = [
-        POINTER(DataAttribute),  # DataAttribute* self
-    ]
-    lib.DataAttribute_getTrgOps.restype = c_uint8
-
-    lib.DataAttribute_setValue.argtypes = [
-        POINTER(DataAttribute),  # DataAttribute* self
-        POINTER(MmsValue),  # MmsValue* value
-    ]
-    lib.DataAttribute_setValue.restype = None
-
-    lib.ReportControlBlock_create.argtypes = [
-        c_char_p,  # const char* name,
-        POINTER(LogicalNode),  # LogicalNode* parent,
-        c_char_p,  # const char* rptId,
-        c_bool,  #  bool isBuffered,
-        c_char_p,  # const char* dataSetName,
-        c_uint32,  #  uint32_t confRef,
-        c_uint8,  #  uint8_t trgOps,
-        c_uint8,  # uint8_t options,
-        c_uint32,  #  uint32_t bufTm,
-        c_uint32,  # uint32_t intgPd
-    ]
-    lib.DataAttribute_setValue.restype = POINTER(ReportControlBlock)
-
-    lib.ReportControlBlock_setPreconfiguredClient.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-        c_uint8,  # uint8_t clientType
-        POINTER(c_uint8),  # const uint8_t* clientAddress
-    ]
-    lib.ReportControlBlock_setPreconfiguredClient.restype = None
-
-    lib.ReportControlBlock_getName.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getName.restype = c_char_p
-
-    lib.ReportControlBlock_isBuffered.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_isBuffered.restype = c_bool
-
-    lib.ReportControlBlock_getParent.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getParent.restype = POINTER(LogicalNode)
-
-    lib.ReportControlBlock_getRptID.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getRptID.restype = c_char_p
-
-    lib.ReportControlBlock_getRptEna.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getRptEna.restype = c_bool
-
-    lib.ReportControlBlock_getDataSet.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getDataSet.restype = c_char_p
-
-    lib.ReportControlBlock_getConfRev.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getConfRev.restype = c_uint32
-
-    lib.ReportControlBlock_getOptFlds.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getOptFlds.restype = c_uint32
-
-    lib.ReportControlBlock_getBufTm.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getBufTm.restype = c_uint32
-
-    lib.ReportControlBlock_getSqNum.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getSqNum.restype = c_uint16
-
-    lib.ReportControlBlock_getTrgOps.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getTrgOps.restype = c_uint32
-
-    lib.ReportControlBlock_getIntgPd.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getIntgPd.restype = c_uint32
-
-    lib.ReportControlBlock_getGI.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getGI.restype = c_bool
-
-    lib.ReportControlBlock_getPurgeBuf.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getPurgeBuf.restype = c_bool
-
-    lib.ReportControlBlock_getEntryId.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getEntryId.restype = POINTER(MmsValue)
-
-    lib.ReportControlBlock_getTimeofEntry.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getTimeofEntry.restype = c_uint64
-
-    lib.ReportControlBlock_getResvTms.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getResvTms.restype = c_uint16
-
-    lib.ReportControlBlock_getResv.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getResv.restype = c_bool
-
-    lib.ReportControlBlock_getOwner.argtypes = [
-        POINTER(ReportControlBlock),  # ReportControlBlock* self
-    ]
-    lib.ReportControlBlock_getOwner.restype = POINTER(MmsValue)
-
-    lib.LogControlBlock_create.argtypes = [
-        c_char_p,  # const char* name,
-        POINTER(LogicalNode),  # LogicalNode* parent,
-        c_char_p,  #  const char* dataSetName,
-        c_char_p,  # const char* logRef,
-        c_uint8,  # uint8_t trgOps,
-        c_uint32,  # uint32_t intgPd,
-        c_bool,  #  bool logEna,
-        c_bool,  # bool reasonCode
-    ]
-    lib.LogControlBlock_create.restype = POINTER(LogControlBlock)
-
-    lib.LogControlBlock_getName.argtypes = [
-        POINTER(LogControlBlock),  # LogControlBlock* self
-    ]
-    lib.LogControlBlock_getName.restype = c_char_p
-
-    lib.LogControlBlock_getParent.argtypes = [
-        POINTER(LogControlBlock),  # LogControlBlock* self
-    ]
-    lib.LogControlBlock_getParent.restype = POINTER(LogicalNode)
-
-    lib.Log_create.argtypes = [
-        c_char_p,  # const char* name,
-        POINTER(LogicalNode),  # LogicalNode* parent,
-    ]
-    lib.Log_create.restype = POINTER(Log)
-
-    lib.SettingGroupControlBlock_create.argtypes = [
-        POINTER(LogicalNode),  # LogicalNode* parent,
-        c_uint8,  # uint8_t actSG,
-        c_uint8,  # uint8_t numOfSGs
-    ]
-    lib.SettingGroupControlBlock_create.restype = POINTER(SettingGroupControlBlock)
-
-    lib.GSEControlBlock_create.argtypes = [
-        c_char_p,  # const char* name,
-        POINTER(LogicalNode),  # LogicalNode* parent,
-        c_char_p,  #  const char* appId,
-        c_char_p,  # const char* dataSet,
-        c_uint32,  #  uint32_t confRev,
-        c_bool,  # bool fixedOffs,
-        c_int,  # int minTime,
-        c_int,  # int maxTime
-    ]
-    lib.GSEControlBlock_create.restype = POINTER(GSEControlBlock)
-
-    lib.SVControlBlock_create.argtypes = [
-        c_char_p,  # const char* name
-        POINTER(LogicalNode),  # LogicalNode* parent
-        c_char_p,  # c const char* svID
-        c_char_p,  # const char* dataSet
-        c_uint32,  # uint32_t confRev
-        c_uint8,  # uint8_t smpMod
-        c_uint16,  # uint16_t smpRate
-        c_uint8,  # uint8_t optFlds
-        c_bool,  #  bool isUnicast
-    ]
-    lib.SVControlBlock_create.restype = POINTER(SVControlBlock)
-
-    lib.SVControlBlock_getName.argtypes = [
-        POINTER(SVControlBlock),  # SVControlBlock* self
-    ]
-    lib.SVControlBlock_getName.restype = c_char_p
-
-    lib.SVControlBlock_addPhyComAddress.argtypes = [
-        POINTER(SVControlBlock),  # SVControlBlock* self
-        POINTER(PhyComAddress),  # PhyComAddress* phyComAddress
-    ]
-    lib.SVControlBlock_addPhyComAddress.restype = None
-
-    lib.GSEControlBlock_addPhyComAddress.argtypes = [
-        POINTER(GSEControlBlock),  # GSEControlBlock* self
-        POINTER(PhyComAddress),  # PhyComAddress* phyComAddress
-    ]
-    lib.GSEControlBlock_addPhyComAddress.restype = None
-
-    lib.PhyComAddress_create.argtypes = [
-        c_uint8,  # uint8_t vlanPriority
-        c_uint16,  # uint16_t vlanId
-        c_uint16,  # uint16_t appId
-        POINTER(c_uint8),  # uint8_t dstAddress[]
-    ]
-    lib.PhyComAddress_create.restype = POINTER(PhyComAddress)
 
-    lib.DataSet_create.argtypes = [
-        c_char_p,  # const char* name
-        POINTER(LogicalNode),  # LogicalNode* parent
-    ]
-    lib.DataSet_create.restype = POINTER(DataSet)
+# Functions only reading or writing the memory of the static model, they
+# never block and are called for each value update, so the GIL is kept
+# during the call. The ReportControlBlock getters of the runtime values
+# are not part of them, they wait for the lock of the report control.
+_ACCESSORS = frozenset(
+    (
+        "DataAttribute_getType",
+        "DataAttribute_getFC",
+        "DataAttribute_getTrgOps",
+        "DataAttribute_setValue",
+        "ReportControlBlock_getName",
+        "ReportControlBlock_isBuffered",
+        "ReportControlBlock_getParent",
+        "LogControlBlock_getName",
+        "LogControlBlock_getParent",
+        "SVControlBlock_getName",
+        "DataSet_getName",
+        "DataSet_getSize",
+        "DataSet_getFirstEntry",
+        "DataSetEntry_getNext",
+    )
+)
 
-    lib.DataSet_getName.argtypes = [
-        POINTER(DataSet),  # DataSet* self
-    ]
-    lib.DataSet_getName.restype = c_char_p
 
-    lib.DataSet_getSize.argtypes = [
-        POINTER(DataSet),  # DataSet* self
-    ]
-    lib.DataSet_getSize.restype = c_int
+def setup_prototypes(lib: Library):
+    """Add prototypes definition to the lib
 
-    lib.DataSet_getFirstEntry.argtypes = [
-        POINTER(DataSet),  # DataSet* self
-    ]
-    lib.DataSet_getFirstEntry.restype = POINTER(DataSetEntry)
+    Apart from the accessors, the functions release the GIL during the
+    call, see :meth:`Library.defer_prototypes`.
+    """
+    lib.defer_prototypes(_PROTOTYPES, accessors=_ACCESSORS)
 
-    lib.DataSetEntry_getNext.argtypes = [
-        POINTER(DataSetEntry),  # DataSetEntry* self
-    ]
-    lib.DataSetEntry_getNext.restype = POINTER(DataSetEntry)
 
-    lib.DataSetEntry_create.argtypes = [
-        POINTER(DataSet),  # DataSet* dataSet
-        c_char_p,  # const char* variable
-        c_int,  # int index
-        c_char_p,  # const char* component
-    ]
-    lib.DataSetEntry_create.restype = POINTER(DataSetEntry)
+# Expose the dynamic model functions of the loaded library as module attributes
+__getattr__ = module_getattr(globals(), _PROTOTYPES)
@@ -1,7 +1,6 @@
 """Module for C binding with iec61850/inc/iec61850_common.h"""
 
 from ctypes import (
-    CDLL,
     POINTER,
     Structure,
     Union,
@@ -15,6 +14,7 @@ from ctypes import (
     c_uint64,
 )
 
+from ..library import Library
 from ..mms import MmsValue
 
 
@@ -28,7 +28,11 @@ class PhyComAddress(Structure):
 
 
 class Timestamp(Union):
-    _fields_ = [("val", c_uint8 * 8)]
+    # The 8 bytes are encoded as in MMS (big endian seconds, fraction and
+    # quality), raw is not a time but lets the timestamp be copied at once.
+    # Packed so the union keeps the alignment of the C type.
+    _pack_ = 1
+    _fields_ = [("val", c_uint8 * 8), ("raw", c_uint64)]
 
 
 ACSIClass = c_int
@@ -45,137 +49,166 @@ nsSinceEpoch = c_uint64
 msSinceEpoch = c_uint64
 
 
-def setup_prototypes(lib: CDLL):
-    """Add prototypes definition to the lib"""
-
-    lib.Timestamp_create.argtypes = []
-    lib.Timestamp_create.restype = POINTER(Timestamp)
-
-    lib.Timestamp_createFromByteArray.argtypes = [
-        POINTER(c_uint8),  # const uint8_t* byteArray
-    ]
-    lib.Timestamp_createFromByteArray.restype = POINTER(Timestamp)
-
-    lib.Timestamp_destroy.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-    ]
-    lib.Timestamp_destroy.restype = None
-
-    lib.Timestamp_clearFlags.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-    ]
-    lib.Timestamp_clearFlags.restype = None
-
-    lib.Timestamp_getTimeInSeconds.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-    ]
-    lib.Timestamp_getTimeInSeconds.restype = c_uint32
-
-    lib.Timestamp_getTimeInMs.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-    ]
-    lib.Timestamp_getTimeInMs.restype = msSinceEpoch
-
-    lib.Timestamp_getTimeInNs.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-    ]
-    lib.Timestamp_getTimeInNs.restype = nsSinceEpoch
-
-    lib.Timestamp_isLeapSecondKnown.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-    ]
-    lib.Timestamp_isLeapSecondKnown.restype = c_bool
-
-    lib.Timestamp_setLeapSecondKnown.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-        c_bool,  # bool value
-    ]
-    lib.Timestamp_setLeapSecondKnown.restype = None
-
-    lib.Timestamp_hasClockFailure.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-    ]
-    lib.Timestamp_hasClockFailure.restype = c_bool
-
-    lib.Timestamp_setClockFailure.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-        c_bool,  # bool value
-    ]
-    lib.Timestamp_setClockFailure.restype = None
-
-    lib.Timestamp_isClockNotSynchronized.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-    ]
-    lib.Timestamp_isClockNotSynchronized.restype = c_bool
-
-    lib.Timestamp_setClockNotSynchronized.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-        c_bool,  # bool value
-    ]
-    lib.Timestamp_setClockNotSynchronized.restype = None
-
-    lib.Timestamp_getSubsecondPrecision.argtypes = [
-        POINTER(Timestamp),
-    ]  # Timestamp* self
-    lib.Timestamp_getSubsecondPrecision.restype = c_int
-
-    lib.Timestamp_setFractionOfSecondPart.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-        c_uint32,  # uint32_t fractionOfSecond
-    ]
-    lib.Timestamp_setFractionOfSecondPart.restype = None
-
-    lib.Timestamp_getFractionOfSecondPart.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-    ]
-    lib.Timestamp_getFractionOfSecondPart.restype = c_uint32
-
-    lib.Timestamp_getFractionOfSecond.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-    ]
-    lib.Timestamp_getFractionOfSecond.restype = c_float
-
-    lib.Timestamp_setSubsecondPrecision.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-        c_int,  # int subsecondPrecision
-    ]
-    lib.Timestamp_setSubsecondPrecision.restype = None
-
-    lib.Timestamp_setTimeInSeconds.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-        c_uint32,  # uint32_t secondsSinceEpoch
-    ]
-    lib.Timestamp_setTimeInSeconds.restype = None
-
-    lib.Timestamp_setTimeInMilliseconds.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-        msSinceEpoch,  # msSinceEpoch msTime
-    ]
-    lib.Timestamp_setTimeInMilliseconds.restype = None
-
-    lib.Timestamp_setTimeInNanoseconds.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-        nsSinceEpoch,  # nsSinceEpoch nsTime
-    ]
-    lib.Timestamp_setTimeInNanoseconds.restype = None
-
-    lib.Timestamp_setByMmsUtcTime.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-        POINTER(MmsValue),  # const MmsValue* mmsValue
-    ]
-    lib.Timestamp_setByMmsUtcTime.restype = None
-
-    lib.Timestamp_toMmsValue.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-        POINTER(MmsValue),  # MmsValue* mmsValue
-    ]
-    lib.Timestamp_toMmsValue.restype = POINTER(MmsValue)
+# Pointer types used by the prototypes
+_P_TIMESTAMP = POINTER(Timestamp)
+_P_MMS_VALUE = POINTER(MmsValue)
+
+
+# (function name, argtypes, restype) of each prototype of the module
+_PROTOTYPES = (
+    ("Timestamp_create", (), _P_TIMESTAMP),
+    (
+        "Timestamp_createFromByteArray",
+        (POINTER(c_uint8),),  # const uint8_t* byteArray
+        _P_TIMESTAMP,
+    ),
+    (
+        "Timestamp_destroy",
+        (_P_TIMESTAMP,),  # Timestamp* self
+        None,
+    ),
+    (
+        "Timestamp_clearFlags",
+        (_P_TIMESTAMP,),  # Timestamp* self
+        None,
+    ),
+    (
+        "Timestamp_getTimeInSeconds",
+        (_P_TIMESTAMP,),  # Timestamp* self
+        c_uint32,
+    ),
+    (
+        "Timestamp_getTimeInMs",
+        (_P_TIMESTAMP,),  # Timestamp* self
+        msSinceEpoch,
+    ),
+    (
+        "Timestamp_getTimeInNs",
+        (_P_TIMESTAMP,),  # Timestamp* self
+        nsSinceEpoch,
+    ),
+    (
+        "Timestamp_isLeapSecondKnown",
+        (_P_TIMESTAMP,),  # Timestamp* self
+        c_bool,
+    ),
+    (
+        "Timestamp_setLeapSecondKnown",
+        (
+            _P_TIMESTAMP,  # Timestamp* self
+            c_bool,  # bool value
+        ),
+        None,
+    ),
+    (
+        "Timestamp_hasClockFailure",
+        (_P_TIMESTAMP,),  # Timestamp* self
+        c_bool,
+    ),
+    (
+        "Timestamp_setClockFailure",
+        (
+            _P_TIMESTAMP,  # Timestamp* self
+            c_bool,  # bool value
+        ),
+        None,
+    ),
+    (
+        "Timestamp_isClockNotSynchronized",
+        (_P_TIMESTAMP,),  # Timestamp* self
+        c_bool,
+    ),
+    (
+        "Timestamp_setClockNotSynchronized",
+        (
+            _P_TIMESTAMP,  # Timestamp* self
+            c_bool,  # bool value
+        ),
+        None,
+    ),
+    (
+        "Timestamp_getSubsecondPrecision",
+        (_P_TIMESTAMP,),  # Timestamp* self
+        c_int,
+    ),
+    (
+        "Timestamp_setFractionOfSecondPart",
+        (
+            _P_TIMESTAMP,  # Timestamp* self
+            c_uint32,  # uint32_t fractionOfSecond
+        ),
+        None,
+    ),
+    (
+        "Timestamp_getFractionOfSecondPart",
+        (_P_TIMESTAMP,),  # Timestamp* self
+        c_uint32,
+    ),
+    (
+        "Timestamp_getFractionOfSecond",
+        (_P_TIMESTAMP,),  # Timestamp* self
+        c_float,
+    ),
+    (
+        "Timestamp_setSubsecondPrecision",
+        (
+            _P_TIMESTAMP,  # Timestamp* self
+            c_int,  # int subsecondPrecision
+        ),
+        None,
+    ),
+    (
+        "Timestamp_setTimeInSeconds",
+        (
+            _P_TIMESTAMP,  # Timestamp* self
+            c_uint32,  # uint32_t secondsSinceEpoch
+        ),
+        None,
+    ),
+    (
+        "Timestamp_setTimeInMilliseconds",
+        (
+            _P_TIMESTAMP,  # Timestamp* self
+            msSinceEpoch,  # msSinceEpoch msTime
+        ),
+        None,
+    ),
+    (
+        "Timestamp_setTimeInNanoseconds",
+        (
+            _P_TIMESTAMP,  # Timestamp* self
+            nsSinceEpoch,  # nsSinceEpoch nsTime
+        ),
+        None,
+    ),
+    (
+        "Timestamp_setByMmsUtcTime",
+        (
+            _P_TIMESTAMP,  # Timestamp* self
+            _P_MMS_VALUE,  # const MmsValue* mmsValue
+        ),
+        None,
+    ),
+    (
+        "Timestamp_toMmsValue",
+        (
+            _P_TIMESTAMP,  # Timestamp* self
+            _P_MMS_VALUE,  # MmsValue* mmsValue
+        ),
+        _P_MMS_VALUE,
+    ),
+    (
+        "Timestamp_fromMmsValue",
+        (
+            _P_TIMESTAMP,  # Timestamp* self
+            _P_MMS_VALUE,  # MmsValue* mmsValue
+        ),
+        _P_TIMESTAMP,
+    ),
+    ("LibIEC61850_getVersionString", (), c_char_p),
+)
 
-    lib.Timestamp_fromMmsValue.argtypes = [
-        POINTER(Timestamp),  # Timestamp* self
-        POINTER(MmsValue),  # MmsValue* mmsValue
-    ]
-    lib.Timestamp_fromMmsValue.restype = POINTER(Timestamp)
 
-    lib.LibIEC61850_getVersionString.argtypes = []
-    lib.LibIEC61850_getVersionString.restype = c_char_p
+def setup_prototypes(lib: Library):
+    """Add prototypes definition to the lib"""
+    lib.defer_prototypes(_PROTOTYPES)
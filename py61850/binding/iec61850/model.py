@@ -1,7 +1,7 @@
 """Module for C binding with iec61850/inc/iec61850_model.h"""
 
+import struct
 from ctypes import (
-    CDLL,
     POINTER,
     Structure,
     c_bool,
@@ -12,9 +12,12 @@ from ctypes import (
     c_uint32,
     c_uint64,
     c_void_p,
+    sizeof,
+    string_at,
 )
 
 from ..common.linked_list import LinkedList
+from ..library import Library, module_getattr
 from ..mms import MmsValue
 from .iec61850_common import FunctionalConstraint
 
@@ -35,6 +38,31 @@ ModelNode._fields_ = [
 ]
 
 
+# Fields shared by all the model nodes: modelType, name, parent, sibling, firstChild
+_MODEL_NODE_HEADER = struct.Struct("iPPPP")
+assert _MODEL_NODE_HEADER.size == sizeof(ModelNode)
+
+
+def unpack_model_node(address: int) -> tuple[int, int, int, int, int]:
+    """Read the fields common to all the model nodes in a single copy
+
+    Walking a model through the ``ModelNode`` fields creates a ctypes object
+    for each field read, the fields are here returned as plain integers.
+
+    Parameters
+    ----------
+    address : int
+        Address of the model node
+
+    Returns
+    -------
+    tuple[int, int, int, int, int]
+        ``modelType`` then the addresses of ``name``, ``parent``, ``sibling``
+        and ``firstChild``, 0 for a NULL pointer
+    """
+    return _MODEL_NODE_HEADER.unpack(string_at(address, _MODEL_NODE_HEADER.size))
+
+
 class DataAttribute(Structure):
     _fields_ = [
         ("modelType", ModelNodeType),
@@ -138,167 +166,228 @@ class IedModel(Structure):
     ]
 
 
-def setup_prototypes(lib: CDLL):
-    """Add prototypes definition to the lib"""
-
-    lib.ModelNode_getChildCount.argtypes = [
-        POINTER(ModelNode),  # ModelNode* self
-    ]
-    lib.ModelNode_getChildCount.restype = c_int
-
-    lib.ModelNode_getChild.argtypes = [
-        POINTER(ModelNode),  # ModelNode* self
-        c_char_p,  # const char* name
-    ]
-    lib.ModelNode_getChild.restype = POINTER(ModelNode)
-
-    lib.ModelNode_getChildWithIdx.argtypes = [
-        POINTER(ModelNode),  # ModelNode* self
-        c_int,  # int idx
-    ]
-    lib.ModelNode_getChildWithIdx.restype = POINTER(ModelNode)
-
-    lib.ModelNode_getChildWithFc.argtypes = [
-        POINTER(ModelNode),  # ModelNode* self
-        c_char_p,  # const char* name,
-        FunctionalConstraint,  # FunctionalConstraint fc
-    ]
-    lib.ModelNode_getChildWithFc.restype = POINTER(ModelNode)
-
-    lib.ModelNode_getObjectReference.argtypes = [
-        POINTER(ModelNode),  # ModelNode* self
-        c_char_p,  #  char* objectReference
-    ]
-    lib.ModelNode_getObjectReference.restype = c_char_p
-
-    lib.ModelNode_getObjectReferenceEx.argtypes = [
-        POINTER(ModelNode),  # ModelNode* node
-        c_char_p,  #  char* objectReference
-        c_bool,  #  bool withoutIedName
-    ]
-    lib.ModelNode_getObjectReferenceEx.restype = c_char_p
-
-    lib.ModelNode_getType.argtypes = [
-        POINTER(ModelNode),  # ModelNode* node
-    ]
-    lib.ModelNode_getType.restype = ModelNodeType
-
-    lib.ModelNode_getName.argtypes = [
-        POINTER(ModelNode),  # ModelNode* self
-    ]
-    lib.ModelNode_getName.restype = c_char_p
-
-    lib.ModelNode_getParent.argtypes = [
-        POINTER(ModelNode),  # ModelNode* self
-    ]
-    lib.ModelNode_getParent.restype = POINTER(ModelNode)
-
-    lib.ModelNode_getChildren.argtypes = [
-        POINTER(ModelNode),  # ModelNode* self
-    ]
-    lib.ModelNode_getChildren.restype = LinkedList
-
-    lib.IedModel_setIedName.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-        c_char_p,  # const char* iedName
-    ]
-    lib.IedModel_setIedName.restype = None
-
-    lib.IedModel_getModelNodeByObjectReference.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-        c_char_p,  # const char* objectReference
-    ]
-    lib.IedModel_getModelNodeByObjectReference.restype = POINTER(ModelNode)
-
-    lib.IedModel_getSVControlBlock.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-        POINTER(LogicalNode),  # LogicalNode* parentLN,
-        c_char_p,  # const char* svcbName
-    ]
-    lib.IedModel_getSVControlBlock.restype = POINTER(SVControlBlock)
-
-    lib.IedModel_getModelNodeByShortObjectReference.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-        c_char_p,  # const char* objectReference
-    ]
-    lib.IedModel_getModelNodeByShortObjectReference.restype = POINTER(ModelNode)
-
-    lib.IedModel_getModelNodeByShortAddress.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-        c_uint32,  # uint32_t shortAddress
-    ]
-    lib.IedModel_getModelNodeByShortAddress.restype = POINTER(ModelNode)
-
-    lib.IedModel_getDeviceByInst.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-        c_char_p,  # const char* ldInst
-    ]
-    lib.IedModel_getDeviceByInst.restype = POINTER(LogicalDevice)
-
-    lib.IedModel_getDeviceByIndex.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-        c_int,  # int index
-    ]
-    lib.IedModel_getDeviceByIndex.restype = POINTER(LogicalDevice)
-
-    lib.LogicalDevice_getLogicalNode.argtypes = [
-        POINTER(LogicalDevice),  # LogicalDevice* self
-        c_char_p,  # const char* lnName
-    ]
-    lib.LogicalDevice_getLogicalNode.restype = POINTER(LogicalNode)
-
-    lib.LogicalDevice_getSettingGroupControlBlock.argtypes = [
-        POINTER(LogicalDevice),  # LogicalDevice* self
-    ]
-    lib.LogicalDevice_getSettingGroupControlBlock.restype = POINTER(SettingGroupControlBlock)
-
-    lib.IedModel_setAttributeValuesToNull.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-    ]
-    lib.IedModel_setAttributeValuesToNull.restype = None
-
-    lib.IedModel_getDevice.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-        c_char_p,  # const char* ldName
-    ]
-    lib.IedModel_getDevice.restype = POINTER(LogicalDevice)
-
-    lib.IedModel_lookupDataSet.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-        c_char_p,  # const char* dataSetReference
-    ]
-    lib.IedModel_lookupDataSet.restype = POINTER(DataSet)
-
-    lib.IedModel_lookupDataSet.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-        POINTER(MmsValue),  # MmsValue* value
-    ]
-    lib.IedModel_lookupDataSet.restype = POINTER(DataAttribute)
-
-    lib.IedModel_getLogicalDeviceCount.argtypes = [
-        POINTER(IedModel),  # IedModel* self
-    ]
-    lib.IedModel_getLogicalDeviceCount.restype = c_int
+# Pointer types of the prototypes, resolved once
+_P_DATA_ATTRIBUTE = POINTER(DataAttribute)
+_P_DATA_OBJECT = POINTER(DataObject)
+_P_DATA_SET = POINTER(DataSet)
+_P_IED_MODEL = POINTER(IedModel)
+_P_LOGICAL_DEVICE = POINTER(LogicalDevice)
+_P_LOGICAL_NODE = POINTER(LogicalNode)
+_P_MMS_VALUE = POINTER(MmsValue)
+_P_MODEL_NODE = POINTER(ModelNode)
+_P_SETTING_GROUP_CONTROL_BLOCK = POINTER(SettingGroupControlBlock)
+_P_SV_CONTROL_BLOCK = POINTER(SVControlBlock)
+
+
+# (function name, argtypes, restype) of each prototype of the module
+_PROTOTYPES = (
+    (
+        "ModelNode_getChildCount",
+        (_P_MODEL_NODE,),  # ModelNode* self
+        c_int,
+    ),
+    (
+        "ModelNode_getChild",
+        (
+            _P_MODEL_NODE,  # ModelNode* self
+            c_char_p,  # const char* name
+        ),
+        _P_MODEL_NODE,
+    ),
+    (
+        "ModelNode_getChildWithIdx",
+        (
+            _P_MODEL_NODE,  # ModelNode* self
+            c_int,  # int idx
+        ),
+        _P_MODEL_NODE,
+    ),
+    (
+        "ModelNode_getChildWithFc",
+        (
+            _P_MODEL_NODE,  # ModelNode* self
+            c_char_p,  # const char* name,
+            FunctionalConstraint,  # FunctionalConstraint fc
+        ),
+        _P_MODEL_NODE,
+    ),
+    (
+        "ModelNode_getObjectReference",
+        (
+            _P_MODEL_NODE,  # ModelNode* self
+            c_char_p,  #  char* objectReference
+        ),
+        c_char_p,
+    ),
+    (
+        "ModelNode_getObjectReferenceEx",
+        (
+            _P_MODEL_NODE,  # ModelNode* node
+            c_char_p,  #  char* objectReference
+            c_bool,  #  bool withoutIedName
+        ),
+        c_char_p,
+    ),
+    (
+        "ModelNode_getType",
+        (_P_MODEL_NODE,),  # ModelNode* node
+        ModelNodeType,
+    ),
+    (
+        "ModelNode_getName",
+        (_P_MODEL_NODE,),  # ModelNode* self
+        c_char_p,
+    ),
+    (
+        "ModelNode_getParent",
+        (_P_MODEL_NODE,),  # ModelNode* self
+        _P_MODEL_NODE,
+    ),
+    (
+        "ModelNode_getChildren",
+        (_P_MODEL_NODE,),  # ModelNode* self
+        LinkedList,
+    ),
+    (
+        "IedModel_setIedName",
+        (
+            _P_IED_MODEL,  # IedModel* self
+            c_char_p,  # const char* iedName
+        ),
+        None,
+    ),
+    (
+        "IedModel_getModelNodeByObjectReference",
+        (
+            _P_IED_MODEL,  # IedModel* self
+            c_char_p,  # const char* objectReference
+        ),
+        _P_MODEL_NODE,
+    ),
+    (
+        "IedModel_getSVControlBlock",
+        (
+            _P_IED_MODEL,  # IedModel* self
+            _P_LOGICAL_NODE,  # LogicalNode* parentLN,
+            c_char_p,  # const char* svcbName
+        ),
+        _P_SV_CONTROL_BLOCK,
+    ),
+    (
+        "IedModel_getModelNodeByShortObjectReference",
+        (
+            _P_IED_MODEL,  # IedModel* self
+            c_char_p,  # const char* objectReference
+        ),
+        _P_MODEL_NODE,
+    ),
+    (
+        "IedModel_getModelNodeByShortAddress",
+        (
+            _P_IED_MODEL,  # IedModel* self
+            c_uint32,  # uint32_t shortAddress
+        ),
+        _P_MODEL_NODE,
+    ),
+    (
+        "IedModel_getDeviceByInst",
+        (
+            _P_IED_MODEL,  # IedModel* self
+            c_char_p,  # const char* ldInst
+        ),
+        _P_LOGICAL_DEVICE,
+    ),
+    (
+        "IedModel_getDeviceByIndex",
+        (
+            _P_IED_MODEL,  # IedModel* self
+            c_int,  # int index
+        ),
+        _P_LOGICAL_DEVICE,
+    ),
+    (
+        "LogicalDevice_getLogicalNode",
+        (
+            _P_LOGICAL_DEVICE,  # LogicalDevice* self
+            c_char_p,  # const char* lnName
+        ),
+        _P_LOGICAL_NODE,
+    ),
+    (
+        "LogicalDevice_getSettingGroupControlBlock",
+        (_P_LOGICAL_DEVICE,),  # LogicalDevice* self
+        _P_SETTING_GROUP_CONTROL_BLOCK,
+    ),
+    (
+        "IedModel_setAttributeValuesToNull",
+        (_P_IED_MODEL,),  # IedModel* self
+        None,
+    ),
+    (
+        "IedModel_getDevice",
+        (
+            _P_IED_MODEL,  # IedModel* self
+            c_char_p,  # const char* ldName
+        ),
+        _P_LOGICAL_DEVICE,
+    ),
+    (
+        "IedModel_lookupDataSet",
+        (
+            _P_IED_MODEL,  # IedModel* self
+            c_char_p,  # const char* dataSetReference
+        ),
+        _P_DATA_SET,
+    ),
+    (
+        "IedModel_lookupDataAttributeByMmsValue",
+        (
+            _P_IED_MODEL,  # IedModel* self
+            _P_MMS_VALUE,  # MmsValue* value
+        ),
+        _P_DATA_ATTRIBUTE,
+    ),
+    (
+        "IedModel_getLogicalDeviceCount",
+        (_P_IED_MODEL,),  # IedModel* self
+        c_int,
+    ),
+    (
+        "LogicalDevice_getLogicalNodeCount",
+        (_P_LOGICAL_DEVICE,),  # LogicalDevice* self
+        c_int,
+    ),
+    (
+        "LogicalDevice_getChildByMmsVariableName",
+        (
+            _P_LOGICAL_DEVICE,  # LogicalDevice* self
+            c_char_p,  # const char* mmsVariableName
+        ),
+        _P_MODEL_NODE,
+    ),
+    (
+        "LogicalNode_hasFCData",
+        (
+            _P_LOGICAL_NODE,  # LogicalNode* self
+            FunctionalConstraint,  # FunctionalConstraint fc
+        ),
+        c_bool,
+    ),
+    (
+        "DataObject_hasFCData",
+        (
+            _P_DATA_OBJECT,  # DataObject* self
+            FunctionalConstraint,  # FunctionalConstraint fc
+        ),
+        c_bool,
+    ),
+)
 
-    lib.LogicalDevice_getLogicalNodeCount.argtypes = [
-        POINTER(LogicalDevice),  # LogicalDevice* self
-    ]
-    lib.LogicalDevice_getLogicalNodeCount.restype = c_int
 
-    lib.LogicalDevice_getLogicalNodeCount.argtypes = [
-        POINTER(LogicalDevice),  # LogicalDevice* self
-        c_char_p,  # const char* mmsVariableName
-    ]
-    lib.LogicalDevice_getLogicalNodeCount.restype = POINTER(ModelNode)
+def setup_prototypes(lib: Library):
+    """Add prototypes definition to the lib"""
+    lib.defer_prototypes(_PROTOTYPES)
 
-    lib.LogicalNode_hasFCData.argtypes = [
-        POINTER(LogicalNode),  # LogicalNode* self
-        FunctionalConstraint,  # FunctionalConstraint fc
-    ]
-    lib.LogicalNode_hasFCData.restype = c_bool
 
-    lib.ModelNode_getChildWithIdx.argtypes = [
-        POINTER(DataObject),  # DataObject* self
-        FunctionalConstraint,  # FunctionalConstraint fc
-    ]
-    lib.ModelNode_getChildWithIdx.restype = c_bool
+# Expose the model functions of the loaded library as module attributes
+__getattr__ = module_getattr(globals(), _PROTOTYPES)
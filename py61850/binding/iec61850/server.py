@@ -1,7 +1,6 @@
 """Module for C binding with iec61850/inc/iec61850_server.h"""
 
 from ctypes import (
-    CDLL,
     CFUNCTYPE,
     POINTER,
     Structure,
@@ -18,6 +17,7 @@ from ctypes import (
     c_void_p,
 )
 
+from ..library import Library, accessor_names, module_getattr
 from ..mms import MmsDataAccessError, MmsServer, MmsValue
 from ..mms.iso_connection_parameters import AcseAuthenticator
 from .iec61850_common import (
@@ -64,6 +64,9 @@ IedServer_DataSetOperation = c_int
 IedServer_DirectoryCategory = c_int
 IedServer_ControlBlockAccessType = c_int
 
+# The handlers receive the control blocks and data attributes as void
+# pointers: ctypes gives them as int, the address used by the wrappers to
+# find the python object, instead of building a pointer object per call
 IedConnectionIndicationHandler = CFUNCTYPE(
     None,  # return type: void
     IedServer,  # IedServer self,
@@ -75,7 +78,7 @@ IedConnectionIndicationHandler = CFUNCTYPE(
 ActiveSettingGroupChangedHandler = CFUNCTYPE(
     c_bool,  # return type: bool
     c_void_p,  # void* parameter,
-    POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb,
+    c_void_p,  #  SettingGroupControlBlock* sgcb,
     c_uint8,  # uint8_t newActSg,
     ClientConnection,  #  ClientConnection connection
 )
@@ -83,7 +86,7 @@ ActiveSettingGroupChangedHandler = CFUNCTYPE(
 EditSettingGroupChangedHandler = CFUNCTYPE(
     c_bool,  # return type: bool
     c_void_p,  # void* parameter,
-    POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb,
+    c_void_p,  #  SettingGroupControlBlock* sgcb,
     c_uint8,  # uint8_t newEditSg,
     ClientConnection,  #  ClientConnection connection
 )
@@ -91,7 +94,7 @@ EditSettingGroupChangedHandler = CFUNCTYPE(
 EditSettingGroupConfirmationHandler = CFUNCTYPE(
     None,  # return type: void
     c_void_p,  # void* parameter,
-    POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb,
+    c_void_p,  #  SettingGroupControlBlock* sgcb,
     c_uint8,  # uint8_t editSg,
 )
 
@@ -156,7 +159,7 @@ GoCBEventHandler = CFUNCTYPE(
 
 WriteAccessHandler = CFUNCTYPE(
     MmsDataAccessError,  # return type: MmsDataAccessError
-    POINTER(DataAttribute),  # DataAttribute* dataAttribute
+    c_void_p,  # DataAttribute* dataAttribute
     POINTER(MmsValue),  # MmsValue* value,
     ClientConnection,  #  ClientConnection connection,
     c_void_p,  # void* parameter
@@ -213,825 +216,651 @@ IedServer_ControlBlockAccessHandler = CFUNCTYPE(
 )
 
 
-def setup_prototypes(lib: CDLL):
-    """Add prototypes definition to the lib"""
-
-    lib.IedServerConfig_create.argtypes = []
-    lib.IedServerConfig_create.restype = IedServerConfig
-
-    lib.IedServerConfig_destroy.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_destroy.restype = None
-
-    lib.IedServerConfig_setEdition.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_uint8,  # uint8_t edition
-    ]
-    lib.IedServerConfig_setEdition.restype = None
-
-    lib.IedServerConfig_getEdition.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_getEdition.restype = c_uint8
-
-    lib.IedServerConfig_setReportBufferSize.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_int,  # int reportBufferSize
-    ]
-    lib.IedServerConfig_setReportBufferSize.restype = None
-
-    lib.IedServerConfig_getReportBufferSize.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_getReportBufferSize.restype = c_int
-
-    lib.IedServerConfig_setReportBufferSizeForURCBs.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_int,  # int reportBufferSize
-    ]
-    lib.IedServerConfig_setReportBufferSizeForURCBs.restype = None
-
-    lib.IedServerConfig_getReportBufferSizeForURCBs.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_getReportBufferSizeForURCBs.restype = c_int
-
-    lib.IedServerConfig_setMaxMmsConnections.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_int,  # int maxConnections
-    ]
-    lib.IedServerConfig_setMaxMmsConnections.restype = None
-
-    lib.IedServerConfig_getMaxMmsConnections.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_getMaxMmsConnections.restype = c_int
-
-    lib.IedServerConfig_setSyncIntegrityReportTimes.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_bool,  # bool enable
-    ]
-    lib.IedServerConfig_setSyncIntegrityReportTimes.restype = None
-
-    lib.IedServerConfig_getSyncIntegrityReportTimes.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_getSyncIntegrityReportTimes.restype = c_bool
-
-    lib.IedServerConfig_setFileServiceBasePath.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_char_p,  # const char* basepath
-    ]
-    lib.IedServerConfig_setFileServiceBasePath.restype = None
-
-    lib.IedServerConfig_getFileServiceBasePath.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_getFileServiceBasePath.restype = c_char_p
-
-    lib.IedServerConfig_enableFileService.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_bool,  # bool enable
-    ]
-    lib.IedServerConfig_enableFileService.restype = None
-
-    lib.IedServerConfig_isFileServiceEnabled.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_isFileServiceEnabled.restype = c_bool
-
-    lib.IedServerConfig_enableDynamicDataSetService.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_bool,  # bool enable
-    ]
-    lib.IedServerConfig_enableDynamicDataSetService.restype = None
-
-    lib.IedServerConfig_isDynamicDataSetServiceEnabled.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_isDynamicDataSetServiceEnabled.restype = c_bool
-
-    lib.IedServerConfig_setMaxAssociationSpecificDataSets.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_int,  # int maxDataSets
-    ]
-    lib.IedServerConfig_setMaxAssociationSpecificDataSets.restype = None
-
-    lib.IedServerConfig_getMaxAssociationSpecificDataSets.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_getMaxAssociationSpecificDataSets.restype = c_int
-
-    lib.IedServerConfig_setMaxDomainSpecificDataSets.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_int,  # int maxDataSets
-    ]
-    lib.IedServerConfig_setMaxDomainSpecificDataSets.restype = None
-
-    lib.IedServerConfig_getMaxDomainSpecificDataSets.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_getMaxDomainSpecificDataSets.restype = c_int
-
-    lib.IedServerConfig_setMaxDataSetEntries.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_int,  # int maxDataSetEntries
-    ]
-    lib.IedServerConfig_setMaxDataSetEntries.restype = None
-
-    lib.IedServerConfig_getMaxDatasSetEntries.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_getMaxDatasSetEntries.restype = c_int
-
-    lib.IedServerConfig_enableLogService.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_bool,  # bool enable
-    ]
-    lib.IedServerConfig_enableLogService.restype = None
-
-    lib.IedServerConfig_enableEditSG.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_bool,  # bool enable
-    ]
-    lib.IedServerConfig_enableEditSG.restype = None
-
-    lib.IedServerConfig_enableResvTmsForSGCB.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_bool,  # bool enable
-    ]
-    lib.IedServerConfig_enableResvTmsForSGCB.restype = None
-
-    lib.IedServerConfig_enableResvTmsForBRCB.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_bool,  # bool enable
-    ]
-    lib.IedServerConfig_enableResvTmsForBRCB.restype = None
-
-    lib.IedServerConfig_isResvTmsForBRCBEnabled.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_isResvTmsForBRCBEnabled.restype = c_bool
-
-    lib.IedServerConfig_enableOwnerForRCB.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_bool,  # bool enable
-    ]
-    lib.IedServerConfig_enableOwnerForRCB.restype = None
-
-    lib.IedServerConfig_isOwnerForRCBEnabled.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_isOwnerForRCBEnabled.restype = c_bool
-
-    lib.IedServerConfig_useIntegratedGoosePublisher.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_bool,  # bool enable
-    ]
-    lib.IedServerConfig_useIntegratedGoosePublisher.restype = None
-
-    lib.IedServerConfig_isLogServiceEnabled.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-    ]
-    lib.IedServerConfig_isLogServiceEnabled.restype = c_bool
-
-    lib.IedServerConfig_setReportSetting.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_uint8,  # uint8_t setting
-        c_bool,  # bool isDyn
-    ]
-    lib.IedServerConfig_setReportSetting.restype = None
-
-    lib.IedServerConfig_getReportSetting.argtypes = [
-        IedServerConfig,  # IedServerConfig self
-        c_uint8,  # uint8_t setting
-    ]
-    lib.IedServerConfig_getReportSetting.restype = c_bool
-
-    lib.IedServer_create.argtypes = [
-        POINTER(IedModel),  # IedModel* dataModel
-    ]
-    lib.IedServer_create.restype = IedServer
-
-    lib.IedServer_createWithTlsSupport.argtypes = [
-        POINTER(IedModel),  # IedModel* dataModel
-        TLSConfiguration,  # TLSConfiguration tlsConfiguration
-    ]
-    lib.IedServer_createWithTlsSupport.restype = IedServer
-
-    lib.IedServer_createWithConfig.argtypes = [
-        POINTER(IedModel),  # IedModel* dataModel
-        TLSConfiguration,  # TLSConfiguration tlsConfiguration
-        IedServerConfig,  # IedServerConfig serverConfiguration
-    ]
-    lib.IedServer_createWithConfig.restype = IedServer
-
-    lib.IedServer_destroy.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_destroy.restype = None
-
-    lib.IedServer_addAccessPoint.argtypes = [
-        IedServer,  # IedServer self
-        c_char_p,  # const char* ipAddr
-        c_int,  # int tcpPort
-        TLSConfiguration,  # TLSConfiguration tlsConfiguration
-    ]
-    lib.IedServer_addAccessPoint.restype = c_bool
-
-    lib.IedServer_setLocalIpAddress.argtypes = [
-        IedServer,  # IedServer self
-        c_char_p,  # const char* localIpAddress
-    ]
-    lib.IedServer_setLocalIpAddress.restype = None
-
-    lib.IedServer_setServerIdentity.argtypes = [
-        IedServer,  # IedServer self
-        c_char_p,  # const char* vendor
-        c_char_p,  # const char* model
-        c_char_p,  # const char* revision
-    ]
-    lib.IedServer_setServerIdentity.restype = None
-
-    lib.IedServer_setFilestoreBasepath.argtypes = [
-        IedServer,  # IedServer self
-        c_char_p,  # const char* basepath
-    ]
-    lib.IedServer_setFilestoreBasepath.restype = None
-
-    lib.IedServer_setLogStorage.argtypes = [
-        IedServer,  # IedServer self
-        c_char_p,  # const char* logRef
-        LogStorage,  # LogStorage logStorage
-    ]
-    lib.IedServer_setLogStorage.restype = None
-
-    lib.IedServer_start.argtypes = [
-        IedServer,  # IedServer self
-        c_int,  # int tcpPort
-    ]
-    lib.IedServer_start.restype = None
-
-    lib.IedServer_stop.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_stop.restype = None
-
-    lib.IedServer_startThreadless.argtypes = [
-        IedServer,  # IedServer self
-        c_int,  # int tcpPort
-    ]
-    lib.IedServer_startThreadless.restype = None
-
-    lib.IedServer_waitReady.argtypes = [
-        IedServer,  # IedServer self
-        c_uint,  # unsigned int timeoutMs
-    ]
-    lib.IedServer_waitReady.restype = c_int
-
-    lib.IedServer_processIncomingData.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_processIncomingData.restype = None
-
-    lib.IedServer_performPeriodicTasks.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_performPeriodicTasks.restype = None
-
-    lib.IedServer_stopThreadless.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_stopThreadless.restype = None
-
-    lib.IedServer_getDataModel.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_getDataModel.restype = POINTER(IedModel)
-
-    lib.IedServer_isRunning.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_isRunning.restype = c_bool
-
-    lib.IedServer_getNumberOfOpenConnections.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_getNumberOfOpenConnections.restype = c_int
-
-    lib.IedServer_getMmsServer.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_getMmsServer.restype = MmsServer
-
-    lib.IedServer_enableGoosePublishing.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_enableGoosePublishing.restype = None
-
-    lib.IedServer_disableGoosePublishing.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_disableGoosePublishing.restype = None
-
-    lib.IedServer_setGooseInterfaceId.argtypes = [
-        IedServer,  # IedServer self
-        c_char_p,  # const char* interfaceId
-    ]
-    lib.IedServer_setGooseInterfaceId.restype = None
-
-    lib.IedServer_setGooseInterfaceIdEx.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(LogicalNode),  # LogicalNode* ln,
-        c_char_p,  #  const char* gcbName
-        c_char_p,  # const char* interfaceId
-    ]
-    lib.IedServer_setGooseInterfaceIdEx.restype = None
-
-    lib.IedServer_useGooseVlanTag.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(LogicalNode),  # LogicalNode* ln,
-        c_char_p,  #  const char* gcbName
-        c_bool,  # bool useVlanTag
-    ]
-    lib.IedServer_useGooseVlanTag.restype = None
-
-    lib.IedServer_setTimeQuality.argtypes = [
-        IedServer,  # IedServer self
-        c_bool,  # bool leapSecondKnown,
-        c_bool,  #  bool clockFailure,
-        c_bool,  # bool clockNotSynchronized,
-        c_int,  # int subsecondPrecision
-    ]
-    lib.IedServer_setTimeQuality.restype = None
-
-    lib.IedServer_setAuthenticator.argtypes = [
-        IedServer,  # IedServer self
-        AcseAuthenticator,  # AcseAuthenticator authenticator,
-        c_void_p,  # void* authenticatorParameter
-    ]
-    lib.IedServer_setAuthenticator.restype = None
-
-    lib.ClientConnection_getPeerAddress.argtypes = [
-        ClientConnection,  # ClientConnection self
-    ]
-    lib.ClientConnection_getPeerAddress.restype = c_char_p
-
-    lib.ClientConnection_getLocalAddress.argtypes = [
-        ClientConnection,  # ClientConnection self
-    ]
-    lib.ClientConnection_getLocalAddress.restype = c_char_p
-
-    lib.ClientConnection_getSecurityToken.argtypes = [
-        ClientConnection,  # ClientConnection self
-    ]
-    lib.ClientConnection_getSecurityToken.restype = c_void_p
-
-    lib.ClientConnection_abort.argtypes = [
-        ClientConnection,  # ClientConnection self
-    ]
-    lib.ClientConnection_abort.restype = c_bool
-
-    lib.ClientConnection_claimOwnership.argtypes = [
-        ClientConnection,  # ClientConnection self
-    ]
-    lib.ClientConnection_claimOwnership.restype = ClientConnection
-
-    lib.ClientConnection_release.argtypes = [
-        ClientConnection,  # ClientConnection self
-    ]
-    lib.ClientConnection_release.restype = None
-
-    lib.IedServer_setConnectionIndicationHandler.argtypes = [
-        IedServer,  # IedServer self
-        IedConnectionIndicationHandler,  # IedConnectionIndicationHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setConnectionIndicationHandler.restype = None
-
-    lib.IedServer_lockDataModel.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_lockDataModel.restype = None
-
-    lib.IedServer_unlockDataModel.argtypes = [
-        IedServer,  # IedServer self
-    ]
-    lib.IedServer_unlockDataModel.restype = None
-
-    lib.IedServer_getAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute
-    ]
-    lib.IedServer_getAttributeValue.restype = POINTER(MmsValue)
-
-    lib.IedServer_getBooleanAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  const DataAttribute* dataAttribute
-    ]
-    lib.IedServer_getBooleanAttributeValue.restype = c_bool
-
-    lib.IedServer_getInt32AttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  const DataAttribute* dataAttribute
-    ]
-    lib.IedServer_getInt32AttributeValue.restype = c_int32
-
-    lib.IedServer_getInt64AttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  const DataAttribute* dataAttribute
-    ]
-    lib.IedServer_getInt64AttributeValue.restype = c_int64
-
-    lib.IedServer_getUInt32AttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  const DataAttribute* dataAttribute
-    ]
-    lib.IedServer_getUInt32AttributeValue.restype = c_uint32
-
-    lib.IedServer_getFloatAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  const DataAttribute* dataAttribute
-    ]
-    lib.IedServer_getFloatAttributeValue.restype = c_float
-
-    lib.IedServer_getUTCTimeAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  const DataAttribute* dataAttribute
-    ]
-    lib.IedServer_getUTCTimeAttributeValue.restype = c_uint64
-
-    lib.IedServer_getBitStringAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  const DataAttribute* dataAttribute
-    ]
-    lib.IedServer_getBitStringAttributeValue.restype = c_uint32
-
-    lib.IedServer_getStringAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  const DataAttribute* dataAttribute
-    ]
-    lib.IedServer_getStringAttributeValue.restype = c_char_p
-
-    lib.IedServer_getFunctionalConstrainedData.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataObject),  #  DataObject* dataObject
-        FunctionalConstraint,  #  FunctionalConstraint fc
-    ]
-    lib.IedServer_getFunctionalConstrainedData.restype = POINTER(MmsValue)
-
-    lib.IedServer_updateAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute,
-        POINTER(MmsValue),  #  MmsValue* value
-    ]
-    lib.IedServer_updateAttributeValue.restype = None
-
-    lib.IedServer_updateFloatAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute,
-        c_float,  # float value
-    ]
-    lib.IedServer_updateFloatAttributeValue.restype = None
-
-    lib.IedServer_updateInt32AttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute,
-        c_int32,  # int32_t value
-    ]
-    lib.IedServer_updateInt32AttributeValue.restype = None
-
-    lib.IedServer_updateDbposValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute,
-        Dbpos,  # Dbpos value
-    ]
-    lib.IedServer_updateDbposValue.restype = None
-
-    lib.IedServer_updateInt64AttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute,
-        c_int64,  # int64_t value
-    ]
-    lib.IedServer_updateInt64AttributeValue.restype = None
-
-    lib.IedServer_updateUnsignedAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute,
-        c_uint32,  # uint32_t value
-    ]
-    lib.IedServer_updateUnsignedAttributeValue.restype = None
-
-    lib.IedServer_updateBitStringAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute,
-        c_uint32,  # uint32_t value
-    ]
-    lib.IedServer_updateBitStringAttributeValue.restype = None
-
-    lib.IedServer_updateBooleanAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute,
-        c_bool,  # bool value
-    ]
-    lib.IedServer_updateBooleanAttributeValue.restype = None
-
-    lib.IedServer_updateVisibleStringAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute,
-        c_char_p,  # char *value
-    ]
-    lib.IedServer_updateVisibleStringAttributeValue.restype = None
-
-    lib.IedServer_updateUTCTimeAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute,
-        c_uint64,  # uint64_t *value
-    ]
-    lib.IedServer_updateUTCTimeAttributeValue.restype = None
-
-    lib.IedServer_updateTimestampAttributeValue.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute,
-        POINTER(Timestamp),  # Timestamp* timestamp
-    ]
-    lib.IedServer_updateTimestampAttributeValue.restype = None
-
-    lib.IedServer_updateQuality.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataAttribute),  #  DataAttribute* dataAttribute,
-        Quality,  # Quality quality
-    ]
-    lib.IedServer_updateQuality.restype = None
-
-    lib.IedServer_changeActiveSettingGroup.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb,
-        c_uint8,  # uint8_t newActiveSg
-    ]
-    lib.IedServer_changeActiveSettingGroup.restype = None
-
-    lib.IedServer_getActiveSettingGroup.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb,
-    ]
-    lib.IedServer_getActiveSettingGroup.restype = c_uint8
-
-    lib.IedServer_setActiveSettingGroupChangedHandler.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb
-        ActiveSettingGroupChangedHandler,  # ActiveSettingGroupChangedHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setActiveSettingGroupChangedHandler.restype = None
-
-    lib.IedServer_setEditSettingGroupChangedHandler.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb
-        EditSettingGroupChangedHandler,  # EditSettingGroupChangedHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setEditSettingGroupChangedHandler.restype = None
-
-    lib.IedServer_setEditSettingGroupConfirmationHandler.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb
-        EditSettingGroupConfirmationHandler,  # EditSettingGroupConfirmationHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setEditSettingGroupConfirmationHandler.restype = None
-
-    lib.ControlAction_setError.argtypes = [
-        ControlAction,  # ControlAction self
-        ControlLastApplError,  # ControlLastApplError error
-    ]
-    lib.ControlAction_setError.restype = None
-
-    lib.ControlAction_setAddCause.argtypes = [
-        ControlAction,  # ControlAction self
-        ControlAddCause,  # ControlAddCause addCause
-    ]
-    lib.ControlAction_setAddCause.restype = None
-
-    lib.ControlAction_getOrCat.argtypes = [
-        ControlAction,  # ControlAction self
-    ]
-    lib.ControlAction_getOrCat.restype = c_int
-
-    lib.ControlAction_getOrIdent.argtypes = [
-        ControlAction,  # ControlAction self
-        POINTER(c_int),  # int* orIdentSize
-    ]
-    lib.ControlAction_getOrIdent.restype = POINTER(c_uint8)
-
-    lib.ControlAction_getCtlNum.argtypes = [
-        ControlAction,  # ControlAction self
-    ]
-    lib.ControlAction_getCtlNum.restype = c_int
-
-    lib.ControlAction_getSynchroCheck.argtypes = [
-        ControlAction,  # ControlAction self
-    ]
-    lib.ControlAction_getSynchroCheck.restype = c_bool
-
-    lib.ControlAction_getInterlockCheck.argtypes = [
-        ControlAction,  # ControlAction self
-    ]
-    lib.ControlAction_getInterlockCheck.restype = c_bool
-
-    lib.ControlAction_isSelect.argtypes = [
-        ControlAction,  # ControlAction self
-    ]
-    lib.ControlAction_isSelect.restype = c_bool
-
-    lib.ControlAction_getClientConnection.argtypes = [
-        ControlAction,  # ControlAction self
-    ]
-    lib.ControlAction_getClientConnection.restype = ClientConnection
-
-    lib.ControlAction_getControlObject.argtypes = [
-        ControlAction,  # ControlAction self
-    ]
-    lib.ControlAction_getControlObject.restype = POINTER(DataObject)
-
-    lib.ControlAction_getControlTime.argtypes = [
-        ControlAction,  # ControlAction self
-    ]
-    lib.ControlAction_getControlTime.restype = c_uint64
-
-    lib.ControlAction_getT.argtypes = [
-        ControlAction,  # ControlAction self
-    ]
-    lib.ControlAction_getT.restype = POINTER(Timestamp)
-
-    lib.IedServer_setControlHandler.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataObject),  # DataObject* node,
-        ControlHandler,  # ControlHandler handler,
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setControlHandler.restype = None
-
-    lib.IedServer_setPerformCheckHandler.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataObject),  # DataObject* node,
-        ControlPerformCheckHandler,  # ControlPerformCheckHandler handler,
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setPerformCheckHandler.restype = None
-
-    lib.IedServer_setWaitForExecutionHandler.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataObject),  # DataObject* node,
-        ControlWaitForExecutionHandler,  # ControlWaitForExecutionHandler handler,
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setWaitForExecutionHandler.restype = None
-
-    lib.IedServer_setSelectStateChangedHandler.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataObject),  # DataObject* node,
-        ControlSelectStateChangedHandler,  # ControlSelectStateChangedHandler handler,
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setSelectStateChangedHandler.restype = None
-
-    lib.IedServer_updateCtlModel.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(DataObject),  # DataObject* node,
-        ControlModel,  #  ControlModel value
-    ]
-    lib.IedServer_updateCtlModel.restype = None
-
-    lib.IedServer_setRCBEventHandler.argtypes = [
-        IedServer,  # IedServer self
-        ControlModel,  #  IedServer_RCBEventHandler handler
-        c_void_p,  # void * parameter,
-    ]
-    lib.IedServer_setRCBEventHandler.restype = None
-
-    lib.IedServer_setSVCBHandler.argtypes = [
-        IedServer,  # IedServer self
-        POINTER(SVControlBlock),  # SVControlBlock* svcb,
-        SVCBEventHandler,  #  SVCBEventHandler handler,
-        c_void_p,  #  void* parameter
-    ]
-    lib.IedServer_setSVCBHandler.restype = None
-
-    lib.IedServer_setGoCBHandler.argtypes = [
-        MmsGooseControlBlock,  # MmsGooseControlBlock self
-        GoCBEventHandler,  # GoCBEventHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setGoCBHandler.restype = None
-
-    lib.MmsGooseControlBlock_getName.argtypes = [
-        MmsGooseControlBlock,  # MmsGooseControlBlock self
-    ]
-    lib.MmsGooseControlBlock_getName.restype = c_char_p
-
-    lib.MmsGooseControlBlock_getLogicalNode.argtypes = [
-        MmsGooseControlBlock,  # MmsGooseControlBlock self
-    ]
-    lib.MmsGooseControlBlock_getLogicalNode.restype = POINTER(LogicalNode)
-
-    lib.MmsGooseControlBlock_getDataSet.argtypes = [
-        MmsGooseControlBlock,  # MmsGooseControlBlock self
-    ]
-    lib.MmsGooseControlBlock_getDataSet.restype = POINTER(DataSet)
-
-    lib.MmsGooseControlBlock_getGoEna.argtypes = [
-        MmsGooseControlBlock,  # MmsGooseControlBlock self
-    ]
-    lib.MmsGooseControlBlock_getGoEna.restype = c_bool
-
-    lib.MmsGooseControlBlock_getMinTime.argtypes = [
-        MmsGooseControlBlock,  # MmsGooseControlBlock self
-    ]
-    lib.MmsGooseControlBlock_getMinTime.restype = c_int
-
-    lib.MmsGooseControlBlock_getMaxTime.argtypes = [
-        MmsGooseControlBlock,  # MmsGooseControlBlock self
-    ]
-    lib.MmsGooseControlBlock_getMaxTime.restype = c_int
-
-    lib.MmsGooseControlBlock_getFixedOffs.argtypes = [
-        MmsGooseControlBlock,  # MmsGooseControlBlock self
-    ]
-    lib.MmsGooseControlBlock_getFixedOffs.restype = c_bool
+# The services reading and updating the value of a data attribute take its
+# address as an int, the wrappers give the address cached by the DataAttribute
+# instead of converting a POINTER(DataAttribute) on each update
+_DATA_ATTRIBUTE_ADDRESS = c_void_p
+
+# Signatures shared by many functions, the same tuple is given to each function
+_SIG_CONFIG = (IedServerConfig,)  # IedServerConfig self
+_SIG_CONFIG_ENABLE = _SIG_CONFIG + (c_bool,)  # bool enable
+_SIG_SERVER = (IedServer,)  # IedServer self
+_SIG_CLIENT_CONNECTION = (ClientConnection,)  # ClientConnection self
+_SIG_CONTROL_ACTION = (ControlAction,)  # ControlAction self
+_SIG_GOCB = (MmsGooseControlBlock,)  # MmsGooseControlBlock self
+_SIG_ATTRIBUTE = (
+    IedServer,  # IedServer self
+    _DATA_ATTRIBUTE_ADDRESS,  # DataAttribute* dataAttribute
+)
 
-    lib.MmsGooseControlBlock_getNdsCom.argtypes = [
-        MmsGooseControlBlock,  # MmsGooseControlBlock self
-    ]
-    lib.MmsGooseControlBlock_getNdsCom.restype = c_bool
 
+# (function name, argtypes, restype) of each prototype of the module
+_PROTOTYPES = (
+    ("IedServerConfig_create", (), IedServerConfig),
+    ("IedServerConfig_destroy", _SIG_CONFIG, None),
+    (
+        "IedServerConfig_setEdition",
+        (
+            IedServerConfig,  # IedServerConfig self
+            c_uint8,  # uint8_t edition
+        ),
+        None,
+    ),
+    ("IedServerConfig_getEdition", _SIG_CONFIG, c_uint8),
+    (
+        "IedServerConfig_setReportBufferSize",
+        (
+            IedServerConfig,  # IedServerConfig self
+            c_int,  # int reportBufferSize
+        ),
+        None,
+    ),
+    ("IedServerConfig_getReportBufferSize", _SIG_CONFIG, c_int),
+    (
+        "IedServerConfig_setReportBufferSizeForURCBs",
+        (
+            IedServerConfig,  # IedServerConfig self
+            c_int,  # int reportBufferSize
+        ),
+        None,
+    ),
+    ("IedServerConfig_getReportBufferSizeForURCBs", _SIG_CONFIG, c_int),
+    (
+        "IedServerConfig_setMaxMmsConnections",
+        (
+            IedServerConfig,  # IedServerConfig self
+            c_int,  # int maxConnections
+        ),
+        None,
+    ),
+    ("IedServerConfig_getMaxMmsConnections", _SIG_CONFIG, c_int),
+    ("IedServerConfig_setSyncIntegrityReportTimes", _SIG_CONFIG_ENABLE, None),
+    ("IedServerConfig_getSyncIntegrityReportTimes", _SIG_CONFIG, c_bool),
+    (
+        "IedServerConfig_setFileServiceBasePath",
+        (
+            IedServerConfig,  # IedServerConfig self
+            c_char_p,  # const char* basepath
+        ),
+        None,
+    ),
+    ("IedServerConfig_getFileServiceBasePath", _SIG_CONFIG, c_char_p),
+    ("IedServerConfig_enableFileService", _SIG_CONFIG_ENABLE, None),
+    ("IedServerConfig_isFileServiceEnabled", _SIG_CONFIG, c_bool),
+    ("IedServerConfig_enableDynamicDataSetService", _SIG_CONFIG_ENABLE, None),
+    ("IedServerConfig_isDynamicDataSetServiceEnabled", _SIG_CONFIG, c_bool),
+    (
+        "IedServerConfig_setMaxAssociationSpecificDataSets",
+        (
+            IedServerConfig,  # IedServerConfig self
+            c_int,  # int maxDataSets
+        ),
+        None,
+    ),
+    ("IedServerConfig_getMaxAssociationSpecificDataSets", _SIG_CONFIG, c_int),
+    (
+        "IedServerConfig_setMaxDomainSpecificDataSets",
+        (
+            IedServerConfig,  # IedServerConfig self
+            c_int,  # int maxDataSets
+        ),
+        None,
+    ),
+    ("IedServerConfig_getMaxDomainSpecificDataSets", _SIG_CONFIG, c_int),
+    (
+        "IedServerConfig_setMaxDataSetEntries",
+        (
+            IedServerConfig,  # IedServerConfig self
+            c_int,  # int maxDataSetEntries
+        ),
+        None,
+    ),
+    ("IedServerConfig_getMaxDatasSetEntries", _SIG_CONFIG, c_int),
+    ("IedServerConfig_enableLogService", _SIG_CONFIG_ENABLE, None),
+    ("IedServerConfig_enableEditSG", _SIG_CONFIG_ENABLE, None),
+    ("IedServerConfig_enableResvTmsForSGCB", _SIG_CONFIG_ENABLE, None),
+    ("IedServerConfig_enableResvTmsForBRCB", _SIG_CONFIG_ENABLE, None),
+    ("IedServerConfig_isResvTmsForBRCBEnabled", _SIG_CONFIG, c_bool),
+    ("IedServerConfig_enableOwnerForRCB", _SIG_CONFIG_ENABLE, None),
+    ("IedServerConfig_isOwnerForRCBEnabled", _SIG_CONFIG, c_bool),
+    ("IedServerConfig_useIntegratedGoosePublisher", _SIG_CONFIG_ENABLE, None),
+    ("IedServerConfig_isLogServiceEnabled", _SIG_CONFIG, c_bool),
+    (
+        "IedServerConfig_setReportSetting",
+        (
+            IedServerConfig,  # IedServerConfig self
+            c_uint8,  # uint8_t setting
+            c_bool,  # bool isDyn
+        ),
+        None,
+    ),
+    (
+        "IedServerConfig_getReportSetting",
+        (
+            IedServerConfig,  # IedServerConfig self
+            c_uint8,  # uint8_t setting
+        ),
+        c_bool,
+    ),
+    (
+        "IedServer_create",
+        (POINTER(IedModel),),  # IedModel* dataModel
+        IedServer,
+    ),
+    (
+        "IedServer_createWithTlsSupport",
+        (
+            POINTER(IedModel),  # IedModel* dataModel
+            TLSConfiguration,  # TLSConfiguration tlsConfiguration
+        ),
+        IedServer,
+    ),
+    (
+        "IedServer_createWithConfig",
+        (
+            POINTER(IedModel),  # IedModel* dataModel
+            TLSConfiguration,  # TLSConfiguration tlsConfiguration
+            IedServerConfig,  # IedServerConfig serverConfiguration
+        ),
+        IedServer,
+    ),
+    ("IedServer_destroy", _SIG_SERVER, None),
+    (
+        "IedServer_addAccessPoint",
+        (
+            IedServer,  # IedServer self
+            c_char_p,  # const char* ipAddr
+            c_int,  # int tcpPort
+            TLSConfiguration,  # TLSConfiguration tlsConfiguration
+        ),
+        c_bool,
+    ),
+    (
+        "IedServer_setLocalIpAddress",
+        (
+            IedServer,  # IedServer self
+            c_char_p,  # const char* localIpAddress
+        ),
+        None,
+    ),
+    (
+        "IedServer_setServerIdentity",
+        (
+            IedServer,  # IedServer self
+            c_char_p,  # const char* vendor
+            c_char_p,  # const char* model
+            c_char_p,  # const char* revision
+        ),
+        None,
+    ),
+    (
+        "IedServer_setFilestoreBasepath",
+        (
+            IedServer,  # IedServer self
+            c_char_p,  # const char* basepath
+        ),
+        None,
+    ),
+    (
+        "IedServer_setLogStorage",
+        (
+            IedServer,  # IedServer self
+            c_char_p,  # const char* logRef
+            LogStorage,  # LogStorage logStorage
+        ),
+        None,
+    ),
+    (
+        "IedServer_start",
+        (
+            IedServer,  # IedServer self
+            c_int,  # int tcpPort
+        ),
+        None,
+    ),
+    ("IedServer_stop", _SIG_SERVER, None),
+    (
+        "IedServer_startThreadless",
+        (
+            IedServer,  # IedServer self
+            c_int,  # int tcpPort
+        ),
+        None,
+    ),
+    (
+        "IedServer_waitReady",
+        (
+            IedServer,  # IedServer self
+            c_uint,  # unsigned int timeoutMs
+        ),
+        c_int,
+    ),
+    ("IedServer_processIncomingData", _SIG_SERVER, None),
+    ("IedServer_performPeriodicTasks", _SIG_SERVER, None),
+    ("IedServer_stopThreadless", _SIG_SERVER, None),
+    ("IedServer_getDataModel", _SIG_SERVER, POINTER(IedModel)),
+    ("IedServer_isRunning", _SIG_SERVER, c_bool),
+    ("IedServer_getNumberOfOpenConnections", _SIG_SERVER, c_int),
+    ("IedServer_getMmsServer", _SIG_SERVER, MmsServer),
+    ("IedServer_enableGoosePublishing", _SIG_SERVER, None),
+    ("IedServer_disableGoosePublishing", _SIG_SERVER, None),
+    (
+        "IedServer_setGooseInterfaceId",
+        (
+            IedServer,  # IedServer self
+            c_char_p,  # const char* interfaceId
+        ),
+        None,
+    ),
+    (
+        "IedServer_setGooseInterfaceIdEx",
+        (
+            IedServer,  # IedServer self
+            POINTER(LogicalNode),  # LogicalNode* ln,
+            c_char_p,  #  const char* gcbName
+            c_char_p,  # const char* interfaceId
+        ),
+        None,
+    ),
+    (
+        "IedServer_useGooseVlanTag",
+        (
+            IedServer,  # IedServer self
+            POINTER(LogicalNode),  # LogicalNode* ln,
+            c_char_p,  #  const char* gcbName
+            c_bool,  # bool useVlanTag
+        ),
+        None,
+    ),
+    (
+        "IedServer_setTimeQuality",
+        (
+            IedServer,  # IedServer self
+            c_bool,  # bool leapSecondKnown,
+            c_bool,  #  bool clockFailure,
+            c_bool,  # bool clockNotSynchronized,
+            c_int,  # int subsecondPrecision
+        ),
+        None,
+    ),
+    (
+        "IedServer_setAuthenticator",
+        (
+            IedServer,  # IedServer self
+            AcseAuthenticator,  # AcseAuthenticator authenticator,
+            c_void_p,  # void* authenticatorParameter
+        ),
+        None,
+    ),
+    ("ClientConnection_getPeerAddress", _SIG_CLIENT_CONNECTION, c_char_p),
+    ("ClientConnection_getLocalAddress", _SIG_CLIENT_CONNECTION, c_char_p),
+    ("ClientConnection_getSecurityToken", _SIG_CLIENT_CONNECTION, c_void_p),
+    ("ClientConnection_abort", _SIG_CLIENT_CONNECTION, c_bool),
+    ("ClientConnection_claimOwnership", _SIG_CLIENT_CONNECTION, ClientConnection),
+    ("ClientConnection_release", _SIG_CLIENT_CONNECTION, None),
+    (
+        "IedServer_setConnectionIndicationHandler",
+        (
+            IedServer,  # IedServer self
+            IedConnectionIndicationHandler,  # IedConnectionIndicationHandler handler
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    ("IedServer_lockDataModel", _SIG_SERVER, None),
+    ("IedServer_unlockDataModel", _SIG_SERVER, None),
+    ("IedServer_getAttributeValue", _SIG_ATTRIBUTE, POINTER(MmsValue)),
+    ("IedServer_getBooleanAttributeValue", _SIG_ATTRIBUTE, c_bool),
+    ("IedServer_getInt32AttributeValue", _SIG_ATTRIBUTE, c_int32),
+    ("IedServer_getInt64AttributeValue", _SIG_ATTRIBUTE, c_int64),
+    ("IedServer_getUInt32AttributeValue", _SIG_ATTRIBUTE, c_uint32),
+    ("IedServer_getFloatAttributeValue", _SIG_ATTRIBUTE, c_float),
+    ("IedServer_getUTCTimeAttributeValue", _SIG_ATTRIBUTE, c_uint64),
+    ("IedServer_getBitStringAttributeValue", _SIG_ATTRIBUTE, c_uint32),
+    ("IedServer_getStringAttributeValue", _SIG_ATTRIBUTE, c_char_p),
+    (
+        "IedServer_getFunctionalConstrainedData",
+        (
+            IedServer,  # IedServer self
+            POINTER(DataObject),  #  DataObject* dataObject
+            FunctionalConstraint,  #  FunctionalConstraint fc
+        ),
+        POINTER(MmsValue),
+    ),
+    (
+        "IedServer_updateAttributeValue",
+        _SIG_ATTRIBUTE + (POINTER(MmsValue),),  #  MmsValue* value
+        None,
+    ),
+    (
+        "IedServer_updateFloatAttributeValue",
+        _SIG_ATTRIBUTE + (c_float,),  # float value
+        None,
+    ),
+    (
+        "IedServer_updateInt32AttributeValue",
+        _SIG_ATTRIBUTE + (c_int32,),  # int32_t value
+        None,
+    ),
+    (
+        "IedServer_updateDbposValue",
+        _SIG_ATTRIBUTE + (Dbpos,),  # Dbpos value
+        None,
+    ),
+    (
+        "IedServer_updateInt64AttributeValue",
+        _SIG_ATTRIBUTE + (c_int64,),  # int64_t value
+        None,
+    ),
+    (
+        "IedServer_updateUnsignedAttributeValue",
+        _SIG_ATTRIBUTE + (c_uint32,),  # uint32_t value
+        None,
+    ),
+    (
+        "IedServer_updateBitStringAttributeValue",
+        _SIG_ATTRIBUTE + (c_uint32,),  # uint32_t value
+        None,
+    ),
+    (
+        "IedServer_updateBooleanAttributeValue",
+        _SIG_ATTRIBUTE + (c_bool,),  # bool value
+        None,
+    ),
+    (
+        "IedServer_updateVisibleStringAttributeValue",
+        _SIG_ATTRIBUTE + (c_char_p,),  # char *value
+        None,
+    ),
+    (
+        "IedServer_updateUTCTimeAttributeValue",
+        _SIG_ATTRIBUTE + (c_uint64,),  # uint64_t *value
+        None,
+    ),
+    (
+        "IedServer_updateTimestampAttributeValue",
+        _SIG_ATTRIBUTE + (POINTER(Timestamp),),  # Timestamp* timestamp
+        None,
+    ),
+    (
+        "IedServer_updateQuality",
+        _SIG_ATTRIBUTE + (Quality,),  # Quality quality
+        None,
+    ),
+    (
+        "IedServer_changeActiveSettingGroup",
+        (
+            IedServer,  # IedServer self
+            POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb,
+            c_uint8,  # uint8_t newActiveSg
+        ),
+        None,
+    ),
+    (
+        "IedServer_getActiveSettingGroup",
+        (
+            IedServer,  # IedServer self
+            POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb,
+        ),
+        c_uint8,
+    ),
+    (
+        "IedServer_setActiveSettingGroupChangedHandler",
+        (
+            IedServer,  # IedServer self
+            POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb
+            ActiveSettingGroupChangedHandler,  # ActiveSettingGroupChangedHandler handler
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_setEditSettingGroupChangedHandler",
+        (
+            IedServer,  # IedServer self
+            POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb
+            EditSettingGroupChangedHandler,  # EditSettingGroupChangedHandler handler
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_setEditSettingGroupConfirmationHandler",
+        (
+            IedServer,  # IedServer self
+            POINTER(SettingGroupControlBlock),  #  SettingGroupControlBlock* sgcb
+            EditSettingGroupConfirmationHandler,  # EditSettingGroupConfirmationHandler handler
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    (
+        "ControlAction_setError",
+        (
+            ControlAction,  # ControlAction self
+            ControlLastApplError,  # ControlLastApplError error
+        ),
+        None,
+    ),
+    (
+        "ControlAction_setAddCause",
+        (
+            ControlAction,  # ControlAction self
+            ControlAddCause,  # ControlAddCause addCause
+        ),
+        None,
+    ),
+    ("ControlAction_getOrCat", _SIG_CONTROL_ACTION, c_int),
+    (
+        "ControlAction_getOrIdent",
+        (
+            ControlAction,  # ControlAction self
+            POINTER(c_int),  # int* orIdentSize
+        ),
+        POINTER(c_uint8),
+    ),
+    ("ControlAction_getCtlNum", _SIG_CONTROL_ACTION, c_int),
+    ("ControlAction_getSynchroCheck", _SIG_CONTROL_ACTION, c_bool),
+    ("ControlAction_getInterlockCheck", _SIG_CONTROL_ACTION, c_bool),
+    ("ControlAction_isSelect", _SIG_CONTROL_ACTION, c_bool),
+    ("ControlAction_getClientConnection", _SIG_CONTROL_ACTION, ClientConnection),
+    ("ControlAction_getControlObject", _SIG_CONTROL_ACTION, POINTER(DataObject)),
+    ("ControlAction_getControlTime", _SIG_CONTROL_ACTION, c_uint64),
+    ("ControlAction_getT", _SIG_CONTROL_ACTION, POINTER(Timestamp)),
+    (
+        "IedServer_setControlHandler",
+        (
+            IedServer,  # IedServer self
+            POINTER(DataObject),  # DataObject* node,
+            ControlHandler,  # ControlHandler handler,
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_setPerformCheckHandler",
+        (
+            IedServer,  # IedServer self
+            POINTER(DataObject),  # DataObject* node,
+            ControlPerformCheckHandler,  # ControlPerformCheckHandler handler,
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_setWaitForExecutionHandler",
+        (
+            IedServer,  # IedServer self
+            POINTER(DataObject),  # DataObject* node,
+            ControlWaitForExecutionHandler,  # ControlWaitForExecutionHandler handler,
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_setSelectStateChangedHandler",
+        (
+            IedServer,  # IedServer self
+            POINTER(DataObject),  # DataObject* node,
+            ControlSelectStateChangedHandler,  # ControlSelectStateChangedHandler handler,
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_updateCtlModel",
+        (
+            IedServer,  # IedServer self
+            POINTER(DataObject),  # DataObject* node,
+            ControlModel,  #  ControlModel value
+        ),
+        None,
+    ),
+    (
+        "IedServer_setRCBEventHandler",
+        (
+            IedServer,  # IedServer self
+            ControlModel,  #  IedServer_RCBEventHandler handler
+            c_void_p,  # void * parameter,
+        ),
+        None,
+    ),
+    (
+        "IedServer_setSVCBHandler",
+        (
+            IedServer,  # IedServer self
+            POINTER(SVControlBlock),  # SVControlBlock* svcb,
+            SVCBEventHandler,  #  SVCBEventHandler handler,
+            c_void_p,  #  void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_setGoCBHandler",
+        (
+            MmsGooseControlBlock,  # MmsGooseControlBlock self
+            GoCBEventHandler,  # GoCBEventHandler handler
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    ("MmsGooseControlBlock_getName", _SIG_GOCB, c_char_p),
+    ("MmsGooseControlBlock_getLogicalNode", _SIG_GOCB, POINTER(LogicalNode)),
+    ("MmsGooseControlBlock_getDataSet", _SIG_GOCB, POINTER(DataSet)),
+    ("MmsGooseControlBlock_getGoEna", _SIG_GOCB, c_bool),
+    ("MmsGooseControlBlock_getMinTime", _SIG_GOCB, c_int),
+    ("MmsGooseControlBlock_getMaxTime", _SIG_GOCB, c_int),
+    ("MmsGooseControlBlock_getFixedOffs", _SIG_GOCB, c_bool),
+    ("MmsGooseControlBlock_getNdsCom", _SIG_GOCB, c_bool),
     # /***************************************************************************
     #  * Access control
     #  **************************************************************************/
+    (
+        "IedServer_handleWriteAccess",
+        (
+            IedServer,  # IedServer self,
+            POINTER(DataAttribute),  # DataAttribute* dataAttribute,
+            WriteAccessHandler,  # WriteAccessHandler handler,
+            c_void_p,  #  void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_handleWriteAccessForComplexAttribute",
+        (
+            IedServer,  # IedServer self,
+            POINTER(DataAttribute),  # DataAttribute* dataAttribute,
+            WriteAccessHandler,  # WriteAccessHandler handler,
+            c_void_p,  #  void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_handleWriteAccessForDataObject",
+        (
+            IedServer,  # IedServer self,
+            POINTER(DataObject),  # DataObject* dataObject,
+            FunctionalConstraint,  # FunctionalConstraint fc,
+            WriteAccessHandler,  # WriteAccessHandler handler,
+            c_void_p,  #  void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_setWriteAccessPolicy",
+        (
+            IedServer,  # IedServer self,
+            FunctionalConstraint,  #  FunctionalConstraint fc
+            AccessPolicy,  # AccessPolicy policy
+        ),
+        None,
+    ),
+    (
+        "IedServer_setReadAccessHandler",
+        (
+            IedServer,  # IedServer self,
+            ReadAccessHandler,  #  ReadAccessHandler handler
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_setDirectoryAccessHandler",
+        (
+            IedServer,  # IedServer self,
+            IedServer_DirectoryAccessHandler,  #  IedServer_DirectoryAccessHandler handler
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_setListObjectsAccessHandler",
+        (
+            IedServer,  # IedServer self,
+            IedServer_ListObjectsAccessHandler,  #  IedServer_ListObjectsAccessHandler handler
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_setControlBlockAccessHandler",
+        (
+            IedServer,  # IedServer self,
+            IedServer_ControlBlockAccessHandler,  #  IedServer_ControlBlockAccessHandler handler
+            c_void_p,  # void* parameter
+        ),
+        None,
+    ),
+    (
+        "IedServer_ignoreReadAccess",
+        (
+            IedServer,  # IedServer self,
+            c_bool,  # bool ignore
+        ),
+        None,
+    ),
+)
 
-    lib.IedServer_handleWriteAccess.argtypes = [
-        IedServer,  # IedServer self,
-        POINTER(DataAttribute),  # DataAttribute* dataAttribute,
-        WriteAccessHandler,  # WriteAccessHandler handler,
-        c_void_p,  #  void* parameter
-    ]
-    lib.IedServer_handleWriteAccess.restype = None
-
-    lib.IedServer_handleWriteAccessForComplexAttribute.argtypes = [
-        IedServer,  # IedServer self,
-        POINTER(DataAttribute),  # DataAttribute* dataAttribute,
-        WriteAccessHandler,  # WriteAccessHandler handler,
-        c_void_p,  #  void* parameter
-    ]
-    lib.IedServer_handleWriteAccessForComplexAttribute.restype = None
-
-    lib.IedServer_handleWriteAccessForDataObject.argtypes = [
-        IedServer,  # IedServer self,
-        POINTER(DataObject),  # DataObject* dataObject,
-        FunctionalConstraint,  # FunctionalConstraint fc,
-        WriteAccessHandler,  # WriteAccessHandler handler,
-        c_void_p,  #  void* parameter
-    ]
-    lib.IedServer_handleWriteAccessForDataObject.restype = None
 
-    lib.IedServer_setWriteAccessPolicy.argtypes = [
-        IedServer,  # IedServer self,
-        FunctionalConstraint,  #  FunctionalConstraint fc
-        AccessPolicy,  # AccessPolicy policy
-    ]
-    lib.IedServer_setWriteAccessPolicy.restype = None
+# Accessors of the configuration, of the client connections and of the
+# control actions, they only touch memory of the object and never block, so
+# there is no need to release the GIL while calling them. The services of
+# the server lock the data model and stay releasing the GIL, a thread of the
+# server may be waiting for the GIL while holding the data model lock.
+_ACCESSORS = accessor_names(
+    _PROTOTYPES,
+    r"(IedServerConfig|ControlAction)_(get|is|set|enable|use)|ClientConnection_get",
+)
 
-    lib.IedServer_setReadAccessHandler.argtypes = [
-        IedServer,  # IedServer self,
-        ReadAccessHandler,  #  ReadAccessHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setReadAccessHandler.restype = None
 
-    lib.IedServer_setDirectoryAccessHandler.argtypes = [
-        IedServer,  # IedServer self,
-        IedServer_DirectoryAccessHandler,  #  IedServer_DirectoryAccessHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setDirectoryAccessHandler.restype = None
+def setup_prototypes(lib: Library):
+    """Add prototypes definition to the lib
 
-    lib.IedServer_setListObjectsAccessHandler.argtypes = [
-        IedServer,  # IedServer self,
-        IedServer_ListObjectsAccessHandler,  #  IedServer_ListObjectsAccessHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setListObjectsAccessHandler.restype = None
+    Apart from the accessors, the functions release the GIL during the
+    call, see :meth:`Library.defer_prototypes`.
+    """
+    lib.defer_prototypes(_PROTOTYPES, accessors=_ACCESSORS)
 
-    lib.IedServer_setControlBlockAccessHandler.argtypes = [
-        IedServer,  # IedServer self,
-        IedServer_ControlBlockAccessHandler,  #  IedServer_ControlBlockAccessHandler handler
-        c_void_p,  # void* parameter
-    ]
-    lib.IedServer_setControlBlockAccessHandler.restype = None
 
-    lib.IedServer_ignoreReadAccess.argtypes = [
-        IedServer,  # IedServer self,
-        c_bool,  # bool ignore
-    ]
-    lib.IedServer_ignoreReadAccess.restype = None
+# Expose the server functions of the loaded library as module attributes
+__getattr__ = module_getattr(globals(), _PROTOTYPES)
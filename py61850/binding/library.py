@@ -0,0 +1,145 @@
+"""Shared library with prototypes configured on first use"""
+
+import re
+from collections.abc import Callable, Container, Iterable
+from ctypes import (
+    _FUNCFLAG_USE_ERRNO,
+    _FUNCFLAG_USE_LASTERROR,
+    CDLL,
+    CFUNCTYPE,
+    PYFUNCTYPE,
+)
+
+
+class Library(CDLL):
+    """``CDLL`` able to defer the prototype definition of its functions
+
+    Prototypes registered with ``defer_prototypes`` are only applied
+    when the function is accessed for the first time. The function is
+    then instantiated from a ``CFUNCTYPE`` prototype, which ctypes
+    caches per signature, so functions sharing the same argtypes also
+    share the same prototype. Once the function has been accessed, it
+    is cached as an attribute of the instance and ``__getattr__`` is
+    not called anymore.
+
+    The ``use_errno`` and ``use_last_error`` flags of the library are
+    given to the prototypes, so errno is only saved around the calls when
+    it was requested.
+    """
+
+    def __init__(self, name: str, **kwargs) -> None:
+        super().__init__(name, **kwargs)
+        self._deferred_prototypes: dict[str, tuple] = {}
+
+    def defer_prototypes(
+        self,
+        prototypes,
+        release_gil: bool = True,
+        accessors: Container[str] = frozenset(),
+    ):
+        """Register prototypes to apply on first access
+
+        Parameters
+        ----------
+        prototypes : Iterable[tuple[str, tuple, Any]]
+            (function name, argtypes, restype) of each prototype
+        release_gil : bool, optional
+            Whether the GIL is released during the call, by default True.
+            It can be kept for functions which only read memory and never
+            block, the call then skips the release and acquire of the GIL.
+        accessors : Container[str], optional
+            Names of the functions keeping the GIL whatever ``release_gil``,
+            see :func:`accessor_names`
+        """
+        for name, argtypes, restype in prototypes:
+            function_type = CFUNCTYPE if release_gil and name not in accessors else PYFUNCTYPE
+            self._deferred_prototypes[name] = (function_type, argtypes, restype)
+
+    def __getattr__(self, name: str):
+        # The prototype is only removed once the function is set, so a thread
+        # accessing the function meanwhile never gets an untyped function
+        prototype = self._deferred_prototypes.get(name)
+        if prototype is None:
+            return super().__getattr__(name)
+        function_type, argtypes, restype = prototype
+        if function_type is CFUNCTYPE:
+            function_type = CFUNCTYPE(
+                restype,
+                *argtypes,
+                use_errno=bool(self._FuncPtr._flags_ & _FUNCFLAG_USE_ERRNO),
+                use_last_error=bool(self._FuncPtr._flags_ & _FUNCFLAG_USE_LASTERROR),
+            )
+        else:
+            function_type = function_type(restype, *argtypes)
+        function = function_type((name, self))
+        setattr(self, name, function)
+        self._deferred_prototypes.pop(name, None)
+        return function
+
+
+def accessor_names(prototypes: Iterable[tuple], pattern: str) -> frozenset[str]:
+    """Names of the prototypes matching ``pattern``
+
+    Used to select the accessors given to :meth:`Library.defer_prototypes`.
+
+    Parameters
+    ----------
+    prototypes : Iterable[tuple[str, tuple, Any]]
+        (function name, argtypes, restype) of each prototype
+    pattern : str
+        Regular expression matched at the start of the function names
+
+    Returns
+    -------
+    frozenset[str]
+        Names of the matching functions
+    """
+    return frozenset(name for name, _, _ in prototypes if re.match(pattern, name))
+
+
+def _loaded_library() -> Library:
+    # Imported here, the loader imports the binding modules
+    from .loader import Wrapper
+
+    return Wrapper.lib
+
+
+def module_getattr(
+    module_globals: dict,
+    prototypes: Iterable[tuple],
+    lib_getter: Callable[[], Library] = _loaded_library,
+) -> Callable[[str], object]:
+    """Build the ``__getattr__`` of a binding module (PEP 562)
+
+    The functions of ``prototypes`` are exposed as module attributes. A
+    function is looked up in the library (and its prototype applied) on
+    the first access only, it is then kept in the module globals.
+
+    >>> __getattr__ = module_getattr(globals(), _PROTOTYPES)
+
+    Parameters
+    ----------
+    module_globals : dict
+        Globals of the binding module
+    prototypes : Iterable[tuple[str, tuple, Any]]
+        (function name, argtypes, restype) of each prototype of the module
+    lib_getter : Callable[[], Library], optional
+        Return the library holding the functions, by default the library
+        of the loader
+
+    Returns
+    -------
+    Callable[[str], object]
+        ``__getattr__`` function of the module
+    """
+    names = frozenset(name for name, _, _ in prototypes)
+    module_name = module_globals["__name__"]
+
+    def __getattr__(name: str):
+        if name not in names:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        function = getattr(lib_getter(), name)
+        module_globals[name] = function
+        return function
+
+    return __getattr__
@@ -1,5 +1,4 @@
 import sys
-from ctypes import CDLL, cdll
 
 from .common import linked_list
 from .iec61850 import (
@@ -11,11 +10,15 @@ from .iec61850 import (
     model,
     server,
 )
-from .mms import mms_value
+from .library import Library
+from .mms import mms_type_spec, mms_value
 
 
 class _Wrapper:
 
+    lib: Library
+    """Shared library, loaded with the default name on first access"""
+
     def __init__(self) -> None:
         self._libiec61850 = None
 
@@ -35,7 +38,9 @@ class _Wrapper:
         if name is None:
             name = "./libiec61850.so" if sys.platform != "win32" else "./iec61850.dll"
 
-        _libiec61850 = cdll.LoadLibrary(name)
+        # The library does not report errors through errno, there is no
+        # need to save it around each call
+        _libiec61850 = Library(name, use_errno=False, use_last_error=False)
 
         # Common
         linked_list.setup_prototypes(_libiec61850)
@@ -48,15 +53,20 @@ class _Wrapper:
         model.setup_prototypes(_libiec61850)
         server.setup_prototypes(_libiec61850)
         # MMS
+        mms_type_spec.setup_prototypes(_libiec61850)
         mms_value.setup_prototypes(_libiec61850)
 
         self._libiec61850 = _libiec61850
+        # Plain instance attribute, every C call goes through it so it is
+        # found directly in the instance dict instead of calling a property
+        self.lib = _libiec61850
 
-    @property
-    def lib(self) -> CDLL:
-        if self._libiec61850 is None:
-            self.load_library()
-        return self._libiec61850  # type:ignore
+    def __getattr__(self, name: str):
+        # Only called while the library is not loaded yet
+        if name != "lib":
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        self.load_library()
+        return self.lib
 
 
 Wrapper = _Wrapper()
@@ -0,0 +1,35 @@
+"""Module for C binding with mms/inc/mms_type_spec.h"""
+
+from ctypes import POINTER, c_char_p
+
+from ..library import Library
+from .mms_value import MmsType, MmsVariableSpecification
+
+_P_VARIABLE_SPECIFICATION = POINTER(MmsVariableSpecification)
+
+# (function name, argtypes, restype) of each prototype of the module
+_PROTOTYPES = (
+    (
+        "MmsVariableSpecification_destroy",
+        (_P_VARIABLE_SPECIFICATION,),  # MmsVariableSpecification* typeSpec
+        None,
+    ),
+    (
+        "MmsVariableSpecification_getNamedVariableRecursive",
+        (
+            _P_VARIABLE_SPECIFICATION,  # MmsVariableSpecification* variable
+            c_char_p,  # const char* nameId
+        ),
+        _P_VARIABLE_SPECIFICATION,
+    ),
+    (
+        "MmsVariableSpecification_getType",
+        (_P_VARIABLE_SPECIFICATION,),  # MmsVariableSpecification* self
+        MmsType,
+    ),
+)
+
+
+def setup_prototypes(lib: Library):
+    """Add prototypes definition to the lib"""
+    lib.defer_prototypes(_PROTOTYPES)
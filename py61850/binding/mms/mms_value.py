@@ -1,7 +1,6 @@
 """Module for C binding with mms/inc/mms_value.h"""
 
 from ctypes import (
-    CDLL,
     POINTER,
     Structure,
     c_bool,
@@ -19,6 +18,8 @@ from ctypes import (
     c_uint64,
 )
 
+from ..library import Library, accessor_names, module_getattr
+
 
 class sMmsValue(Structure): ...
 
@@ -32,247 +33,289 @@ MmsType = c_int
 MmsDataAccessError = c_int
 
 
-def setup_prototypes(lib: CDLL):
+# (function name, argtypes, restype) of each prototype of the module
+_PROTOTYPES = (
     ####################################################
     # Array functions
     ####################################################
-    lib.MmsValue_createArray.argtypes = [
-        POINTER(MmsVariableSpecification),  # const MmsVariableSpecification* elementType
-        c_int,  #  int size
-    ]
-    lib.MmsValue_createArray.restype = POINTER(MmsValue)
-
-    lib.MmsValue_getArraySize.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* array
-    ]
-    lib.MmsValue_getArraySize.restype = c_uint32
-
-    lib.MmsValue_getElement.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* array
-        c_int,  #  index
-    ]
-    lib.MmsValue_getElement.restype = POINTER(MmsValue)
-
-    lib.MmsValue_createEmptyArray.argtypes = [
-        c_int,  # int size
-    ]
-    lib.MmsValue_createEmptyArray.restype = POINTER(MmsValue)
-
-    lib.MmsValue_setElement.argtypes = [
-        POINTER(MmsValue),  # MmsValue* complexValue
-        c_int,  # int index
-        POINTER(MmsValue),  # MmsValue* elementValue
-    ]
-    lib.MmsValue_setElement.restype = None
-
+    (
+        "MmsValue_createArray",
+        (
+            POINTER(MmsVariableSpecification),  # const MmsVariableSpecification* elementType
+            c_int,  #  int size
+        ),
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_getArraySize",
+        (POINTER(MmsValue),),  # const MmsValue* array
+        c_uint32,
+    ),
+    (
+        "MmsValue_getElement",
+        (
+            POINTER(MmsValue),  # const MmsValue* array
+            c_int,  #  index
+        ),
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_createEmptyArray",
+        (c_int,),  # int size
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_setElement",
+        (
+            POINTER(MmsValue),  # MmsValue* complexValue
+            c_int,  # int index
+            POINTER(MmsValue),  # MmsValue* elementValue
+        ),
+        None,
+    ),
     ####################################################
     #  Basic type functions
     ####################################################
-
-    lib.MmsValue_getDataAccessError.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-    ]
-    lib.MmsValue_getDataAccessError.restype = MmsDataAccessError
-
-    lib.MmsValue_toInt64.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-    ]
-    lib.MmsValue_toInt64.restype = c_int64
-
-    lib.MmsValue_toInt32.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* value
-    ]
-    lib.MmsValue_toInt32.restype = c_int32
-
-    lib.MmsValue_toUint32.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* value
-    ]
-    lib.MmsValue_toUint32.restype = c_uint32
-
-    lib.MmsValue_toDouble.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* value
-    ]
-    lib.MmsValue_toDouble.restype = c_double
-
-    lib.MmsValue_toFloat.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* value
-    ]
-    lib.MmsValue_toFloat.restype = c_float
-
-    lib.MmsValue_toUnixTimestamp.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* value
-    ]
-    lib.MmsValue_toUnixTimestamp.restype = c_uint32
-
-    lib.MmsValue_setFloat.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_float,  # float newFloatValue
-    ]
-    lib.MmsValue_setFloat.restype = None
-
-    lib.MmsValue_setDouble.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_double,  # double newFloatValue
-    ]
-    lib.MmsValue_setDouble.restype = None
-
-    lib.MmsValue_setInt8.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_int8,  # int8_t integer
-    ]
-    lib.MmsValue_setInt8.restype = None
-
-    lib.MmsValue_setInt16.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_int16,  # int16_t integer
-    ]
-    lib.MmsValue_setInt16.restype = None
-
-    lib.MmsValue_setInt32.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_int32,  # int32_t integer
-    ]
-    lib.MmsValue_setInt32.restype = None
-
-    lib.MmsValue_setInt64.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_int64,  # int64_t integer
-    ]
-    lib.MmsValue_setInt64.restype = None
-
-    lib.MmsValue_setUint8.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_uint8,  # uint8_t integer
-    ]
-    lib.MmsValue_setUint8.restype = None
-
-    lib.MmsValue_setUint16.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_uint16,  # uint16_t integer
-    ]
-    lib.MmsValue_setUint16.restype = None
-
-    lib.MmsValue_setUint32.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_uint32,  # uint32_t integer
-    ]
-    lib.MmsValue_setUint32.restype = None
-
-    lib.MmsValue_setBoolean.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_bool,  # bool boolValue
-    ]
-    lib.MmsValue_setBoolean.restype = None
-
-    lib.MmsValue_getBoolean.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* value
-    ]
-    lib.MmsValue_getBoolean.restype = bool
-
-    lib.MmsValue_toString.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-    ]
-    lib.MmsValue_toString.restype = c_char_p
-
-    lib.MmsValue_getStringSize.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-    ]
-    lib.MmsValue_getStringSize.restype = c_int
-
-    lib.MmsValue_setVisibleString.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_char_p,  # const char* string
-    ]
-    lib.MmsValue_setVisibleString.restype = None
-
-    lib.MmsValue_setBitStringBit.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_int,  # int bitPos
-        c_bool,  # bool value
-    ]
-    lib.MmsValue_setBitStringBit.restype = None
-
-    lib.MmsValue_getBitStringBit.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-        c_int,  # int bitPos
-    ]
-    lib.MmsValue_getBitStringBit.restype = c_bool
-
-    lib.MmsValue_deleteAllBitStringBits.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-    ]
-    lib.MmsValue_deleteAllBitStringBits.restype = None
-
-    lib.MmsValue_getBitStringSize.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* array
-    ]
-    lib.MmsValue_getBitStringSize.restype = c_int
-
-    lib.MmsValue_getBitStringByteSize.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-    ]
-    lib.MmsValue_getBitStringByteSize.restype = c_int
-
-    lib.MmsValue_getNumberOfSetBits.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-    ]
-    lib.MmsValue_getNumberOfSetBits.restype = c_int
-
-    lib.MmsValue_setAllBitStringBits.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-    ]
-    lib.MmsValue_setAllBitStringBits.restype = None
-
-    lib.MmsValue_getBitStringAsInteger.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-    ]
-    lib.MmsValue_getBitStringAsInteger.restype = c_uint32
-
-    lib.MmsValue_setBitStringFromInteger.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_uint32,  # uint32_t intValue
-    ]
-    lib.MmsValue_setBitStringFromInteger.restype = None
-
-    lib.MmsValue_getBitStringAsIntegerBigEndian.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-    ]
-    lib.MmsValue_getBitStringAsIntegerBigEndian.restype = c_uint32
-
-    lib.MmsValue_setBitStringFromIntegerBigEndian.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_uint32,  # uint32_t intValue
-    ]
-    lib.MmsValue_setBitStringFromIntegerBigEndian.restype = None
-
-    lib.MmsValue_setUtcTime.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_uint32,  # uint32_t timeval
-    ]
-    lib.MmsValue_setUtcTime.restype = POINTER(MmsValue)
-
-    lib.MmsValue_setUtcTimeMs.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_uint64,  # uint64_t timeval
-    ]
-    lib.MmsValue_setUtcTimeMs.restype = POINTER(MmsValue)
-
-    lib.MmsValue_setUtcTimeByBuffer.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        POINTER(c_uint8),  # const uint8_t* buffer
-    ]
-    lib.MmsValue_setUtcTimeByBuffer.restype = None
-
-    lib.MmsValue_getUtcTimeBuffer.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-    ]
-    lib.MmsValue_getUtcTimeBuffer.restype = c_uint8
-
-    lib.MmsValue_getUtcTimeInMs.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-    ]
-    lib.MmsValue_getUtcTimeInMs.restype = c_uint64
-
+    (
+        "MmsValue_getDataAccessError",
+        (POINTER(MmsValue),),  # const MmsValue* self
+        MmsDataAccessError,
+    ),
+    (
+        "MmsValue_toInt64",
+        (POINTER(MmsValue),),  # const MmsValue* self
+        c_int64,
+    ),
+    (
+        "MmsValue_toInt32",
+        (POINTER(MmsValue),),  # const MmsValue* value
+        c_int32,
+    ),
+    (
+        "MmsValue_toUint32",
+        (POINTER(MmsValue),),  # const MmsValue* value
+        c_uint32,
+    ),
+    (
+        "MmsValue_toDouble",
+        (POINTER(MmsValue),),  # const MmsValue* value
+        c_double,
+    ),
+    (
+        "MmsValue_toFloat",
+        (POINTER(MmsValue),),  # const MmsValue* value
+        c_float,
+    ),
+    (
+        "MmsValue_toUnixTimestamp",
+        (POINTER(MmsValue),),  # const MmsValue* value
+        c_uint32,
+    ),
+    (
+        "MmsValue_setFloat",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_float,  # float newFloatValue
+        ),
+        None,
+    ),
+    (
+        "MmsValue_setDouble",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_double,  # double newFloatValue
+        ),
+        None,
+    ),
+    (
+        "MmsValue_setInt8",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_int8,  # int8_t integer
+        ),
+        None,
+    ),
+    (
+        "MmsValue_setInt16",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_int16,  # int16_t integer
+        ),
+        None,
+    ),
+    (
+        "MmsValue_setInt32",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_int32,  # int32_t integer
+        ),
+        None,
+    ),
+    (
+        "MmsValue_setInt64",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_int64,  # int64_t integer
+        ),
+        None,
+    ),
+    (
+        "MmsValue_setUint8",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_uint8,  # uint8_t integer
+        ),
+        None,
+    ),
+    (
+        "MmsValue_setUint16",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_uint16,  # uint16_t integer
+        ),
+        None,
+    ),
+    (
+        "MmsValue_setUint32",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_uint32,  # uint32_t integer
+        ),
+        None,
+    ),
+    (
+        "MmsValue_setBoolean",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_bool,  # bool boolValue
+        ),
+        None,
+    ),
+    (
+        "MmsValue_getBoolean",
+        (POINTER(MmsValue),),  # const MmsValue* value
+        bool,
+    ),
+    (
+        "MmsValue_toString",
+        (POINTER(MmsValue),),  # const MmsValue* self
+        c_char_p,
+    ),
+    (
+        "MmsValue_getStringSize",
+        (POINTER(MmsValue),),  # MmsValue* self
+        c_int,
+    ),
+    (
+        "MmsValue_setVisibleString",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_char_p,  # const char* string
+        ),
+        None,
+    ),
+    (
+        "MmsValue_setBitStringBit",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_int,  # int bitPos
+            c_bool,  # bool value
+        ),
+        None,
+    ),
+    (
+        "MmsValue_getBitStringBit",
+        (
+            POINTER(MmsValue),  # const MmsValue* self
+            c_int,  # int bitPos
+        ),
+        c_bool,
+    ),
+    (
+        "MmsValue_deleteAllBitStringBits",
+        (POINTER(MmsValue),),  # const MmsValue* self
+        None,
+    ),
+    (
+        "MmsValue_getBitStringSize",
+        (POINTER(MmsValue),),  # const MmsValue* array
+        c_int,
+    ),
+    (
+        "MmsValue_getBitStringByteSize",
+        (POINTER(MmsValue),),  # const MmsValue* self
+        c_int,
+    ),
+    (
+        "MmsValue_getNumberOfSetBits",
+        (POINTER(MmsValue),),  # const MmsValue* self
+        c_int,
+    ),
+    (
+        "MmsValue_setAllBitStringBits",
+        (POINTER(MmsValue),),  # MmsValue* self
+        None,
+    ),
+    (
+        "MmsValue_getBitStringAsInteger",
+        (POINTER(MmsValue),),  # const MmsValue* self
+        c_uint32,
+    ),
+    (
+        "MmsValue_setBitStringFromInteger",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_uint32,  # uint32_t intValue
+        ),
+        None,
+    ),
+    (
+        "MmsValue_getBitStringAsIntegerBigEndian",
+        (POINTER(MmsValue),),  # const MmsValue* self
+        c_uint32,
+    ),
+    (
+        "MmsValue_setBitStringFromIntegerBigEndian",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_uint32,  # uint32_t intValue
+        ),
+        None,
+    ),
+    (
+        "MmsValue_setUtcTime",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_uint32,  # uint32_t timeval
+        ),
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_setUtcTimeMs",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_uint64,  # uint64_t timeval
+        ),
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_setUtcTimeByBuffer",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            POINTER(c_uint8),  # const uint8_t* buffer
+        ),
+        None,
+    ),
+    (
+        "MmsValue_getUtcTimeBuffer",
+        (POINTER(MmsValue),),  # MmsValue* self
+        c_uint8,
+    ),
+    (
+        "MmsValue_getUtcTimeInMs",
+        (POINTER(MmsValue),),  # MmsValue* self
+        c_uint64,
+    ),
     # /**
     #  * \brief Get a millisecond time value and optional us part from an MmsValue object of MMS_UTCTIME type.
     #  *
@@ -283,7 +326,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API uint64_t
     # MmsValue_getUtcTimeInMsWithUs(const MmsValue* self, uint32_t* usec);
-
     # /**
     #  * \brief set the TimeQuality byte of the UtcTime
     #  *
@@ -299,7 +341,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API void
     # MmsValue_setUtcTimeQuality(MmsValue* self, uint8_t timeQuality);
-
     # /**
     #  * \brief Update an MmsValue object of type MMS_UTCTIME with a millisecond time.
     #  *
@@ -318,12 +359,11 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API MmsValue*
     # MmsValue_setUtcTimeMsEx(MmsValue* self, uint64_t timeval, uint8_t timeQuality);
-
-    lib.MmsValue_getUtcTimeQuality.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-    ]
-    lib.MmsValue_getUtcTimeQuality.restype = c_uint8
-
+    (
+        "MmsValue_getUtcTimeQuality",
+        (POINTER(MmsValue),),  # const MmsValue* self
+        c_uint8,
+    ),
     # /**
     #  * \brief Update an MmsValue object of type MMS_BINARYTIME with a millisecond time.
     #  *
@@ -332,12 +372,11 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API void
     # MmsValue_setBinaryTime(MmsValue* self, uint64_t timestamp);
-
-    lib.MmsValue_getBinaryTimeAsUtcMs.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-    ]
-    lib.MmsValue_getBinaryTimeAsUtcMs.restype = c_uint64
-
+    (
+        "MmsValue_getBinaryTimeAsUtcMs",
+        (POINTER(MmsValue),),  # const MmsValue* self
+        c_uint64,
+    ),
     # /**
     #  * \brief Set the value of an MmsValue object of type MMS_OCTET_STRING.
     #  *
@@ -351,7 +390,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API void
     # MmsValue_setOctetString(MmsValue* self, const uint8_t* buf, int size);
-
     # /**
     #  * \brief Set a single octet of an MmsValue object of type MMS_OCTET_STRING.
     #  *
@@ -366,130 +404,135 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API void
     # MmsValue_setOctetStringOctet(MmsValue* self, int octetPos, uint8_t value);
-
-    lib.MmsValue_getOctetStringSize.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* array
-    ]
-    lib.MmsValue_getOctetStringSize.restype = c_uint16
-
-    lib.MmsValue_getOctetStringMaxSize.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-    ]
-    lib.MmsValue_getOctetStringMaxSize.restype = c_uint16
-
-    lib.MmsValue_getOctetStringBuffer.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-    ]
-    lib.MmsValue_getOctetStringBuffer.restype = POINTER(c_uint8)
-
-    lib.MmsValue_getOctetStringOctet.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        c_int,  # int octetPos
-    ]
-    lib.MmsValue_getOctetStringOctet.restype = c_uint8
-
-    lib.MmsValue_update.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-        POINTER(MmsValue),  # onst MmsValue* source
-    ]
-    lib.MmsValue_update.restype = c_bool
-
-    lib.MmsValue_equals.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-        POINTER(MmsValue),  # const MmsValue* otherValue
-    ]
-    lib.MmsValue_equals.restype = c_bool
-
-    lib.MmsValue_equalTypes.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-        POINTER(MmsValue),  # const MmsValue* otherValue
-    ]
-    lib.MmsValue_equalTypes.restype = c_bool
-
+    (
+        "MmsValue_getOctetStringSize",
+        (POINTER(MmsValue),),  # const MmsValue* array
+        c_uint16,
+    ),
+    (
+        "MmsValue_getOctetStringMaxSize",
+        (POINTER(MmsValue),),  # MmsValue* self
+        c_uint16,
+    ),
+    (
+        "MmsValue_getOctetStringBuffer",
+        (POINTER(MmsValue),),  # MmsValue* self
+        POINTER(c_uint8),
+    ),
+    (
+        "MmsValue_getOctetStringOctet",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            c_int,  # int octetPos
+        ),
+        c_uint8,
+    ),
+    (
+        "MmsValue_update",
+        (
+            POINTER(MmsValue),  # MmsValue* self
+            POINTER(MmsValue),  # onst MmsValue* source
+        ),
+        c_bool,
+    ),
+    (
+        "MmsValue_equals",
+        (
+            POINTER(MmsValue),  # const MmsValue* self
+            POINTER(MmsValue),  # const MmsValue* otherValue
+        ),
+        c_bool,
+    ),
+    (
+        "MmsValue_equalTypes",
+        (
+            POINTER(MmsValue),  # const MmsValue* self
+            POINTER(MmsValue),  # const MmsValue* otherValue
+        ),
+        c_bool,
+    ),
     ####################################################
     #  * Constructors and destructors
     ####################################################
-
     # LIB61850_API MmsValue*
     # MmsValue_newDataAccessError(MmsDataAccessError accessError);
-
-    lib.MmsValue_newInteger.argtypes = [
-        c_int,  # int size
-    ]
-    lib.MmsValue_newInteger.restype = POINTER(MmsValue)
-
-    lib.MmsValue_newUnsigned.argtypes = [
-        c_int,  # int size
-    ]
-    lib.MmsValue_newUnsigned.restype = POINTER(MmsValue)
-
-    lib.MmsValue_newBoolean.argtypes = [
-        c_bool,  # bool boolean
-    ]
-    lib.MmsValue_newBoolean.restype = POINTER(MmsValue)
-
-    lib.MmsValue_newBitString.argtypes = [
-        c_int,  # int bitSize
-    ]
-    lib.MmsValue_newBitString.restype = POINTER(MmsValue)
-
-    lib.MmsValue_newOctetString.argtypes = [
-        c_int,  # int bitSize
-        c_int,  # int maxSize
-    ]
-    lib.MmsValue_newOctetString.restype = POINTER(MmsValue)
-
+    (
+        "MmsValue_newInteger",
+        (c_int,),  # int size
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_newUnsigned",
+        (c_int,),  # int size
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_newBoolean",
+        (c_bool,),  # bool boolean
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_newBitString",
+        (c_int,),  # int bitSize
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_newOctetString",
+        (
+            c_int,  # int bitSize
+            c_int,  # int maxSize
+        ),
+        POINTER(MmsValue),
+    ),
     # LIB61850_API MmsValue*
     # MmsValue_newStructure(const MmsVariableSpecification* typeSpec);
-
-    lib.MmsValue_createEmptyStructure.argtypes = [
-        c_int,  # int size
-    ]
-    lib.MmsValue_createEmptyStructure.restype = POINTER(MmsValue)
-
+    (
+        "MmsValue_createEmptyStructure",
+        (c_int,),  # int size
+        POINTER(MmsValue),
+    ),
     # LIB61850_API MmsValue*
     # MmsValue_newDefaultValue(const MmsVariableSpecification* typeSpec);
-
-    lib.MmsValue_newIntegerFromInt8.argtypes = [
-        c_int8,  # int8_t integer
-    ]
-    lib.MmsValue_newIntegerFromInt8.restype = POINTER(MmsValue)
-
-    lib.MmsValue_newIntegerFromInt16.argtypes = [
-        c_int16,  # int16_t integer
-    ]
-    lib.MmsValue_newIntegerFromInt16.restype = POINTER(MmsValue)
-
-    lib.MmsValue_newIntegerFromInt32.argtypes = [
-        c_int32,  # int32_t integer
-    ]
-    lib.MmsValue_newIntegerFromInt32.restype = POINTER(MmsValue)
-
-    lib.MmsValue_newIntegerFromInt64.argtypes = [
-        c_int64,  # int64_t integer
-    ]
-    lib.MmsValue_newIntegerFromInt64.restype = POINTER(MmsValue)
-
-    lib.MmsValue_newUnsignedFromUint32.argtypes = [
-        c_uint32,  # uint32_t integer
-    ]
-    lib.MmsValue_newUnsignedFromUint32.restype = POINTER(MmsValue)
-
-    lib.MmsValue_newFloat.argtypes = [
-        c_float,  # float value
-    ]
-    lib.MmsValue_newFloat.restype = POINTER(MmsValue)
-
-    lib.MmsValue_newDouble.argtypes = [
-        c_double,  # double value
-    ]
-    lib.MmsValue_newDouble.restype = POINTER(MmsValue)
-
-    lib.MmsValue_clone.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* self
-    ]
-    lib.MmsValue_clone.restype = POINTER(MmsValue)
-
+    (
+        "MmsValue_newIntegerFromInt8",
+        (c_int8,),  # int8_t integer
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_newIntegerFromInt16",
+        (c_int16,),  # int16_t integer
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_newIntegerFromInt32",
+        (c_int32,),  # int32_t integer
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_newIntegerFromInt64",
+        (c_int64,),  # int64_t integer
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_newUnsignedFromUint32",
+        (c_uint32,),  # uint32_t integer
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_newFloat",
+        (c_float,),  # float value
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_newDouble",
+        (c_double,),  # double value
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_clone",
+        (POINTER(MmsValue),),  # const MmsValue* self
+        POINTER(MmsValue),
+    ),
     # /**
     #  * \brief Create a (deep) copy of an MmsValue instance in a user provided buffer
     #  *
@@ -502,7 +545,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API uint8_t*
     # MmsValue_cloneToBuffer(const MmsValue* self, uint8_t* destinationAddress);
-
     # /**
     #  * \brief Determine the required amount of bytes by a clone.
     #  *
@@ -515,12 +557,11 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API int
     # MmsValue_getSizeInMemory(const MmsValue* self);
-
-    lib.MmsValue_delete.argtypes = [
-        POINTER(MmsValue),  # MmsValue* self
-    ]
-    lib.MmsValue_delete.restype = None
-
+    (
+        "MmsValue_delete",
+        (POINTER(MmsValue),),  # MmsValue* self
+        None,
+    ),
     # /**
     #  * \brief Delete an MmsValue instance.
     #  *
@@ -535,20 +576,11 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API void
     # MmsValue_deleteConditional(MmsValue* value);
-
-    # /**
-    #  * \brief Create a new MmsValue instance of type MMS_VISIBLE_STRING.
-    #  *
-    #  * This function will allocate as much memory as required to hold the string and sets the maximum size of
-    #  * the string to this size.
-    #  *
-    #  * \param string a text string that should be the value of the new instance of NULL for an empty string.
-    #  *
-    #  * \return new MmsValue instance of type MMS_VISIBLE_STRING
-    #  */
-    # LIB61850_API MmsValue*
-    # MmsValue_newVisibleString(const char* string);
-
+    (
+        "MmsValue_newVisibleString",
+        (c_char_p,),  # const char* string
+        POINTER(MmsValue),
+    ),
     # /**
     #  * \brief Create a new MmsValue instance of type MMS_VISIBLE_STRING.
     #  *
@@ -562,17 +594,16 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API MmsValue*
     # MmsValue_newVisibleStringWithSize(int size);
-
-    lib.MmsValue_newMmsStringWithSize.argtypes = [
-        c_int,  # int size
-    ]
-    lib.MmsValue_newMmsStringWithSize.restype = POINTER(MmsValue)
-
-    lib.MmsValue_newBinaryTime.argtypes = [
-        c_bool,  # bool timeOfDay
-    ]
-    lib.MmsValue_newBinaryTime.restype = POINTER(MmsValue)
-
+    (
+        "MmsValue_newMmsStringWithSize",
+        (c_int,),  # int size
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_newBinaryTime",
+        (c_bool,),  # bool timeOfDay
+        POINTER(MmsValue),
+    ),
     # /**
     #  * \brief Create a new MmsValue instance of type MMS_VISIBLE_STRING from the specified byte array
     #  *
@@ -583,7 +614,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API MmsValue*
     # MmsValue_newVisibleStringFromByteArray(const uint8_t* byteArray, int size);
-
     # /**
     #  * \brief Create a new MmsValue instance of type MMS_STRING from the specified byte array
     #  *
@@ -594,7 +624,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API MmsValue*
     # MmsValue_newMmsStringFromByteArray(const uint8_t* byteArray, int size);
-
     # /**
     #  * \brief Create a new MmsValue instance of type MMS_STRING.
     #  *
@@ -604,7 +633,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API MmsValue*
     # MmsValue_newMmsString(const char* string);
-
     # /**
     #  * \brief Set the value of MmsValue instance of type MMS_STRING
     #  *
@@ -612,23 +640,20 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API void
     # MmsValue_setMmsString(MmsValue* value, const char* string);
-
-    lib.MmsValue_newUtcTime.argtypes = [
-        c_uint32,  # uint32_t timeval
-    ]
-    lib.MmsValue_newUtcTime.restype = POINTER(MmsValue)
-
-    lib.MmsValue_newUtcTimeByMsTime.argtypes = [
-        c_uint64,  # uint64_t timeval
-    ]
-    lib.MmsValue_newUtcTimeByMsTime.restype = POINTER(MmsValue)
-
+    (
+        "MmsValue_newUtcTime",
+        (c_uint32,),  # uint32_t timeval
+        POINTER(MmsValue),
+    ),
+    (
+        "MmsValue_newUtcTimeByMsTime",
+        (c_uint64,),  # uint64_t timeval
+        POINTER(MmsValue),
+    ),
     # LIB61850_API void
     # MmsValue_setDeletable(MmsValue* self);
-
     # LIB61850_API void
     # MmsValue_setDeletableRecursive(MmsValue* value);
-
     # /**
     #  * \brief Check if the MmsValue instance has the deletable flag set.
     #  *
@@ -642,7 +667,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API int
     # MmsValue_isDeletable(MmsValue* self);
-
     # /**
     #  * \brief Get the MmsType of an MmsValue instance
     #  *
@@ -650,12 +674,11 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API MmsType
     # MmsValue_getType(const MmsValue* self);
-
-    lib.MmsValue_getType.argtypes = [
-        POINTER(MmsValue),  # const MmsValue* array
-    ]
-    lib.MmsValue_getType.restype = MmsType
-
+    (
+        "MmsValue_getType",
+        (POINTER(MmsValue),),  # const MmsValue* array
+        MmsType,
+    ),
     # /**
     #  * \brief Get a sub-element of a MMS_STRUCTURE value specified by a path name.
     #  *
@@ -667,7 +690,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API MmsValue*
     # MmsValue_getSubElement(MmsValue* self, MmsVariableSpecification* varSpec, char* mmsPath);
-
     # /**
     #  * \brief return the value type as a human readable string
     #  *
@@ -677,7 +699,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API const char*
     # MmsValue_getTypeString(MmsValue* self);
-
     # /**
     #  * \brief create a string representation of the MmsValue object in the provided buffer
     #  *
@@ -692,7 +713,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API const char*
     # MmsValue_printToBuffer(const MmsValue* self, char* buffer, int bufferSize);
-
     # /**
     #  * \brief create a new MmsValue instance from a BER encoded MMS Data element (deserialize)
     #  *
@@ -707,7 +727,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API MmsValue*
     # MmsValue_decodeMmsData(uint8_t* buffer, int bufPos, int bufferLength, int* endBufPos);
-
     # /**
     #  * \brief create a new MmsValue instance from a BER encoded MMS Data element (deserialize) with a defined maximum recursion depth
     #  *
@@ -721,7 +740,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API MmsValue*
     # MmsValue_decodeMmsDataMaxRecursion(uint8_t* buffer, int bufPos, int bufferLength, int* endBufPos, int maxDepth);
-
     # /**
     #  * \brief Serialize the MmsValue instance as BER encoded MMS Data element
     #  *
@@ -735,7 +753,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API int
     # MmsValue_encodeMmsData(MmsValue* self, uint8_t* buffer, int bufPos, bool encode);
-
     # /**
     #  * \brief Get the maximum possible BER encoded size of the MMS data element
     #  *
@@ -745,7 +762,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API int
     # MmsValue_getMaxEncodedSize(MmsValue* self);
-
     # /**
     #  * \brief Calculate the maximum encoded size of a variable of this type
     #  *
@@ -753,7 +769,6 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API int
     # MmsVariableSpecification_getMaxEncodedSize(MmsVariableSpecification* self);
-
     # /**
     #  * \brief Convert an MmsError to a string
     #  *
@@ -763,3 +778,22 @@ def setup_prototypes(lib: CDLL):
     #  */
     # LIB61850_API const char*
     # MmsError_toString(MmsError err);
+)
+
+
+# Walk of the arrays and structures, they only read memory of the value and
+# never block, so there is no need to release the GIL while calling them
+_ACCESSORS = accessor_names(_PROTOTYPES, r"MmsValue_(getArraySize|getElement|getType)$")
+
+
+def setup_prototypes(lib: Library):
+    """Add prototypes definition to the lib
+
+    Apart from the accessors, the functions release the GIL during the
+    call, see :meth:`Library.defer_prototypes`.
+    """
+    lib.defer_prototypes(_PROTOTYPES, accessors=_ACCESSORS)
+
+
+# Expose the MmsValue functions of the loaded library as module attributes
+__getattr__ = module_getattr(globals(), _PROTOTYPES)
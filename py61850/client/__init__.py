@@ -3,13 +3,20 @@
 This module contains all class and function to implement an IEC61850 client.
 """
 
+from typing import TYPE_CHECKING
+
 from .connection import IedConnection, IedConnectionException
 from .control import ControlObject
 from .dataset import DataSet
 from .enums import IedClientError, IedConnectionState
 from .report import ReasonForInclusion, Report, ReportControlBlock
 
+if TYPE_CHECKING:
+    from .batch import IedBatch
+
 __all__ = [
+    # batch
+    "IedBatch",
     # connection
     "IedConnection",
     "IedConnectionException",
@@ -25,3 +32,13 @@ __all__ = [
     "Report",
     "ReportControlBlock",
 ]
+
+
+def __getattr__(name: str):
+    # IedBatch brings concurrent.futures and its C handlers, it is only
+    # imported when used
+    if name == "IedBatch":
+        from .batch import IedBatch
+
+        return IedBatch
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
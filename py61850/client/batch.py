@@ -0,0 +1,277 @@
+"""Pipelined read and write of data attributes and data sets on client side"""
+
+import itertools
+import threading
+import time
+from concurrent.futures import Future, wait
+
+from ..binding.iec61850 import client as _client
+from ..binding.iec61850.client import (
+    IedConnection_GenericServiceHandler,
+    IedConnection_ReadDataSetHandler,
+    IedConnection_ReadObjectHandler,
+)
+from ..common import FunctionalConstraint, MmsValue
+from ..common.common import _FC_C_VALUES
+from ..helper import convert_to_bytes
+from .connection import IedConnection, IedConnectionException, _error_buffer
+from .dataset import DataSet
+from .enums import IedClientError
+
+# Requests waiting for an answer, of all the batches. The C handlers are
+# shared, the key given as parameter of the request finds the future back.
+_inflight: dict[int, tuple[Future, MmsValue | DataSet | None, threading.Semaphore | None]] = {}
+# Value of the requests which timed out, their future is already resolved
+# but the C request still refers to the value until its answer arrives
+_timed_out: dict[int, MmsValue | DataSet | None] = {}
+# Moves a request from _inflight to _timed_out without an answer in between
+_lock = threading.Lock()
+_keys = itertools.count(1)
+
+
+def _complete(key: int, error: int, result: MmsValue | DataSet | None = None):
+    with _lock:
+        entry = _inflight.pop(key, None)
+        if entry is None:
+            # The request timed out, the value can be released now
+            _timed_out.pop(key, None)
+            return
+    future, _, slots = entry
+    if slots is not None:
+        slots.release()
+    if error != IedClientError.OK.value:
+        future.set_exception(IedConnectionException("Request failed", IedClientError(error)))
+    else:
+        future.set_result(result)
+
+
+def _on_read(invoke_id: int, parameter: int, error: int, value_ptr):
+    result = MmsValue(value_ptr, True) if value_ptr else None
+    _complete(parameter, error, result)
+
+
+def _on_write(invoke_id: int, parameter: int, error: int):
+    _complete(parameter, error)
+
+
+def _on_dataset(invoke_id: int, parameter: int, error: int, dataset_handle: int):
+    # The values are updated in place, the future gets the DataSet of the request
+    entry = _inflight.get(parameter)
+    _complete(parameter, error, entry[1] if entry is not None else None)
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """Time left before the deadline, None when there is no deadline"""
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0)
+
+
+# Created once for the module, they stay valid for answers arriving after
+# the batch which sent the request has been garbage collected
+_READ_HANDLER = IedConnection_ReadObjectHandler(_on_read)
+_WRITE_HANDLER = IedConnection_GenericServiceHandler(_on_write)
+_DATASET_HANDLER = IedConnection_ReadDataSetHandler(_on_dataset)
+
+
+class IedBatch:
+    """Group read and write requests to send them without waiting each answer
+
+    The requests are queued with ``queue_read``, ``queue_write`` and
+    ``queue_dataset_update`` and sent by ``flush`` with the asynchronous services of the connection. Up to
+    ``max_inflight`` requests are waiting for an answer at the same time, so
+    reading N data attributes does not cost N round-trips anymore.
+
+    The answers are handled by the thread of the connection, the returned
+    futures are resolved from this thread.
+
+    >>> batch = IedBatch(ied_connection)
+    >>> stval = batch.queue_read("simpleIOGenericIO/GGIO1.Ind1.stVal", FunctionalConstraint.ST)
+    >>> mag = batch.queue_read("simpleIOGenericIO/GGIO1.AnIn1.mag.f", FunctionalConstraint.MX)
+    >>> batch.flush()
+    >>> stval.result().get_value(), mag.result().get_value()
+    (False, 0.0)
+    """
+
+    def __init__(self, connection: IedConnection) -> None:
+        self._connection = connection
+        self._queued: list[
+            tuple[bytes, FunctionalConstraint | None, MmsValue | DataSet | None, Future]
+        ] = []
+
+    def queue_read(self, object_reference: str | bytes, fc: FunctionalConstraint) -> Future:
+        """Queue the read of a functional constrained data attribute (FCDA).
+
+        Parameters
+        ----------
+        object_reference : str | bytes
+            Reference of the data attribute to read
+        fc : FunctionalConstraint
+            Functional constraint of the data attribute to read
+
+        Returns
+        -------
+        Future
+            Future resolved with the read ``MmsValue`` once the batch is
+            flushed, or with an ``IedConnectionException``
+        """
+        future: Future = Future()
+        self._queued.append((convert_to_bytes(object_reference), fc, None, future))
+        return future
+
+    def queue_write(
+        self, object_reference: str | bytes, fc: FunctionalConstraint, value: MmsValue
+    ) -> Future:
+        """Queue the write of a functional constrained data attribute (FCDA).
+
+        Parameters
+        ----------
+        object_reference : str | bytes
+            Reference of the data attribute to write
+        fc : FunctionalConstraint
+            Functional constraint of the data attribute to write
+        value : MmsValue
+            Value to write
+
+        Returns
+        -------
+        Future
+            Future resolved with ``None`` once the value is written, or with
+            an ``IedConnectionException``
+        """
+        future: Future = Future()
+        self._queued.append((convert_to_bytes(object_reference), fc, value, future))
+        return future
+
+    def queue_dataset_update(self, dataset: DataSet) -> Future:
+        """Queue the update of the values stored in a data set.
+
+        Parameters
+        ----------
+        dataset : DataSet
+            Data set to update, its values are updated in place
+
+        Returns
+        -------
+        Future
+            Future resolved with ``dataset`` once its values are updated, or
+            with an ``IedConnectionException``
+        """
+        future: Future = Future()
+        self._queued.append((dataset.reference, None, dataset, future))
+        return future
+
+    def flush(self, max_inflight: int = 32, timeout: float | None = None) -> list[Future]:
+        """Send the queued requests and wait for all the answers.
+
+        The number of outstanding calls negotiated by the connection must
+        not be lower than ``max_inflight``, see
+        ``IedConnection.set_max_outstanding_calls``.
+
+        Parameters
+        ----------
+        max_inflight : int, optional
+            Maximum number of requests waiting for an answer, by default 32
+        timeout : float | None, optional
+            Maximum time in seconds to send the requests and wait for the
+            answers, by default None. When it expires, the requests not sent
+            yet or still waiting for an answer are resolved with an
+            ``IedConnectionException``. The value of a request still waiting
+            is kept until its answer arrives, the C request refers to it.
+
+        Returns
+        -------
+        list[Future]
+            Futures of the queued requests, in the order they were queued
+        """
+        queued, self._queued = self._queued, []
+        deadline = None if timeout is None else time.monotonic() + timeout
+        slots = threading.Semaphore(max_inflight)
+        keys = []
+        for object_reference, fc, value, future in queued:
+            if not slots.acquire(timeout=_remaining(deadline)):
+                break
+            keys.append(self._send(object_reference, fc, value, future, slots))
+        futures = [future for _, _, _, future in queued]
+        wait(futures[: len(keys)], _remaining(deadline))
+
+        for key in keys:
+            # The answer may arrive meanwhile, only one of them gets the entry
+            with _lock:
+                entry = _inflight.pop(key, None)
+                if entry is not None:
+                    _timed_out[key] = entry[1]
+            if entry is not None:
+                entry[0].set_exception(
+                    IedConnectionException("Request timed out", IedClientError.TIMEOUT)
+                )
+        for future in futures[len(keys) :]:
+            future.set_exception(
+                IedConnectionException("Request not sent", IedClientError.TIMEOUT)
+            )
+        return futures
+
+    def submit_read(self, object_reference: str | bytes, fc: FunctionalConstraint) -> Future:
+        """Send the read of a FCDA right away, without waiting for the answer.
+
+        Parameters
+        ----------
+        object_reference : str | bytes
+            Reference of the data attribute to read
+        fc : FunctionalConstraint
+            Functional constraint of the data attribute to read
+
+        Returns
+        -------
+        Future
+            Future resolved with the read ``MmsValue``, or with an
+            ``IedConnectionException``
+        """
+        future: Future = Future()
+        self._send(convert_to_bytes(object_reference), fc, None, future, None)
+        return future
+
+    def _send(
+        self,
+        object_reference: bytes,
+        fc: FunctionalConstraint | None,
+        value: MmsValue | DataSet | None,
+        future: Future,
+        slots: threading.Semaphore | None,
+    ) -> int:
+        key = next(_keys)
+        # The value is kept until the answer, the C request refers to it
+        _inflight[key] = (future, value, slots)
+
+        _error, _error_ref = _error_buffer()
+        if isinstance(value, DataSet):
+            _client.IedConnection_readDataSetValuesAsync(
+                self._connection.handle,
+                _error_ref,
+                object_reference,
+                value.handle,
+                _DATASET_HANDLER,
+                key,
+            )
+        elif value is None:
+            _client.IedConnection_readObjectAsync(
+                self._connection.handle,
+                _error_ref,
+                object_reference,
+                _FC_C_VALUES[fc],
+                _READ_HANDLER,
+                key,
+            )
+        else:
+            _client.IedConnection_writeObjectAsync(
+                self._connection.handle,
+                _error_ref,
+                object_reference,
+                _FC_C_VALUES[fc],
+                value.handle,
+                _WRITE_HANDLER,
+                key,
+            )
+        if _error.value != IedClientError.OK.value:
+            _complete(key, error=_error.value)
+        return key
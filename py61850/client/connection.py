@@ -1,10 +1,12 @@
 """Represent function on client side"""
 
 import ctypes
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterable
 from ctypes import byref, c_bool
 from typing import TYPE_CHECKING
 
+from ..binding.iec61850 import client as _client
 from ..binding.iec61850.client import IedClientError as _cIedClientError
 from ..binding.iec61850.client import (
     IedClientGetFileHandler,
@@ -14,7 +16,6 @@ from ..binding.iec61850.client import (
 )
 from ..binding.iec61850.client import sClientGooseControlBlock as _sClientGooseControlBlock
 from ..binding.iec61850.client import sClientReportControlBlock as _sClientReportControlBlock
-from ..binding.loader import Wrapper
 from ..common import (
     ACSIClass,
     ControlAddCause,
@@ -27,6 +28,7 @@ from ..common import (
     ReportTriggerOptions,
     Timestamp,
 )
+from ..common.common import _FC_C_VALUES
 from ..helper import convert_to_bytes
 from .control import ControlObject
 from .dataset import DataSet
@@ -37,12 +39,41 @@ from .goose import GooseControlBlock
 from .report import Report, ReportControlBlock
 
 if TYPE_CHECKING:
+    from .batch import IedBatch
+
     GooseControlBlockPointer = ctypes._Pointer[_sClientGooseControlBlock]  # type: ignore
     ReportControlBlockPointer = ctypes._Pointer[_sClientReportControlBlock]  # type: ignore
 else:
     GooseControlBlockPointer = ctypes.POINTER(_sClientGooseControlBlock)
     ReportControlBlockPointer = ctypes.POINTER(_sClientReportControlBlock)
 
+# Value of IedClientError.OK, compared with the raw error code filled by the C
+# functions so that the enum is only built when there is an error
+_IED_CLIENT_ERROR_OK = IedClientError.OK.value
+
+# Outstanding calls proposed by libiec61850 at association when they are not
+# changed (CONFIG_DEFAULT_MAX_SERV_OUTSTANDING_CALLING)
+_DEFAULT_MAX_OUTSTANDING_CALLS = 5
+
+_error_buffers = threading.local()
+
+
+def _error_buffer():
+    """Return the IedClientError buffer of the current thread and its reference
+
+    The buffer is reused by all the calls made from a thread instead of
+    allocating a new ``c_int`` and ``byref`` on each call. It is reset to
+    an unknown error before being returned.
+    """
+    try:
+        error, error_ref = _error_buffers.value
+    except AttributeError:
+        error = _cIedClientError(99)
+        error_ref = byref(error)
+        _error_buffers.value = (error, error_ref)
+    error.value = 99
+    return error, error_ref
+
 
 class IedConnectionException(Exception):
     def __init__(self, message: str, error_code: IedClientError, *args: object) -> None:
@@ -73,13 +104,20 @@ class IedConnection:
     """Represent a connection to an IED"""
 
     def __init__(self):
-        self._handle = Wrapper.lib.IedConnection_create()
+        self._handle = _client.IedConnection_create()
         self._state_changed_handler = None
         self._connection_closed_handler = None
-        self._report_handlers = {}
+        self._report_handlers: dict[bytes, tuple[Callable, ReportCallbackFunction]] = {}
+        self._async_batch: "IedBatch | None" = None
+        self._max_outstanding_calls = _DEFAULT_MAX_OUTSTANDING_CALLS
 
     def __del__(self):
-        Wrapper.lib.IedConnection_destroy(self._handle)
+        _client.IedConnection_destroy(self._handle)
+
+    @property
+    def handle(self):
+        """Pointer to the underlying C structure"""
+        return self._handle
 
     ####################################################
     # Association service
@@ -88,19 +126,17 @@ class IedConnection:
     def connect(self, hostname: str | bytes = b"localhost", port: int = 102):
         """Connect to the specified address"""
         hostname = convert_to_bytes(hostname)
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_connect(self._handle, byref(_error), hostname, port)
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Connect command ", error)
+        _error, _error_ref = _error_buffer()
+        _client.IedConnection_connect(self._handle, _error_ref, hostname, port)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Connect command ", IedClientError(_error.value))
 
     def abort(self):
         """Abort the connection."""
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_abort(self._handle, byref(_error))
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Abort command ", error)
+        _error, _error_ref = _error_buffer()
+        _client.IedConnection_abort(self._handle, _error_ref)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Abort command ", IedClientError(_error.value))
 
     def release(self):
         """Release the connection.
@@ -108,11 +144,11 @@ class IedConnection:
         To be sure that the connection will be close the close or abort
         methods should be used.
         """
-        Wrapper.lib.IedConnection_release(self._handle)
+        _client.IedConnection_release(self._handle)
 
     def close(self):
         """Close the connection"""
-        Wrapper.lib.IedConnection_close(self._handle)
+        _client.IedConnection_close(self._handle)
 
     def set_connect_timeout(self, timeout: int):
         """set the connect timeout in ms
@@ -122,7 +158,22 @@ class IedConnection:
         timeout : int
             Timeout in ms
         """
-        Wrapper.lib.IedConnection_setConnectTimeout(self._handle, timeout)
+        _client.IedConnection_setConnectTimeout(self._handle, timeout)
+
+    def set_max_outstanding_calls(self, calling: int, called: int):
+        """Set the maximum number of outstanding calls proposed at association
+
+        It has to be called before ``connect``.
+
+        Parameters
+        ----------
+        calling : int
+            Maximum number of outstanding calls of the client
+        called : int
+            Maximum number of outstanding calls of the server
+        """
+        _client.IedConnection_setMaxOutstandingCalls(self._handle, calling, called)
+        self._max_outstanding_calls = calling
 
     @property
     def status(self) -> IedConnectionState:
@@ -133,7 +184,7 @@ class IedConnection:
         IedConnectionState
             State of the connection
         """
-        return IedConnectionState(Wrapper.lib.IedConnection_getState(self._handle))
+        return IedConnectionState(_client.IedConnection_getState(self._handle))
 
     def get_last_appl_error(self) -> LastApplError:
         """Get the last received control application error
@@ -143,7 +194,8 @@ class IedConnection:
         LastApplError
             Control application error
         """
-        return Wrapper.lib.IedConnection_getLastApplError(self._handle)
+        value = _client.IedConnection_getLastApplError(self._handle)
+        return LastApplError(value)
 
     def on_connection_closed(
         self,
@@ -155,7 +207,7 @@ class IedConnection:
         self._connection_closed_handler = IedConnection_ClosedHandler(
             lambda parameter, connection: fn(self)
         )
-        Wrapper.lib.IedConnection_installConnectionClosedHandler(
+        _client.IedConnection_installConnectionClosedHandler(
             self._handle, self._connection_closed_handler, None
         )
         return True
@@ -170,7 +222,7 @@ class IedConnection:
         self._state_changed_handler = IedConnection_StateChangedHandler(
             lambda parameter, connection, new_state: fn(self, IedConnectionState(new_state))
         )
-        Wrapper.lib.IedConnection_installStateChangedHandler(
+        _client.IedConnection_installStateChangedHandler(
             self._handle, self._state_changed_handler, None
         )
         return True
@@ -206,17 +258,18 @@ class IedConnection:
             _description_
         """
         gocb_reference = convert_to_bytes(gocb_reference)
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
 
-        handle = Wrapper.lib.IedConnection_getGoCBValues(
+        handle = _client.IedConnection_getGoCBValues(
             self._handle,
-            byref(_error),
+            _error_ref,
             gocb_reference,
             None,
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading goose control block failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Reading goose control block failed", IedClientError(_error.value)
+            )
 
         return GooseControlBlock(handle)
 
@@ -233,17 +286,18 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
 
-        Wrapper.lib.IedConnection_getGoCBValues(
+        _client.IedConnection_getGoCBValues(
             self._handle,
-            byref(_error),
+            _error_ref,
             gocb.reference,
             gocb.handle,
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading goose control block failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Reading goose control block failed", IedClientError(_error.value)
+            )
         gocb.clear_element_changed()
 
     def set_gocb_values(self, gocb: "GooseControlBlock", single_request: bool = True):
@@ -262,18 +316,19 @@ class IedConnection:
             _description_
         """
 
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_setGoCBValues(
+        _error, _error_ref = _error_buffer()
+        _client.IedConnection_setGoCBValues(
             self._handle,
-            byref(_error),
+            _error_ref,
             gocb.reference,
             gocb.handle,
             gocb.element_changed.value,
             single_request,
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Updating RCB values failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Updating RCB values failed", IedClientError(_error.value)
+            )
         gocb.clear_element_changed()
 
     ####################################################
@@ -305,21 +360,116 @@ class IedConnection:
             _description_
         """
         object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
 
-        handle = Wrapper.lib.IedConnection_readObject(
+        handle = _client.IedConnection_readObject(
             self._handle,
-            byref(_error),
+            _error_ref,
             object_reference,
-            fc.value,
+            _FC_C_VALUES[fc],
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading value failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Reading value failed", IedClientError(_error.value))
         if handle == 0:
-            raise IedConnectionException("Variable not found on server", error)
+            raise IedConnectionException("Variable not found on server", IedClientError.OK)
         return MmsValue(handle, True)
 
+    async def read_value_async(
+        self,
+        object_reference: str | bytes,
+        fc: FunctionalConstraint,
+    ) -> MmsValue:
+        """Read a FCDA or FCD without blocking the asyncio event loop.
+
+        The request is sent with ``IedConnection_readObjectAsync``. The
+        answer is handled by the thread of the connection, which wakes the
+        event loop up, so nothing has to poll the connection.
+
+        Parameters
+        ----------
+        object_reference : str | bytes
+            Reference of the data attribute to read
+        fc : FunctionalConstraint
+            Functional constraint of the data attribute to read
+
+        Returns
+        -------
+        MmsValue
+            Value of the data attribute
+
+        Raises
+        ------
+        IedConnectionException
+            _description_
+        """
+        # asyncio is already loaded when this coroutine runs, it is not
+        # imported with the module for the clients which never use it
+        import asyncio
+
+        if self._async_batch is None:
+            from .batch import IedBatch
+
+            self._async_batch = IedBatch(self)
+        future = self._async_batch.submit_read(object_reference, fc)
+        return await asyncio.wrap_future(future)
+
+    def read_many(
+        self,
+        references: Iterable[tuple[str | bytes, FunctionalConstraint]],
+        max_inflight: int | None = None,
+        timeout: float | None = None,
+    ) -> list[MmsValue]:
+        """Read several FCDA or FCD without waiting each answer before the next request.
+
+        The requests are sent with ``IedBatch``, up to ``max_inflight``
+        requests are outstanding at the same time.
+
+        Parameters
+        ----------
+        references : Iterable[tuple[str | bytes, FunctionalConstraint]]
+            Reference and functional constraint of each element to read
+        max_inflight : int | None, optional
+            Maximum number of requests waiting for an answer, by default the
+            number of outstanding calls proposed by the client at association,
+            see ``set_max_outstanding_calls``
+        timeout : float | None, optional
+            Maximum time in seconds to wait for the answers, by default the
+            request timeout of the connection for each group of
+            ``max_inflight`` requests
+
+        Returns
+        -------
+        list[MmsValue]
+            Values read, in the order of ``references``
+
+        Raises
+        ------
+        IedConnectionException
+            Error of the first request which failed, ``IedClientError.TIMEOUT``
+            when an answer is not received in time
+        """
+        from .batch import IedBatch
+
+        batch = IedBatch(self)
+        count = 0
+        for object_reference, fc in references:
+            batch.queue_read(object_reference, fc)
+            count += 1
+        if max_inflight is None:
+            max_inflight = self._max_outstanding_calls
+        if timeout is None:
+            timeout = self._batch_timeout(count, max_inflight)
+        return [future.result() for future in batch.flush(max_inflight, timeout)]
+
+    def _batch_timeout(self, count: int, max_inflight: int) -> float:
+        """Time to wait for ``count`` pipelined requests
+
+        One request timeout of the connection is given to each group of
+        ``max_inflight`` requests.
+        """
+        request_timeout = _client.IedConnection_getRequestTimeout(self._handle) / 1000
+        return request_timeout * max(-(-count // max_inflight), 1)
+
     def write_value(
         self,
         object_reference: str | bytes,
@@ -343,18 +493,62 @@ class IedConnection:
             _description_
         """
         object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
 
-        Wrapper.lib.IedConnection_writeObject(
+        _client.IedConnection_writeObject(
             self._handle,
-            byref(_error),
+            _error_ref,
             object_reference,
-            fc.value,
+            _FC_C_VALUES[fc],
             value.handle,
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Write value failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Write value failed", IedClientError(_error.value))
+
+    def _read_scalar(
+        self,
+        function: Callable,
+        object_reference: str | bytes,
+        fc: FunctionalConstraint,
+    ):
+        """Read a FCDA with one of the ``IedConnection_read*Value`` functions
+
+        The scalar read functions share the same signature, the arguments
+        are prepared the same way for all of them.
+        """
+        _error, _error_ref = _error_buffer()
+        value = function(
+            self._handle,
+            _error_ref,
+            convert_to_bytes(object_reference),
+            _FC_C_VALUES[fc],
+        )
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Reading value failed", IedClientError(_error.value))
+        return value
+
+    def _write_scalar(
+        self,
+        function: Callable,
+        object_reference: str | bytes,
+        fc: FunctionalConstraint,
+        value,
+    ):
+        """Write a FCDA with one of the ``IedConnection_write*Value`` functions
+
+        The scalar write functions share the same signature, the arguments
+        are prepared the same way for all of them.
+        """
+        _error, _error_ref = _error_buffer()
+        function(
+            self._handle,
+            _error_ref,
+            convert_to_bytes(object_reference),
+            _FC_C_VALUES[fc],
+            value,
+        )
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Write value failed", IedClientError(_error.value))
 
     def read_boolean(self, object_reference: str | bytes, fc: FunctionalConstraint) -> bool:
         """Read a functional constrained data attribute (FCDA) of type bool.
@@ -376,18 +570,7 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        value = Wrapper.lib.IedConnection_readBooleanValue(
-            self._handle,
-            byref(_error),
-            object_reference,
-            fc.value,
-        )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading value failed", error)
-        return value
+        return self._read_scalar(_client.IedConnection_readBooleanValue, object_reference, fc)
 
     def read_int32(self, object_reference: str | bytes, fc: FunctionalConstraint) -> int:
         """Read a functional constrained data attribute (FCDA) of type int32.
@@ -409,18 +592,7 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        value = Wrapper.lib.IedConnection_readInt32Value(
-            self._handle,
-            byref(_error),
-            object_reference,
-            fc.value,
-        )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading value failed", error)
-        return value
+        return self._read_scalar(_client.IedConnection_readInt32Value, object_reference, fc)
 
     def read_uint32(self, object_reference: str | bytes, fc: FunctionalConstraint) -> int:
         """Read a functional constrained data attribute (FCDA) of type uint32.
@@ -442,18 +614,7 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        value = Wrapper.lib.IedConnection_readUnsigned32Value(
-            self._handle,
-            byref(_error),
-            object_reference,
-            fc.value,
-        )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading value failed", error)
-        return value
+        return self._read_scalar(_client.IedConnection_readUnsigned32Value, object_reference, fc)
 
     def read_int64(self, object_reference: str | bytes, fc: FunctionalConstraint) -> int:
         """Read a functional constrained data attribute (FCDA) of type int64.
@@ -475,18 +636,7 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        value = Wrapper.lib.IedConnection_readInt64Value(
-            self._handle,
-            byref(_error),
-            object_reference,
-            fc.value,
-        )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading value failed", error)
-        return value
+        return self._read_scalar(_client.IedConnection_readInt64Value, object_reference, fc)
 
     def read_float(self, object_reference: str | bytes, fc: FunctionalConstraint) -> float:
         """Read a functional constrained data attribute (FCDA) of type float.
@@ -508,18 +658,7 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        value = Wrapper.lib.IedConnection_readFloatValue(
-            self._handle,
-            byref(_error),
-            object_reference,
-            fc.value,
-        )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading value failed", error)
-        return value
+        return self._read_scalar(_client.IedConnection_readFloatValue, object_reference, fc)
 
     def read_string(self, object_reference: str | bytes, fc: FunctionalConstraint) -> bytes:
         """Read a functional constrained data attribute (FCDA) of type string.
@@ -541,18 +680,7 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        value = Wrapper.lib.IedConnection_readStringValue(
-            self._handle,
-            byref(_error),
-            object_reference,
-            fc.value,
-        )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading value failed", error)
-        return value
+        return self._read_scalar(_client.IedConnection_readStringValue, object_reference, fc)
 
     def read_timestamp(
         self,
@@ -579,16 +707,15 @@ class IedConnection:
             _description_
         """
         object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        value = Wrapper.lib.IedConnection_readTimestampValue(
+        _error, _error_ref = _error_buffer()
+        value = _client.IedConnection_readTimestampValue(
             self._handle,
-            byref(_error),
+            _error_ref,
             object_reference,
-            fc.value,
+            _FC_C_VALUES[fc],
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading value failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Reading value failed", IedClientError(_error.value))
         return value  # TODO
 
     def read_quality(self, object_reference: str | bytes, fc: FunctionalConstraint) -> Quality:
@@ -611,18 +738,9 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        value = Wrapper.lib.IedConnection_readQualityValue(
-            self._handle,
-            byref(_error),
-            object_reference,
-            fc.value,
+        return Quality(
+            self._read_scalar(_client.IedConnection_readQualityValue, object_reference, fc)
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading value failed", error)
-        return Quality(value)
 
     def write_boolean(
         self,
@@ -646,18 +764,7 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_writeBooleanValue(
-            self._handle,
-            byref(_error),
-            object_reference,
-            fc.value,
-            value,
-        )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Write value failed", error)
+        self._write_scalar(_client.IedConnection_writeBooleanValue, object_reference, fc, value)
 
     def write_int32(
         self,
@@ -681,18 +788,7 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_writeInt32Value(
-            self._handle,
-            byref(_error),
-            object_reference,
-            fc.value,
-            value,
-        )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Write value failed", error)
+        self._write_scalar(_client.IedConnection_writeInt32Value, object_reference, fc, value)
 
     def write_uint32(
         self,
@@ -716,18 +812,7 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_writeUnsigned32Value(
-            self._handle,
-            byref(_error),
-            object_reference,
-            fc.value,
-            value,
-        )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Write value failed", error)
+        self._write_scalar(_client.IedConnection_writeUnsigned32Value, object_reference, fc, value)
 
     def write_float(
         self,
@@ -751,18 +836,7 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_writeFloatValue(
-            self._handle,
-            byref(_error),
-            object_reference,
-            fc.value,
-            value,
-        )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Write value failed", error)
+        self._write_scalar(_client.IedConnection_writeFloatValue, object_reference, fc, value)
 
     def write_string(
         self,
@@ -786,35 +860,30 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        object_reference = convert_to_bytes(object_reference)
         value = convert_to_bytes(value)
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_writeVisibleStringValue(
-            self._handle,
-            byref(_error),
-            object_reference,
-            fc.value,
-            value,
+        self._write_scalar(
+            _client.IedConnection_writeVisibleStringValue, object_reference, fc, value
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Write value failed", error)
 
     def write_octet_string(
         self,
         object_reference: str | bytes,
         fc: FunctionalConstraint,
-        value: bytes,
+        value: bytes | bytearray | memoryview,
     ):
         """Write a functional constrained data attribute (FCDA) of type octet string.
 
+        A ``bytes`` value or a writable contiguous buffer is given to the C
+        function without being copied. A read-only memoryview is copied once,
+        a non-contiguous memoryview is first gathered into a ``bytes``.
+
         Parameters
         ----------
         object_reference : str | bytes
             Reference of the data attribute to write
         fc : FunctionalConstraint
             Functional constraint of the data attribute to write
-        value : bytes
+        value : bytes | bytearray | memoryview
             Value to write
 
         Raises
@@ -823,18 +892,34 @@ class IedConnection:
             _description_
         """
         object_reference = convert_to_bytes(object_reference)
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_writeOctetString(
+        if isinstance(value, memoryview) and not value.c_contiguous:
+            # cast("B") only accepts a contiguous view
+            value = value.tobytes()
+        if isinstance(value, bytes):
+            # Points to the internal buffer of the bytes object
+            buffer = ctypes.cast(value, ctypes.POINTER(ctypes.c_uint8))
+            length = len(value)
+        else:
+            view = memoryview(value).cast("B")
+            length = view.nbytes
+            array_type = ctypes.c_uint8 * length
+            # Only a read-only memoryview has to be copied
+            buffer = (
+                array_type.from_buffer_copy(view)
+                if view.readonly
+                else array_type.from_buffer(view)
+            )
+        _error, _error_ref = _error_buffer()
+        _client.IedConnection_writeOctetString(
             self._handle,
-            byref(_error),
+            _error_ref,
             object_reference,
-            fc.value,
-            value,
-            len(value),
+            _FC_C_VALUES[fc],
+            buffer,
+            length,
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Write value failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Write value failed", IedClientError(_error.value))
 
     ####################################################
     # Reporting services
@@ -864,16 +949,15 @@ class IedConnection:
         update_rcb_values
         """
         rcb_reference = convert_to_bytes(rcb_reference)
-        _error = _cIedClientError(99)
-        handle = Wrapper.lib.IedConnection_getRCBValues(
+        _error, _error_ref = _error_buffer()
+        handle = _client.IedConnection_getRCBValues(
             self._handle,  # IedConnection,
-            byref(_error),  # POINTER(IedClientError),
+            _error_ref,  # POINTER(IedClientError),
             rcb_reference,  # c_char_p,
             None,  # ClientReportControlBlock,
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Get RCB values failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Get RCB values failed", IedClientError(_error.value))
         return ReportControlBlock(handle, self)
 
     def update_rcb_values(self, rcb: "ReportControlBlock"):
@@ -889,16 +973,15 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_getRCBValues(
+        _error, _error_ref = _error_buffer()
+        _client.IedConnection_getRCBValues(
             self._handle,  # IedConnection,
-            byref(_error),  # POINTER(IedClientError),
+            _error_ref,  # POINTER(IedClientError),
             rcb.reference,  # c_char_p,
             rcb.handle,  # ClientReportControlBlock,
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading RCB values failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Reading RCB values failed", IedClientError(_error.value))
         rcb.clear_element_changed()
 
     def set_rcb_values(self, rcb: "ReportControlBlock", single_request: bool = True):
@@ -916,17 +999,18 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_setRCBValues(
+        _error, _error_ref = _error_buffer()
+        _client.IedConnection_setRCBValues(
             self._handle,  # IedConnection self
-            byref(_error),  # IedClientError* error
+            _error_ref,  # IedClientError* error
             rcb.handle,  # ClientReportControlBlock rcb
             rcb.element_changed.value,  # uint32_t parametersMask
             single_request,  # bool singleRequest
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Updating RCB values failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Updating RCB values failed", IedClientError(_error.value)
+            )
         rcb.clear_element_changed()
 
     def register_report_handler(
@@ -954,15 +1038,25 @@ class IedConnection:
         rcb_reference = convert_to_bytes(rcb_reference)
         rpt_id = convert_to_bytes(rpt_id)
 
-        report_handler = ReportCallbackFunction(lambda parameter, report: callback(Report(report)))
-        self._report_handlers[rcb_reference] = report_handler
-        Wrapper.lib.IedConnection_installReportHandler(
+        # The C handler is kept alive as long as it is installed, and reused
+        # when the same callback is registered again for this RCB
+        registered = self._report_handlers.get(rcb_reference)
+        if registered is not None and registered[0] is callback:
+            report_handler = registered[1]
+        else:
+            report_handler = ReportCallbackFunction(
+                lambda parameter, report: callback(Report(report))
+            )
+        _client.IedConnection_installReportHandler(
             self._handle,
             rcb_reference,
             rpt_id,
             report_handler,
             None,
         )
+        # Replaced only once the new handler is installed, the previous one
+        # is kept alive by ``registered`` until then
+        self._report_handlers[rcb_reference] = (callback, report_handler)
 
     def unregister_report_handler(self, rcb_reference: str | bytes):
         """Unregister a report handler
@@ -977,12 +1071,12 @@ class IedConnection:
         register_report_handler
         """
         rcb_reference = convert_to_bytes(rcb_reference)
-        Wrapper.lib.IedConnection_uninstallReportHandler(
+        _client.IedConnection_uninstallReportHandler(
             self._handle,  # IedConnection self
             rcb_reference,  # const char* rcbReference
         )
-
-        self._report_handlers[rcb_reference] = None
+        # Only released once the C library does not refer to it anymore
+        self._report_handlers.pop(rcb_reference, None)
 
     def create_rcb_and_subscribe(
         self,
@@ -1038,16 +1132,15 @@ class IedConnection:
             _description_
         """
         dataset_reference = convert_to_bytes(dataset_reference)
-        _error = _cIedClientError(99)
-        handle = Wrapper.lib.IedConnection_readDataSetValues(
+        _error, _error_ref = _error_buffer()
+        handle = _client.IedConnection_readDataSetValues(
             self._handle,
-            byref(_error),
+            _error_ref,
             dataset_reference,
             None,
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading dataset failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Reading dataset failed", IedClientError(_error.value))
         return DataSet(handle, self)
 
     def update_dataset_values(self, dataset: DataSet):
@@ -1063,16 +1156,61 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_readDataSetValues(
+        _error, _error_ref = _error_buffer()
+        _client.IedConnection_readDataSetValues(
             self._handle,
-            byref(_error),
+            _error_ref,
             dataset.reference,
             dataset.handle,
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Updating dataset value failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Updating dataset value failed", IedClientError(_error.value)
+            )
+
+    def update_datasets_values(
+        self,
+        datasets: Iterable[DataSet],
+        max_inflight: int | None = None,
+        timeout: float | None = None,
+    ):
+        """Update the values stored in several datasets without waiting each answer
+
+        The requests are sent with ``IedBatch``, up to ``max_inflight``
+        requests are outstanding at the same time.
+
+        Parameters
+        ----------
+        datasets : Iterable[DataSet]
+            Datasets to update
+        max_inflight : int | None, optional
+            Maximum number of requests waiting for an answer, by default the
+            number of outstanding calls proposed by the client at association,
+            see ``set_max_outstanding_calls``
+        timeout : float | None, optional
+            Maximum time in seconds to wait for the answers, by default the
+            request timeout of the connection for each group of
+            ``max_inflight`` requests
+
+        Raises
+        ------
+        IedConnectionException
+            Error of the first update which failed, ``IedClientError.TIMEOUT``
+            when an answer is not received in time
+        """
+        from .batch import IedBatch
+
+        batch = IedBatch(self)
+        count = 0
+        for dataset in datasets:
+            batch.queue_dataset_update(dataset)
+            count += 1
+        if max_inflight is None:
+            max_inflight = self._max_outstanding_calls
+        if timeout is None:
+            timeout = self._batch_timeout(count, max_inflight)
+        for future in batch.flush(max_inflight, timeout):
+            future.result()
 
     def get_dataset_directory(self, dataset_reference: str | bytes) -> list[bytes]:
         """Return the list of reference of FCDA in the dataset
@@ -1092,15 +1230,16 @@ class IedConnection:
         IedConnectionException
             _description_
         """
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
         is_deletable = c_bool(False)
         dataset_reference = convert_to_bytes(dataset_reference)
-        head = Wrapper.lib.IedConnection_getDataSetDirectory(
-            self._handle, byref(_error), dataset_reference, byref(is_deletable)
+        head = _client.IedConnection_getDataSetDirectory(
+            self._handle, _error_ref, dataset_reference, byref(is_deletable)
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Get dataset directory failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Get dataset directory failed", IedClientError(_error.value)
+            )
         return LinkedList(head).to_string_list()
 
     def create_dataset(self, dataset_reference: str | bytes, fcdas: list[str | bytes]):
@@ -1132,16 +1271,15 @@ class IedConnection:
         """
         dataset_reference = convert_to_bytes(dataset_reference)
         dataset_elements = LinkedList.create_from_string_list(fcdas)
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_createDataSet(
+        _error, _error_ref = _error_buffer()
+        _client.IedConnection_createDataSet(
             IedConnection,  # IedConnection self
-            byref(_error),  # IedClientError* error
+            _error_ref,  # IedClientError* error
             dataset_reference,  # const char* dataSetReference
             dataset_elements.handle,  # LinkedList /* char* */ dataSetElements
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading dataset failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Reading dataset failed", IedClientError(_error.value))
 
     def delete_dataset(self, dataset_reference: str | bytes):
         """Delete a deletable data set at the connected server device
@@ -1165,15 +1303,14 @@ class IedConnection:
         create_dataset
         """
         dataset_reference = convert_to_bytes(dataset_reference)
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_deleteDataSet(
+        _error, _error_ref = _error_buffer()
+        _client.IedConnection_deleteDataSet(
             IedConnection,  # IedConnection self
-            byref(_error),  # IedClientError* error
+            _error_ref,  # IedClientError* error
             dataset_reference,  # const char* dataSetReference
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Reading dataset failed", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Reading dataset failed", IedClientError(_error.value))
 
     ####################################################
     # Model discovery services
@@ -1197,11 +1334,12 @@ class IedConnection:
         >>> ied_connection.get_logical_devices()
         [b'TestIEDGenericIO']
         """
-        _error = _cIedClientError(99)
-        head = Wrapper.lib.IedConnection_getServerDirectory(self._handle, byref(_error), False)
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Failed to get logical devices", error)
+        _error, _error_ref = _error_buffer()
+        head = _client.IedConnection_getServerDirectory(self._handle, _error_ref, False)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Failed to get logical devices", IedClientError(_error.value)
+            )
 
         return LinkedList(head).to_string_list()
 
@@ -1228,14 +1366,15 @@ class IedConnection:
         >>> ied_connection.get_logical_nodes('TestIEDGenericIO')
         [b'GGIO1', b'LLN0', b'LPHD1']
         """
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
         logical_device_name = convert_to_bytes(logical_device_name)
-        head = Wrapper.lib.IedConnection_getLogicalDeviceDirectory(
-            self._handle, byref(_error), logical_device_name
+        head = _client.IedConnection_getLogicalDeviceDirectory(
+            self._handle, _error_ref, logical_device_name
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Failed to get logical nodes", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Failed to get logical nodes", IedClientError(_error.value)
+            )
         return LinkedList(head).to_string_list()
 
     def get_logical_node_directory(
@@ -1275,18 +1414,17 @@ class IedConnection:
         ...     ACSIClass.DATA_SET)
         [b'ControlEvents']
         """
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
         logical_node_reference = convert_to_bytes(logical_node_reference)
 
-        head = Wrapper.lib.IedConnection_getLogicalNodeDirectory(
+        head = _client.IedConnection_getLogicalNodeDirectory(
             self._handle,
-            byref(_error),
+            _error_ref,
             logical_node_reference,
             acsi_class.value,
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Failed to get files", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Failed to get files", IedClientError(_error.value))
         return LinkedList(head).to_string_list()
 
     def get_data_directory(self, data_reference: str | bytes) -> list[bytes]:
@@ -1324,16 +1462,17 @@ class IedConnection:
         [b'f']
         """
 
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
         data_reference = convert_to_bytes(data_reference)
-        head = Wrapper.lib.IedConnection_getDataDirectory(
+        head = _client.IedConnection_getDataDirectory(
             self._handle,
-            byref(_error),
+            _error_ref,
             data_reference,
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Failed to get data directory.", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Failed to get data directory.", IedClientError(_error.value)
+            )
         return LinkedList(head).to_string_list()
 
     def get_data_directory_fc(
@@ -1371,14 +1510,13 @@ class IedConnection:
         [b'mag[MX]', b'q[MX]', b't[MX]']
         """
 
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
         data_reference = convert_to_bytes(data_reference)
-        head = Wrapper.lib.IedConnection_getDataDirectoryFC(
-            self._handle, byref(_error), data_reference
-        )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Failed to get data directory.", error)
+        head = _client.IedConnection_getDataDirectoryFC(self._handle, _error_ref, data_reference)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Failed to get data directory.", IedClientError(_error.value)
+            )
         return LinkedList(head).to_string_list()
 
     def get_data_directory_by_fc(
@@ -1421,18 +1559,19 @@ class IedConnection:
         ...     FunctionalConstraint.CF)
         [b'ctlModel']
         """
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
         data_reference = convert_to_bytes(data_reference)
 
-        head = Wrapper.lib.IedConnection_getDataDirectoryByFC(
+        head = _client.IedConnection_getDataDirectoryByFC(
             self._handle,
-            byref(_error),
+            _error_ref,
             data_reference,
-            fc.value,
+            _FC_C_VALUES[fc],
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Failed to get data directory.", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Failed to get data directory.", IedClientError(_error.value)
+            )
         return LinkedList(head).to_string_list()
 
     def get_logical_device_variables(self, logical_device_name: str | bytes) -> list[bytes]:
@@ -1458,14 +1597,15 @@ class IedConnection:
         get_logical_node_variables
         """
 
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
         logical_device_name = convert_to_bytes(logical_device_name)
-        head = Wrapper.lib.IedConnection_getLogicalDeviceVariables(
-            self._handle, byref(_error), logical_device_name
+        head = _client.IedConnection_getLogicalDeviceVariables(
+            self._handle, _error_ref, logical_device_name
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Failed to get logical devices variables.", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Failed to get logical devices variables.", IedClientError(_error.value)
+            )
         return LinkedList(head).to_string_list()
 
     def get_logical_node_variables(self, logical_node_reference: str | bytes) -> list[bytes]:
@@ -1511,14 +1651,15 @@ class IedConnection:
         b'ST$Health$q', b'ST$Health$stVal', b'ST$Health$t', b'ST$Mod', b'ST$Mod$q',
         b'ST$Mod$t']
         """
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
         logical_node_reference = convert_to_bytes(logical_node_reference)
-        head = Wrapper.lib.IedConnection_getLogicalNodeVariables(
-            self._handle, byref(_error), logical_node_reference
+        head = _client.IedConnection_getLogicalNodeVariables(
+            self._handle, _error_ref, logical_node_reference
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Failed to get logical node variables", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Failed to get logical node variables", IedClientError(_error.value)
+            )
         return LinkedList(head).to_string_list()
 
     def get_logical_device_datasets(self, logical_device_name: str | bytes) -> list[bytes]:
@@ -1539,14 +1680,15 @@ class IedConnection:
         >>> ied_connection.get_logical_device_datasets('TestIEDGenericIO')
         [b'LLN0$ControlEvents']
         """
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
         logical_device_name = convert_to_bytes(logical_device_name)
-        head = Wrapper.lib.IedConnection_getLogicalDeviceDataSets(
-            self._handle, byref(_error), logical_device_name
+        head = _client.IedConnection_getLogicalDeviceDataSets(
+            self._handle, _error_ref, logical_device_name
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Failed to get logical node variables", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Failed to get logical node variables", IedClientError(_error.value)
+            )
         return LinkedList(head).to_string_list()
 
     ####################################################
@@ -1579,15 +1721,16 @@ class IedConnection:
         """
         if directory_name:
             directory_name = convert_to_bytes(directory_name)
-        _error = _cIedClientError(99)
-        head = Wrapper.lib.IedConnection_getFileDirectory(
+        _error, _error_ref = _error_buffer()
+        head = _client.IedConnection_getFileDirectory(
             self._handle,  # IedConnection self,
-            byref(_error),  # IedClientError* error,
+            _error_ref,  # IedClientError* error,
             directory_name,  # const char* directoryName
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Failed to get file directory", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                "Failed to get file directory", IedClientError(_error.value)
+            )
         handlers = LinkedList(head).to_pointer_list()
         return [FileDirectoryEntry(handler, self) for handler in handlers]
 
@@ -1608,26 +1751,28 @@ class IedConnection:
         bytearray(b'Dummy file on the server\n')
         """
         filepath = convert_to_bytes(filepath)
-        _error = _cIedClientError(99)
+        _error, _error_ref = _error_buffer()
         buffer = bytearray()
 
-        def _on_byte_received(parameter: None, buffer_ptr, bytes_read: int) -> bool:
-            data = ctypes.string_at(buffer_ptr, bytes_read)
-            buffer.extend(data)
+        def _on_byte_received(parameter: None, address: int, bytes_read: int) -> bool:
+            if bytes_read:
+                # Copied once, straight from the C buffer
+                buffer.extend((ctypes.c_uint8 * bytes_read).from_address(address))
 
             return True
 
         handler = IedClientGetFileHandler(_on_byte_received)
-        Wrapper.lib.IedConnection_getFile(
+        _client.IedConnection_getFile(
             self._handle,  # IedConnection self,
-            byref(_error),  # IedClientError* error,
+            _error_ref,  # IedClientError* error,
             filepath,  # const char* fileName,
             handler,  # IedClientGetFileHandler handler,
             None,  # void* handlerParameter
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException(f"Failed to download file {filepath}", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException(
+                f"Failed to download file {filepath}", IedClientError(_error.value)
+            )
         return buffer
 
     def set_filestore_basepath(self, basepath: str | bytes):
@@ -1639,7 +1784,7 @@ class IedConnection:
             _description_
         """
         basepath = convert_to_bytes(basepath)
-        Wrapper.lib.IedConnection_setFilestoreBasepath(
+        _client.IedConnection_setFilestoreBasepath(
             self._handle,  # IedConnection self,
             basepath,  # const char* basepath
         )
@@ -1660,10 +1805,10 @@ class IedConnection:
         """
         source_filename = convert_to_bytes(source_filename)
         destination_filename = convert_to_bytes(destination_filename)
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_setFile(
+        _error, _error_ref = _error_buffer()
+        _client.IedConnection_setFile(
             self._handle,  # IedConnection self,
-            byref(_error),  # IedClientError* error,
+            _error_ref,  # IedClientError* error,
             source_filename,  # const char* sourceFilename,
             destination_filename,  # const char* destinationFilename
         )
@@ -1682,15 +1827,14 @@ class IedConnection:
             _description_
         """
         filepath = convert_to_bytes(filepath)
-        _error = _cIedClientError(99)
-        Wrapper.lib.IedConnection_deleteFile(
+        _error, _error_ref = _error_buffer()
+        _client.IedConnection_deleteFile(
             self._handle,  # IedConnection self,
-            byref(_error),  # IedClientError* error,
+            _error_ref,  # IedClientError* error,
             filepath,  # const char* fileName,
         )
-        error = IedClientError(_error.value)
-        if error != IedClientError.OK:
-            raise IedConnectionException("Failed to delete file", error)
+        if _error.value != _IED_CLIENT_ERROR_OK:
+            raise IedConnectionException("Failed to delete file", IedClientError(_error.value))
 
     ####################################################
     # Control
@@ -1715,7 +1859,7 @@ class IedConnection:
             _description_
         """
         object_reference = convert_to_bytes(object_reference)
-        handle = Wrapper.lib.ControlObjectClient_create(object_reference, self._handle)
+        handle = _client.ControlObjectClient_create(object_reference, self._handle)
         if not handle:
             raise IedConnectionException(
                 "Reading object failed",
@@ -45,9 +45,20 @@ class ControlObject:
     It is used to handle all client side functions of a controllable data object.
     """
 
+    __slots__ = (
+        "_handle",
+        "_termination_handler",
+        "_object_reference",
+        "_control_model",
+        "_ctl_val_type",
+    )
+
     def __init__(self, handle: c_void_p) -> None:
         self._handle = handle
         self._termination_handler = None
+        self._object_reference: bytes | None = None
+        self._control_model: ControlModel | None = None
+        self._ctl_val_type: MmsType | None = None
 
     def __del__(self):
         Wrapper.lib.ControlObjectClient_destroy(self._handle)
@@ -55,19 +66,38 @@ class ControlObject:
     @property
     def object_reference(self) -> bytes:
         """Object reference of the control data object."""
-        return Wrapper.lib.ControlObjectClient_getObjectReference(self._handle)
+        if self._object_reference is None:
+            self._object_reference = Wrapper.lib.ControlObjectClient_getObjectReference(
+                self._handle
+            )
+        return self._object_reference  # type: ignore
 
     @property
     def control_model(self) -> ControlModel:
-        """Current control model (local representation) applied to the control object."""
-        value = Wrapper.lib.ControlObjectClient_getControlModel(self._handle)
-        return ControlModel(value)
+        """Current control model (local representation) applied to the control object.
+
+        The control model is read once, it only changes through this property.
+        """
+        if self._control_model is None:
+            value = Wrapper.lib.ControlObjectClient_getControlModel(self._handle)
+            self._control_model = ControlModel(value)
+        return self._control_model
+
+    @control_model.setter
+    def control_model(self, value: ControlModel):
+        Wrapper.lib.ControlObjectClient_setControlModel(self._handle, value.value)
+        self._control_model = value
 
     @property
     def ctl_val_type(self) -> MmsType:
-        """Return the type of ctlVal."""
-        value = Wrapper.lib.ControlObjectClient_getCtlValType(self._handle)
-        return MmsType(value)
+        """Return the type of ctlVal.
+
+        The type is fixed when the control object is created, it is read once.
+        """
+        if self._ctl_val_type is None:
+            value = Wrapper.lib.ControlObjectClient_getCtlValType(self._handle)
+            self._ctl_val_type = MmsType(value)
+        return self._ctl_val_type
 
     def get_last_error(self) -> "IedClientError":
         """Get the error code of the last synchronous control action
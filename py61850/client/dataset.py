@@ -13,10 +13,13 @@ if TYPE_CHECKING:
 class DataSet:
     """Representation of a dataset on client side"""
 
+    __slots__ = ("_handle", "_values", "_ied_connection", "_reference")
+
     def __init__(self, handle: c_void_p, ied_connection: "IedConnection") -> None:
         self._handle = handle
         self._values = None
         self._ied_connection = ied_connection
+        self._reference: bytes | None = None
 
     def __del__(self):
         Wrapper.lib.ClientDataSet_destroy(self._handle)
@@ -28,10 +31,13 @@ class DataSet:
 
     @property
     def reference(self) -> bytes:
-        """Object reference of the data set."""
+        """Object reference of the data set.
 
-        value = Wrapper.lib.ClientDataSet_getReference(self._handle)
-        return value
+        The reference does not change, it is read once from the structure.
+        """
+        if self._reference is None:
+            self._reference = Wrapper.lib.ClientDataSet_getReference(self._handle)
+        return self._reference  # type: ignore
 
     @property
     def values(self) -> MmsValue:
@@ -5,6 +5,8 @@ from ..common import ControlAddCause, ControlLastApplError
 class LastApplError:
     """Detailed description of the last application error of the client connection instance"""
 
+    __slots__ = ("_ctl_num", "_error", "_add_cause")
+
     def __init__(self, value: _cLastApplError) -> None:
         # Use this trick to have no limitataion on property name
         self._ctl_num = value.ctlNum
@@ -12,11 +12,20 @@ if TYPE_CHECKING:
 
 
 class FileDirectoryEntry:
-    """File directory entry"""
+    """File directory entry
+
+    The entry does not change once received, its attributes are read from
+    the C structure on first access only.
+    """
+
+    __slots__ = ("_handle", "_ied_connection", "_filepath", "_file_size", "_last_modified")
 
     def __init__(self, handle: c_void_p, ied_connection: "IedConnection") -> None:
         self._handle = handle
         self._ied_connection = ied_connection
+        self._filepath: bytes | None = None
+        self._file_size: int | None = None
+        self._last_modified: datetime.datetime | None = None
 
     def __del__(self):
         Wrapper.lib.FileDirectoryEntry_destroy(self._handle)
@@ -24,18 +33,24 @@ class FileDirectoryEntry:
     @property
     def filepath(self) -> bytes:
         """Path of the file."""
-        return Wrapper.lib.FileDirectoryEntry_getFileName(self._handle)
+        if self._filepath is None:
+            self._filepath = Wrapper.lib.FileDirectoryEntry_getFileName(self._handle)
+        return self._filepath  # type: ignore
 
     @property
     def file_size(self) -> int:
         """File size in bytes."""
-        return Wrapper.lib.FileDirectoryEntry_getFileSize(self._handle)
+        if self._file_size is None:
+            self._file_size = Wrapper.lib.FileDirectoryEntry_getFileSize(self._handle)
+        return self._file_size  # type: ignore
 
     @property
     def last_modified(self) -> datetime.datetime:
         """Timestamp of last modification of the file."""
-        ms = Wrapper.lib.FileDirectoryEntry_getLastModified(self._handle)
-        return convert_to_datetime(ms)
+        if self._last_modified is None:
+            ms = Wrapper.lib.FileDirectoryEntry_getLastModified(self._handle)
+            self._last_modified = convert_to_datetime(ms)
+        return self._last_modified
 
     def download(self) -> bytearray:
         """Download the file
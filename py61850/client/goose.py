@@ -64,9 +64,12 @@ class GocbElement(Flag):
 class GooseControlBlock:
     """Goose control block"""
 
+    __slots__ = ("_handle", "_element_changed", "_reference")
+
     def __init__(self, handle: GooseControlBlockPointer):
         self._handle = handle
         self._element_changed = GocbElement(0)
+        self._reference: bytes | None = None
 
     def __del__(self):
         Wrapper.lib.ClientGooseControlBlock_destroy(self._handle)
@@ -86,8 +89,13 @@ class GooseControlBlock:
 
     @property
     def reference(self) -> bytes:
-        """Reference of the goose control block"""
-        return self._handle.contents.objectReference
+        """Reference of the goose control block
+
+        The reference does not change, it is read once from the structure.
+        """
+        if self._reference is None:
+            self._reference = self._handle.contents.objectReference
+        return self._reference  # type: ignore
 
     @property
     def go_ena(self) -> bool:
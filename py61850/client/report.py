@@ -3,13 +3,14 @@
 import ctypes
 import datetime
 from collections.abc import Callable
-from ctypes import c_int, c_void_p
+from ctypes import c_void_p
 from enum import Flag
 from typing import TYPE_CHECKING
 
+from ..binding.iec61850 import client as _client
 from ..binding.iec61850.client import ReportCallbackFunction
 from ..binding.iec61850.client import sClientReportControlBlock as _sClientReportControlBlock
-from ..binding.loader import Wrapper
+from ..binding.mms import mms_value as _mms_value
 from ..common import MmsValue, ReportOptions, ReportTriggerOptions, Timestamp
 from ..helper import convert_to_bytes, convert_to_datetime
 
@@ -81,7 +82,13 @@ class ReasonForInclusion(Flag):
 
 
 class Report:
-    """Report"""
+    """Report
+
+    A ``Report`` is created for every report received, it only holds the
+    handle of the C report.
+    """
+
+    __slots__ = ("_handle",)
 
     def __init__(self, handle: c_void_p) -> None:
         self._handle = handle
@@ -89,23 +96,23 @@ class Report:
     @property
     def has_dataset_name(self) -> bool:
         """Indicate whether dataset name is included in the report"""
-        return Wrapper.lib.ClientReport_hasDataSetName(self._handle)
+        return _client.ClientReport_hasDataSetName(self._handle)
 
     @property
     def dataset_name(self) -> bytes:
         """Name of the dataset"""
-        return Wrapper.lib.ClientReport_getDataSetName(self._handle)
+        return _client.ClientReport_getDataSetName(self._handle)
 
     @property
     def dataset_values(self) -> MmsValue:
         """Received data set values of the report"""
-        handle = Wrapper.lib.ClientReport_getDataSetValues(self._handle)
+        handle = _client.ClientReport_getDataSetValues(self._handle)
         return MmsValue(handle)
 
     @property
     def entry_id(self) -> bytearray | None:
         """Entry ID of the report"""
-        handle = Wrapper.lib.ClientReport_getEntryId(self._handle)
+        handle = _client.ClientReport_getEntryId(self._handle)
 
         if not handle:
             return None
@@ -117,42 +124,42 @@ class Report:
         """True in case this is part of a segmented report and more report
         segments will follow or false, if the current report is not a
         segmented report or is the last segment of a segmented report."""
-        return Wrapper.lib.ClientReport_getMoreSeqmentsFollow(self._handle)
+        return _client.ClientReport_getMoreSeqmentsFollow(self._handle)
 
     @property
     def rcb_reference(self) -> bytes:
         """Reference (name) of the server RCB associated with this ClientReport object"""
-        return Wrapper.lib.ClientReport_getRcbReference(self._handle)
+        return _client.ClientReport_getRcbReference(self._handle)
 
     @property
     def rpt_id(self) -> bytes:
         """RptId of the server RCB associated with this ClientReport object"""
-        val = Wrapper.lib.ClientReport_getRptId(self._handle)
+        val = _client.ClientReport_getRptId(self._handle)
         return val
 
     def has_buf_ovfl(self) -> bool:
         """Indicates if the report contains the bufOvfl (buffer overflow) flag"""
-        return Wrapper.lib.ClientReport_hasBufOvfl(self._handle)
+        return _client.ClientReport_hasBufOvfl(self._handle)
 
     @property
     def buf_ovfl(self) -> bool:
         """Value of the bufOvfl flag"""
-        return Wrapper.lib.ClientReport_getBufOvfl(self._handle)
+        return _client.ClientReport_getBufOvfl(self._handle)
 
     @property
     def has_conf_rev(self) -> bool:
         """Indicates if the last received report contains the configuration revision"""
-        return Wrapper.lib.ClientReport_hasConfRev(self._handle)
+        return _client.ClientReport_hasConfRev(self._handle)
 
     @property
     def conf_rev(self) -> int:
         """Value of the configuration revision"""
-        return Wrapper.lib.ClientReport_getConfRev(self._handle)
+        return _client.ClientReport_getConfRev(self._handle)
 
     @property
     def has_data_reference(self) -> bool:
         """Indicates if the report contains data references for the reported data set members"""
-        return Wrapper.lib.ClientReport_hasDataReference(self._handle)
+        return _client.ClientReport_hasDataReference(self._handle)
 
     def get_data_reference(self, element_index: int) -> bytes:
         """Get the data-reference of the element of the report data set
@@ -167,12 +174,12 @@ class Report:
         bytes
             _description_
         """
-        return Wrapper.lib.ClientReport_getDataReference(self._handle, element_index)
+        return _client.ClientReport_getDataReference(self._handle, element_index)
 
     @property
     def has_reason_for_inclusion(self) -> bool:
         """Indicates if the last received report contains reason-for-inclusion information"""
-        return Wrapper.lib.ClientReport_hasReasonForInclusion(self._handle)
+        return _client.ClientReport_hasReasonForInclusion(self._handle)
 
     def get_reason_for_inclusion(self, element_index: int) -> ReasonForInclusion:
         """Get the reason code (reason for inclusion) for a specific report data set element
@@ -187,48 +194,93 @@ class Report:
         ReasonForInclusion
             _description_
         """
-        val = Wrapper.lib.ClientReport_getReasonForInclusion(self._handle, element_index)
+        val = _client.ClientReport_getReasonForInclusion(self._handle, element_index)
         return ReasonForInclusion(val)
 
     @property
     def has_seq_num(self) -> bool:
         """Indicates if the last received report contains a sequence number"""
-        return Wrapper.lib.ClientReport_hasSeqNum(self._handle)
+        return _client.ClientReport_hasSeqNum(self._handle)
 
     @property
     def seq_num(self) -> int:
         """Value of the sequence number"""
-        return Wrapper.lib.ClientReport_getSeqNum(self._handle)
+        return _client.ClientReport_getSeqNum(self._handle)
 
     @property
     def has_sub_seq_num(self) -> bool:
         """Indicates if the report contains a sub sequence number and a more segments follow flags (for segmented reporting)"""
-        return Wrapper.lib.ClientReport_hasSubSeqNum(self._handle)
+        return _client.ClientReport_hasSubSeqNum(self._handle)
 
     @property
     def sub_seq_num(self) -> int:
         """Value of the sub sequence number"""
-        return Wrapper.lib.ClientReport_getSubSeqNum(self._handle)
+        return _client.ClientReport_getSubSeqNum(self._handle)
 
     @property
     def has_timestamp(self) -> bool:
         """Indicates if the last received report contains a timestamp"""
-        return Wrapper.lib.ClientReport_hasTimestamp(self._handle)
+        return _client.ClientReport_hasTimestamp(self._handle)
 
     @property
     def timestamp(self) -> datetime.datetime:
         """Value of the timestamp"""
-        ms = Wrapper.lib.ClientReport_getTimestamp(self._handle)
+        ms = _client.ClientReport_getTimestamp(self._handle)
         return convert_to_datetime(ms)
 
+    def snapshot(self) -> list[tuple["MmsValue | None", ReasonForInclusion, bytes | None]]:
+        """Collect all the entries of the report data set at once
+
+        The flags ``has_reason_for_inclusion`` and ``has_data_reference``
+        and the size of the data set are only requested once for the whole
+        report instead of once per element.
+
+        Returns
+        -------
+        list[tuple[MmsValue | None, ReasonForInclusion, bytes | None]]
+            For each element of the data set, its value, its reason for
+            inclusion (``UNKNOWN`` if not included in the report) and its
+            data reference (None if not included in the report)
+        """
+        values = _client.ClientReport_getDataSetValues(self._handle)
+        if not values:
+            return []
+
+        # The values, reasons and references are each collected in one pass,
+        # with the functions looked up once for the whole data set
+        indexes = range(_mms_value.MmsValue_getArraySize(values))
+        get_element = _mms_value.MmsValue_getElement
+        elements = [get_element(values, index) for index in indexes]
+
+        if _client.ClientReport_hasReasonForInclusion(self._handle):
+            get_reason = _client.ClientReport_getReasonForInclusion
+            reasons = [ReasonForInclusion(get_reason(self._handle, index)) for index in indexes]
+        else:
+            reasons = [ReasonForInclusion.UNKNOWN] * len(indexes)
+
+        references: list[bytes | None]
+        if _client.ClientReport_hasDataReference(self._handle):
+            get_reference = _client.ClientReport_getDataReference
+            references = [get_reference(self._handle, index) for index in indexes]
+        else:
+            references = [None] * len(indexes)
+
+        return [
+            (MmsValue(element) if element else None, reason, reference)
+            for element, reason, reference in zip(elements, reasons, references)
+        ]
+
 
 class ReportControlBlock:
     """Report control block"""
 
+    __slots__ = ("_handle", "_element_changed", "_ied_connection", "_reference")
+
     def __init__(self, handle: ReportControlBlockPointer, ied_connection: "IedConnection"):
         self._handle = handle
         self._element_changed = RcbElement(0)
         self._ied_connection = ied_connection
+        self._reference: bytes | None = None
 
     @property
     def handle(self):
@@ -272,146 +324,150 @@ class ReportControlBlock:
 
     @property
     def reference(self) -> bytes:
-        """Reference of the report control block"""
-        return Wrapper.lib.ClientReportControlBlock_getObjectReference(self._handle)
+        """Reference of the report control block
+
+        The reference does not change, it is read once from the structure.
+        """
+        if self._reference is None:
+            self._reference = _client.ClientReportControlBlock_getObjectReference(self._handle)
+        return self._reference  # type: ignore
 
     @property
     def is_buffered(self) -> bool:
         """Indicate whether it is a buffered report control block (BRCB) or an unbeffered report control block (URCB)"""
-        return Wrapper.lib.ClientReportControlBlock_isBuffered(self._handle)
+        return _client.ClientReportControlBlock_isBuffered(self._handle)
 
     @property
     def rpt_id(self) -> bytes:
         """Value of the report id"""
-        return Wrapper.lib.ClientReportControlBlock_getRptId(self._handle)
+        return _client.ClientReportControlBlock_getRptId(self._handle)
 
     @rpt_id.setter
     def rpt_id(self, rpt_id: str | bytes):
         rpt_id = convert_to_bytes(rpt_id)
         self._element_changed |= RcbElement.RPT_ID
-        Wrapper.lib.ClientReportControlBlock_setRptId(self._handle, rpt_id)
+        _client.ClientReportControlBlock_setRptId(self._handle, rpt_id)
 
     @property
     def rpt_ena(self) -> bool:
         """Indicate whther the report control block is enabled"""
-        return Wrapper.lib.ClientReportControlBlock_getRptEna(self._handle)
+        return _client.ClientReportControlBlock_getRptEna(self._handle)
 
     @rpt_ena.setter
     def rpt_ena(self, rpt_ena: bool):
         self._element_changed |= RcbElement.RPT_ENA
-        Wrapper.lib.ClientReportControlBlock_setRptEna(self._handle, rpt_ena)
+        _client.ClientReportControlBlock_setRptEna(self._handle, rpt_ena)
 
     @property
     def resv(self) -> bool:
-        return Wrapper.lib.ClientReportControlBlock_getResv(self._handle)
+        return _client.ClientReportControlBlock_getResv(self._handle)
 
     @resv.setter
     def resv(self, resv: bool):
         self._element_changed |= RcbElement.RESV
-        Wrapper.lib.ClientReportControlBlock_setResv(self._handle, resv)
+        _client.ClientReportControlBlock_setResv(self._handle, resv)
 
     @property
     def dataset_reference(self) -> bytes:
-        return Wrapper.lib.ClientReportControlBlock_getDataSetReference(self._handle)
+        return _client.ClientReportControlBlock_getDataSetReference(self._handle)
 
     @dataset_reference.setter
     def dataset_reference(self, dataset_reference: str | bytes):
         dataset_reference = convert_to_bytes(dataset_reference)
         self._element_changed |= RcbElement.DATSET
-        Wrapper.lib.ClientReportControlBlock_setDataSetReference(self._handle, dataset_reference)
+        _client.ClientReportControlBlock_setDataSetReference(self._handle, dataset_reference)
 
     @property
     def conf_rev(self) -> int:
         """Value of the configuration revision"""
-        return Wrapper.lib.ClientReportControlBlock_getConfRev(self._handle)
+        return _client.ClientReportControlBlock_getConfRev(self._handle)
 
     @property
     def optflds(self) -> ReportOptions:
-        val: c_int = Wrapper.lib.ClientReportControlBlock_getOptFlds(self._handle)
-        return ReportOptions(val.value)
+        return ReportOptions(_client.ClientReportControlBlock_getOptFlds(self._handle))
 
     @optflds.setter
     def optflds(self, optflds: ReportOptions):
         self._element_changed |= RcbElement.OPT_FLDS
-        Wrapper.lib.ClientReportControlBlock_setOptFlds(self._handle, optflds.value)
+        _client.ClientReportControlBlock_setOptFlds(self._handle, optflds.value)
 
     @property
     def buf_tm(self) -> int:
-        return Wrapper.lib.ClientReportControlBlock_getBufTm(self._handle)
+        return _client.ClientReportControlBlock_getBufTm(self._handle)
 
     @buf_tm.setter
     def buf_tm(self, buf_tm: int):
         self._element_changed |= RcbElement.BUF_TM
-        return Wrapper.lib.ClientReportControlBlock_setBufTm(self._handle, buf_tm)
+        return _client.ClientReportControlBlock_setBufTm(self._handle, buf_tm)
 
     @property
     def sq_num(self) -> int:
-        return Wrapper.lib.ClientReportControlBlock_getSqNum(self._handle)
+        return _client.ClientReportControlBlock_getSqNum(self._handle)
 
     @property
     def trg_ops(self) -> ReportTriggerOptions:
-        val = Wrapper.lib.ClientReportControlBlock_getTrgOps(self._handle)
+        val = _client.ClientReportControlBlock_getTrgOps(self._handle)
         return ReportTriggerOptions(val)
 
     @trg_ops.setter
     def trg_ops(self, trg_ops: ReportTriggerOptions):
         self._element_changed |= RcbElement.TRG_OPS
-        Wrapper.lib.ClientReportControlBlock_setTrgOps(self._handle, trg_ops.value)
+        _client.ClientReportControlBlock_setTrgOps(self._handle, trg_ops.value)
 
     @property
     def intg_pd(self) -> int:
-        return Wrapper.lib.ClientReportControlBlock_getIntgPd(self._handle)
+        return _client.ClientReportControlBlock_getIntgPd(self._handle)
 
     @intg_pd.setter
     def intg_pd(self, intg_pd: int):
         self._element_changed |= RcbElement.INTG_PD
-        Wrapper.lib.ClientReportControlBlock_setIntgPd(self._handle, intg_pd)
+        _client.ClientReportControlBlock_setIntgPd(self._handle, intg_pd)
 
     @property
     def gi(self) -> bool:
-        return Wrapper.lib.ClientReportControlBlock_getGI(self._handle)
+        return _client.ClientReportControlBlock_getGI(self._handle)
 
     @gi.setter
     def gi(self, gi: bool):
         self._element_changed |= RcbElement.GI
-        Wrapper.lib.ClientReportControlBlock_setGI(self._handle, gi)
+        _client.ClientReportControlBlock_setGI(self._handle, gi)
 
     @property
     def purge_buf(self) -> bool:
-        return Wrapper.lib.ClientReportControlBlock_getPurgeBuf(self._handle)
+        return _client.ClientReportControlBlock_getPurgeBuf(self._handle)
 
     @purge_buf.setter
     def purge_buf(self, purge_buf: bool):
         self._element_changed |= RcbElement.PURGE_BUF
-        Wrapper.lib.ClientReportControlBlock_setPurgeBuf(self._handle, purge_buf)
+        _client.ClientReportControlBlock_setPurgeBuf(self._handle, purge_buf)
 
     def has_resv_tms(self) -> bool:
-        return Wrapper.lib.ClientReportControlBlock_hasResvTms(self._handle)
+        return _client.ClientReportControlBlock_hasResvTms(self._handle)
 
     @property
     def resv_tms(self) -> int:
-        return Wrapper.lib.ClientReportControlBlock_getResvTms(self._handle)
+        return _client.ClientReportControlBlock_getResvTms(self._handle)
 
     @resv_tms.setter
     def resv_tms(self, resv_tms: int):
         self._element_changed |= RcbElement.RESV_TMS
-        Wrapper.lib.ClientReportControlBlock_setResvTms(self._handle, resv_tms)
+        _client.ClientReportControlBlock_setResvTms(self._handle, resv_tms)
 
     @property
     def entry_id(self) -> MmsValue:
-        handle = Wrapper.lib.ClientReportControlBlock_getEntryId(self._handle)
+        handle = _client.ClientReportControlBlock_getEntryId(self._handle)
         return MmsValue(handle)
 
     @entry_id.setter
     def entry_id(self, entry_id: MmsValue):
         self._element_changed |= RcbElement.ENTRY_ID
-        Wrapper.lib.ClientReportControlBlock_setEntryId(self._handle, entry_id.handle)
+        _client.ClientReportControlBlock_setEntryId(self._handle, entry_id.handle)
 
     @property
     def entry_time(self) -> datetime.datetime:
-        return Wrapper.lib.ClientReportControlBlock_getEntryTime(self._handle)
+        return _client.ClientReportControlBlock_getEntryTime(self._handle)
 
     @property
     def owner(self) -> MmsValue:
-        handle = Wrapper.lib.ClientReportControlBlock_getOwner(self._handle)
+        handle = _client.ClientReportControlBlock_getOwner(self._handle)
         return MmsValue(handle)
@@ -1,5 +1,6 @@
 """Commmon API shared by client and server module"""
 
+from . import names
 from .cdc import CdcControlModelOptions, CdcOptions, extra_cdc_options
 from .common import (
     ACSIClass,
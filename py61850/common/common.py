@@ -1,4 +1,5 @@
 import datetime
+from ctypes import c_int
 from enum import Enum, Flag
 
 from ..binding.loader import Wrapper
@@ -103,6 +104,11 @@ class FunctionalConstraint(Enum):
     NONE = -1
 
 
+# c_int of each functional constraint, ctypes passes them without converting
+# the argument and the enum value does not have to be looked up on each call
+_FC_C_VALUES = {fc: c_int(fc.value) for fc in FunctionalConstraint}
+
+
 class Dbpos(Enum):
     INTERMEDIATE_STATE = 0
     OFF = 1
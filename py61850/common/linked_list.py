@@ -10,6 +10,11 @@ if TYPE_CHECKING:
 else:
     LinkedListPointer = ctypes.POINTER(_sLinkedList)
 
+# A node seen as an array of two pointers, both fields are read at once
+_NODE_FIELDS = ctypes.c_void_p * 2
+_DATA_INDEX = _sLinkedList.data.offset // ctypes.sizeof(ctypes.c_void_p)
+_NEXT_INDEX = _sLinkedList.next.offset // ctypes.sizeof(ctypes.c_void_p)
+
 
 class LinkedList:
     """LinkedList"""
@@ -49,40 +54,40 @@ class LinkedList:
     def to_string_list(self) -> list[bytes]:
         """Convert a linked_list of char* to a list of string
 
+        The data pointers are collected in a ``c_char_p`` array, ctypes
+        then converts all the strings at once when the array is sliced.
+
         Returns
         -------
         list[bytes]
             _description_
         """
-        result: list[bytes] = []
-        current = self._handle
-
-        while current:
-            node = current.contents
-            if node.data:
-                value = ctypes.string_at(node.data)
-                result.append(value)
-            current = node.next
-
-        return result
+        addresses = self.to_pointer_list()
+        return (ctypes.c_char_p * len(addresses))(*addresses)[:]
 
     def to_pointer_list(self) -> list[int]:
-        """_summary_
+        """Collect the data pointers of the linked list.
+
+        Each node is read directly from memory as an array of two pointers,
+        rather than dereferencing ``contents``/``next`` on each hop. The list
+        is walked once, without asking its size to the library first.
 
         Returns
         -------
         list[int]
-            _description_
+            Address of the data of each element
         """
-
-        result: list[int] = []
-        current = self._handle
-
-        while current:
-            node = current.contents
-            if node.data:
-                value = node.data
-                result.append(value)
-            current = node.next
-
-        return result
+        addresses: list[int] = []
+        if not self._handle:
+            return addresses
+
+        read_node = _NODE_FIELDS.from_address
+        address = ctypes.addressof(self._handle.contents)
+        while address:
+            node = read_node(address)
+            data = node[_DATA_INDEX]
+            if data:
+                addresses.append(data)
+            address = node[_NEXT_INDEX]
+
+        return addresses
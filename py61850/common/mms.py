@@ -140,61 +140,14 @@ class MmsValue:
         return self._handle
 
     def get_value(self):
-        mms_type = self.get_type()
-
-        if mms_type == MmsType.ARRAY:
-            return [
-                el if not isinstance(el := self.get_element(i), MmsValue) else el.get_value()
-                for i in range(self.size())
-            ]
-
-        if mms_type == MmsType.STRUCTURE:
-            return [
-                el if not isinstance(el := self.get_element(i), MmsValue) else el.get_value()
-                for i in range(self.size())
-            ]
-
-        if mms_type == MmsType.BOOLEAN:
-            return self.to_bool()
-
-        if mms_type == MmsType.BIT_STRING:
-            return self.to_bitstring()
-
-        if mms_type == MmsType.INTEGER:
-            return self.to_int64()
-
-        if mms_type == MmsType.UNSIGNED:
-            return self.to_uint32()
-
-        if mms_type == MmsType.FLOAT:
-            return self.to_double()
-
-        if mms_type == MmsType.OCTET_STRING:
-            return self.to_octet_string()
-
-        if mms_type == MmsType.VISIBLE_STRING:
-            return self.to_string()
+        """Convert the MmsValue to the matching python value
 
-        if mms_type == MmsType.GENERALIZED_TIME:
-            ...
-
-        if mms_type == MmsType.BINARY_TIME:
-            ...
-
-        if mms_type == MmsType.BCD:
-            ...
-
-        if mms_type == MmsType.OBJ_ID:
-            ...
-
-        if mms_type == MmsType.STRING:
-            return self.to_string()
-
-        if mms_type == MmsType.UTC_TIME:
-            return self.to_utc_time()
-
-        if mms_type == MmsType.DATA_ACCESS_ERROR:
-            return self.to_data_access_error()
+        Arrays and structures are converted to a list of their element
+        values. The whole tree is decoded by ``_decode`` which works on the
+        raw handles and type codes, without creating intermediate
+        ``MmsValue`` nor ``MmsType`` instances.
+        """
+        return _decode(Wrapper.lib, self._handle)
 
     @staticmethod
     def new_bool(value: bool) -> "MmsValue":
@@ -452,10 +405,7 @@ class MmsValue:
         """Convert the MmsValue to a bytearray"""
         size = Wrapper.lib.MmsValue_getOctetStringSize(self._handle)
         buffer_ptr = Wrapper.lib.MmsValue_getOctetStringBuffer(self._handle)
-        buffer = bytearray()
-        data = ctypes.string_at(buffer_ptr, size)
-        buffer.extend(data)
-        return buffer
+        return bytearray(ctypes.string_at(buffer_ptr, size))
 
     @staticmethod
     def new_array(element_type: MmsVariableSpecification, size: int) -> "MmsValue":
@@ -636,3 +586,45 @@ class MmsValue:
         raise MmsValueException(
             f"{mms_type} is not supported, only DATA_ACCESS_ERROR type is supported"
         )
+
+
+def _decode_octet_string(lib, handle) -> bytearray:
+    size = lib.MmsValue_getOctetStringSize(handle)
+    return bytearray(ctypes.string_at(lib.MmsValue_getOctetStringBuffer(handle), size))
+
+
+# Conversion of the leaf values, indexed by the raw MmsType value. Types
+# without conversion (GENERALIZED_TIME, BINARY_TIME, BCD, OBJ_ID) give None.
+_DECODERS = {
+    MmsType.BOOLEAN.value: lambda lib, handle: lib.MmsValue_getBoolean(handle),
+    MmsType.BIT_STRING.value: lambda lib, handle: lib.MmsValue_getBitStringAsInteger(handle),
+    MmsType.INTEGER.value: lambda lib, handle: lib.MmsValue_toInt64(handle),
+    MmsType.UNSIGNED.value: lambda lib, handle: lib.MmsValue_toUint32(handle),
+    MmsType.FLOAT.value: lambda lib, handle: lib.MmsValue_toDouble(handle),
+    MmsType.OCTET_STRING.value: _decode_octet_string,
+    MmsType.VISIBLE_STRING.value: lambda lib, handle: lib.MmsValue_toString(handle),
+    MmsType.STRING.value: lambda lib, handle: lib.MmsValue_toString(handle),
+    MmsType.UTC_TIME.value: lambda lib, handle: convert_to_datetime(
+        lib.MmsValue_getUtcTimeInMs(handle)
+    ),
+    MmsType.DATA_ACCESS_ERROR.value: lambda lib, handle: MmsDataAccessError(
+        lib.MmsValue_getDataAccessError(handle)
+    ),
+}
+
+_CONTAINER_TYPES = (MmsType.ARRAY.value, MmsType.STRUCTURE.value)
+
+
+def _decode(lib, handle):
+    """Python value of the MmsValue ``handle``, see ``MmsValue.get_value``"""
+    mms_type = lib.MmsValue_getType(handle)
+    if mms_type in _CONTAINER_TYPES:
+        values = []
+        for index in range(lib.MmsValue_getArraySize(handle)):
+            element = lib.MmsValue_getElement(handle, index)
+            values.append(_decode(lib, element) if element else None)
+        return values
+    decoder = _DECODERS.get(mms_type)
+    if decoder is None:
+        return None
+    return decoder(lib, handle)
@@ -0,0 +1,37 @@
+"""Names of data objects and data attributes already encoded as bytes
+
+Names given as ``bytes`` are passed as is to the C library, they do not
+need to be encoded on each call.
+"""
+
+# Data objects of LLN0 / LPHD
+MOD = b"Mod"
+BEH = b"Beh"
+HEALTH = b"Health"
+NAM_PLT = b"NamPlt"
+
+# Status
+ST_VAL = b"stVal"
+Q = b"q"
+T = b"t"
+GENERAL = b"general"
+
+# Measurands
+MAG = b"mag"
+MAG_F = b"mag.f"
+MAG_I = b"mag.i"
+INST_MAG = b"instMag"
+INST_MAG_F = b"instMag.f"
+INST_MAG_I = b"instMag.i"
+
+# Settings
+SET_VAL = b"setVal"
+SET_MAG = b"setMag"
+
+# Controls
+CTL_MODEL = b"ctlModel"
+CTL_VAL = b"ctlVal"
+OPER = b"Oper"
+SBO = b"SBO"
+SBOW = b"SBOw"
+CANCEL = b"Cancel"
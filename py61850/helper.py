@@ -1,4 +1,5 @@
 import ctypes
+import functools
 from datetime import datetime, timedelta, timezone
 
 
@@ -24,10 +25,17 @@ def convert_to_bytes(content: str | bytes) -> bytes:
         _description_
     """
     if isinstance(content, str):
-        return content.encode("utf-8")
+        return _encode(content)
     return content
 
 
+@functools.lru_cache(maxsize=4096)
+def _encode(content: str) -> bytes:
+    # Object references are usually the same few strings passed over and
+    # over, keep their encoded form instead of encoding them on each call
+    return content.encode("utf-8")
+
+
 def convert_to_str(content: str | bytes) -> str:
     """_summary_
 
@@ -2,10 +2,14 @@
 
 import ctypes
 import datetime
-from collections.abc import Callable
+import functools
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from enum import Enum, Flag
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from ..binding.iec61850 import cdc as _cdc
+from ..binding.iec61850 import dynamic_model as _dynamic_model
+from ..binding.iec61850 import model as _model
 from ..binding.iec61850.model import DataAttribute as _cDataAttribute
 from ..binding.iec61850.model import DataObject as _cDataObject
 from ..binding.iec61850.model import IedModel as _cIedModel
@@ -13,6 +17,7 @@ from ..binding.iec61850.model import LogicalDevice as _cLogicalDevice
 from ..binding.iec61850.model import LogicalNode as _cLogicalNode
 from ..binding.iec61850.model import ModelNode as _cModelNode
 from ..binding.iec61850.model import SettingGroupControlBlock as _cSettingGroupControlBlock
+from ..binding.iec61850.model import unpack_model_node
 from ..binding.loader import Wrapper
 from ..common import (
     CdcControlModelOptions,
@@ -28,6 +33,7 @@ from ..common import (
     Timestamp,
     extra_cdc_options,
 )
+from ..common.common import _FC_C_VALUES
 from ..helper import (
     convert_to_bytes,
     convert_to_datetime,
@@ -58,6 +64,13 @@ else:
     DataAttributePointer = ctypes.POINTER(_cDataAttribute)
     SGCBPointer = ctypes.POINTER(_cSettingGroupControlBlock)
 
+# Pointer types used at runtime for casts, resolved once
+_P_MODEL_NODE = ctypes.POINTER(_cModelNode)
+_P_LOGICAL_DEVICE = ctypes.POINTER(_cLogicalDevice)
+_P_LOGICAL_NODE = ctypes.POINTER(_cLogicalNode)
+_P_DATA_OBJECT = ctypes.POINTER(_cDataObject)
+_P_DATA_ATTRIBUTE = ctypes.POINTER(_cDataAttribute)
+
 
 class DataAttributeType(Enum):
     """Represent the type of a ``DataAttribute``"""
@@ -192,7 +205,7 @@ class IedModel:
 
     def __init__(self, name: str | bytes) -> None:
         name = convert_to_bytes(name)
-        handle = Wrapper.lib.IedModel_create(name)
+        handle = _dynamic_model.IedModel_create(name)
         if not handle:
             raise RuntimeError(f"Failed to create IedModel '{convert_to_str(name)}'")
         self._internal_init(handle)
@@ -200,6 +213,7 @@ class IedModel:
     def _internal_init(self, handle: IedModelPointer):
         self._handle = handle
         self._model_nodes: dict[int, "ModelNode"] = {}
+        self._nodes_by_reference: dict[tuple[bytes, bool], "ModelNode"] = {}
         self._sgcbs: dict[int, "SettingGroupControlBlock"] = {}
 
     # def __del__(self):
@@ -263,7 +277,7 @@ class IedModel:
         inst = convert_to_bytes(inst)
         if name is not None:
             name = convert_to_bytes(name)
-        handle = Wrapper.lib.LogicalDevice_createEx(inst, self._handle, name)
+        handle = _dynamic_model.LogicalDevice_createEx(inst, self._handle, name)
         if not handle:
             raise RuntimeError(f"Failed to create LogicalDevice '{convert_to_str(inst)}'")
         return LogicalDevice(handle, self)
@@ -273,6 +287,21 @@ class IedModel:
         """Pointer to the underlying C structure"""
         return self._handle
 
+    @property
+    def logical_devices(self) -> list["LogicalDevice"]:
+        """Logical devices of the model, in the order of the model
+
+        The list is read from the ``firstChild``/``sibling`` fields of the
+        structures, there is no library call per logical device.
+        """
+        devices = []
+        first_child = self._handle.contents.firstChild
+        address = ctypes.addressof(first_child.contents) if first_child else 0
+        while address:
+            devices.append(LogicalDevice(ctypes.cast(address, _P_LOGICAL_DEVICE), self))
+            address = unpack_model_node(address)[3]
+        return devices
+
     def logical_device_by_instance(self, ld_inst: str | bytes) -> "LogicalDevice | None":
         """Lookup logical device (LD) by device instance name
 
@@ -287,7 +316,7 @@ class IedModel:
             Return the LogicalDevice or None if the instance is not found
         """
         ld_inst = convert_to_bytes(ld_inst)
-        handle = Wrapper.lib.IedModel_getDeviceByInst(self._handle, ld_inst)
+        handle = _model.IedModel_getDeviceByInst(self._handle, ld_inst)
         if handle:
             return LogicalDevice(handle, self)
         return None
@@ -300,7 +329,9 @@ class IedModel:
     @name.setter
     def name(self, new_name: str | bytes):
         new_name = convert_to_bytes(new_name)
-        Wrapper.lib.IedModel_setIedNameForDynamicModel(self._handle, new_name)
+        _dynamic_model.IedModel_setIedNameForDynamicModel(self._handle, new_name)
+        # Full references contain the IED name
+        self._nodes_by_reference.clear()
 
     def _try_create_model_node(self, handle) -> "ModelNode | None":
         if handle:
@@ -334,8 +365,13 @@ class IedModel:
             ModelNode instance or None if model node does not exist
         """
         obj_ref = convert_to_bytes(obj_ref)
-        handle = Wrapper.lib.IedModel_getModelNodeByObjectReference(self._handle, obj_ref)
-        return self._try_create_model_node(handle)
+        model_node = self._nodes_by_reference.get((obj_ref, False))
+        if model_node is None:
+            handle = _model.IedModel_getModelNodeByObjectReference(self._handle, obj_ref)
+            model_node = self._try_create_model_node(handle)
+            if model_node is not None:
+                self._nodes_by_reference[(obj_ref, False)] = model_node
+        return model_node
 
     def model_node_by_short_reference(self, obj_ref: str | bytes) -> "ModelNode | None":
         """Lookup a model node by its short reference.
@@ -356,11 +392,16 @@ class IedModel:
             ModelNode instance or None if model node does not exist
         """
         obj_ref = convert_to_bytes(obj_ref)
-        handle = Wrapper.lib.IedModel_getModelNodeByShortObjectReference(
-            self._handle,
-            obj_ref,
-        )
-        return self._try_create_model_node(handle)
+        model_node = self._nodes_by_reference.get((obj_ref, True))
+        if model_node is None:
+            handle = _model.IedModel_getModelNodeByShortObjectReference(
+                self._handle,
+                obj_ref,
+            )
+            model_node = self._try_create_model_node(handle)
+            if model_node is not None:
+                self._nodes_by_reference[(obj_ref, True)] = model_node
+        return model_node
 
 
 class ModelNode:
@@ -369,24 +410,31 @@ class ModelNode:
     def __init__(self, handle: ModelNodePointer, parent: "ModelNode | IedModel") -> None:
         self._handle = handle
         self._parent = parent
+        self._children: dict[bytes, "ModelNode"] = {}
 
     @property
     def handle(self) -> ModelNodePointer:
         """Pointer to the underlying C structure"""
         return self._handle
 
-    @property
+    @functools.cached_property
     def addressof(self) -> int:
+        """Address of the underlying C structure, nodes are never moved"""
         return ctypes.addressof(self._handle.contents)
 
-    @property
+    @functools.cached_property
+    def _model_node_handle(self) -> ModelNodePointer:
+        """Handle cast once to ``ModelNode*`` for the functions expecting a generic node"""
+        return ctypes.cast(self._handle, _P_MODEL_NODE)
+
+    @functools.cached_property
     def name(self) -> bytes:
-        """Name of the node"""
+        """Name of the node, it does not change and is read once from the structure"""
         return self._handle.contents.name
 
-    @property
+    @functools.cached_property
     def model_type(self) -> ModelNodeType:
-        """Type of the node"""
+        """Type of the node, it does not change and is read once from the structure"""
         return ModelNodeType(self._handle.contents.modelType)
 
     @property
@@ -411,17 +459,60 @@ class ModelNode:
             ModelNode instance or None if model node does not exist
         """
         obj_ref = convert_to_bytes(obj_ref)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.ModelNode_getChild(model_node_ptr, obj_ref)
+        child = self._children.get(obj_ref)
+        if child is not None:
+            return child
+
+        model_node_ptr = self._model_node_handle
+        handle = _model.ModelNode_getChild(model_node_ptr, obj_ref)
 
         if handle:
-            modeltype = ModelNodeType(handle.contents.modelType)
-            if modeltype == ModelNodeType.LOGICAL_NODE:
-                return LogicalNode(handle, self)
-            if modeltype == ModelNodeType.DATA_OBJECT:
-                return DataObject(handle, self)
-            if modeltype == ModelNodeType.DATA_ATTRIBUTE:
-                return DataAttribute(handle, self)
+            child = self._create_child(handle, handle.contents.modelType)
+        if child is not None:
+            # Nodes are never removed from a model, the lookup can be kept
+            self._children[obj_ref] = child
+        return child
+
+    @property
+    def children(self) -> list["ModelNode"]:
+        """Direct children of the node, in the order of the model"""
+        children = []
+        address = unpack_model_node(self.addressof)[4]
+        while address:
+            model_type, name_address, _, sibling, _ = unpack_model_node(address)
+            # Array elements have no name
+            name = ctypes.string_at(name_address) if name_address else None
+            child = self._children.get(name) if name else None
+            if child is None:
+                child = self._create_child(ctypes.cast(address, _P_MODEL_NODE), model_type)
+                if child is not None and name:
+                    self._children[name] = child
+            if child is not None:
+                children.append(child)
+            address = sibling
+        return children
+
+    def descendants(self) -> Iterator["ModelNode"]:
+        """Iterate over all the nodes below the node, depth first
+
+        The model is walked with an explicit stack instead of recursive
+        calls, and each level is read with ``children``, not with one
+        library call per child.
+        """
+        stack = self.children[::-1]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.children[::-1])
+
+    def _create_child(self, handle: ModelNodePointer, model_type: int) -> "ModelNode | None":
+        modeltype = ModelNodeType(model_type)
+        if modeltype == ModelNodeType.LOGICAL_NODE:
+            return LogicalNode(handle, self)
+        if modeltype == ModelNodeType.DATA_OBJECT:
+            return DataObject(handle, self)
+        if modeltype == ModelNodeType.DATA_ATTRIBUTE:
+            return DataAttribute(handle, self)
         return None
 
 
@@ -430,10 +521,11 @@ class LogicalDevice(ModelNode):
 
     def __init__(self, handle: LogicalDevicePointer, ied_model: "IedModel") -> None:
         super().__init__(handle, ied_model)  # type:ignore
-        self._handle = ctypes.cast(self._handle, ctypes.POINTER(_cLogicalDevice))
+        if not isinstance(self._handle, _P_LOGICAL_DEVICE):
+            self._handle = ctypes.cast(self._handle, _P_LOGICAL_DEVICE)
         self._ied_model = ied_model
 
-    @property
+    @functools.cached_property
     def ld_name(self) -> bytes | None:
         """Return the optional ldName attribute"""
         return self._handle.contents.ldName
@@ -463,18 +555,61 @@ class LogicalDevice(ModelNode):
         """
         name = convert_to_bytes(name)
 
-        handle = Wrapper.lib.LogicalNode_create(name, self._handle)
+        handle = _dynamic_model.LogicalNode_create(name, self._handle)
         if not handle:
             raise RuntimeError(f"Failed to create LogicalNode '{convert_to_str(name)}'")
         return LogicalNode(handle, self)
 
     def LogicalDevice_getSettingGroupControlBlock(self):
-        return Wrapper.lib.LogicalDevice_getSettingGroupControlBlock(self._handle)
+        return _model.LogicalDevice_getSettingGroupControlBlock(self._handle)
 
 
 class _LogicalNodeOrDataObject(ModelNode):
     """Private class to be used as base class for LogicalNode and DataObject"""
 
+    def create_data_objects(
+        self,
+        specs: Iterable[tuple[str, str | bytes, Mapping[str, Any]]],
+    ) -> list["DataObject"]:
+        """Create several data objects in a row
+
+        Parameters
+        ----------
+        specs : Iterable[tuple[str, str | bytes, Mapping[str, Any]]]
+            For each data object, the common data class (e.g. "sps",
+            "apc"), the name of the data object and the other arguments
+            of the matching ``create_cdc_*`` method.
+
+        Returns
+        -------
+        list[DataObject]
+            DataObject created, in the order of ``specs``
+
+        Raises
+        ------
+        RuntimeError
+            If one of the data objects cannot be created
+
+        Examples
+        --------
+        >>> ind1, ind2, an_out1 = ggio1.create_data_objects(
+        ...     [
+        ...         ("sps", "Ind1", {}),
+        ...         ("sps", "Ind2", {}),
+        ...         ("apc", "AnOut1", {"is_integer_not_float": False}),
+        ...     ]
+        ... )
+        """
+        factories: dict[str, Callable[..., "DataObject"]] = {}
+        data_objects = []
+        for cdc, name, kwargs in specs:
+            factory = factories.get(cdc)
+            if factory is None:
+                factory = getattr(self, f"create_cdc_{cdc.lower()}")
+                factories[cdc] = factory
+            data_objects.append(factory(name, **kwargs))
+        return data_objects
+
     ####################################################
     # Common Data Classes (CDC)
     ####################################################
@@ -486,8 +621,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_SPS_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_SPS_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -499,8 +634,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_DPS_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_DPS_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -512,8 +647,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_INS_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_INS_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -525,8 +660,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_ENS_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_ENS_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -538,8 +673,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_BCR_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_BCR_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -551,8 +686,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_VSS_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_VSS_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -564,8 +699,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_SEC_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_SEC_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -578,8 +713,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_MV_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_MV_create(
             name, model_node_ptr, additional_options.value, is_integer_not_float
         )
         if not handle:
@@ -593,8 +728,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_CMV_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_CMV_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -607,8 +742,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_SAV_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_SAV_create(
             name, model_node_ptr, additional_options.value, is_integer_not_float
         )
         if not handle:
@@ -621,8 +756,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_LPL_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_LPL_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -634,8 +769,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_HST_create(name, model_node_ptr, additional_options.value, maxPts)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_HST_create(name, model_node_ptr, additional_options.value, maxPts)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -646,8 +781,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_ACD_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_ACD_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -658,8 +793,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_ACT_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_ACT_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -670,8 +805,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_SPG_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_SPG_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -682,8 +817,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_VSG_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_VSG_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -694,8 +829,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_ENG_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_ENG_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -706,8 +841,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_ING_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_ING_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -719,8 +854,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_ASG_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_ASG_create(
             name, model_node_ptr, additional_options.value, is_integer_not_float
         )
         if not handle:
@@ -733,8 +868,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_WYE_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_WYE_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -745,8 +880,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         additional_options: CdcOptions = CdcOptions(0),
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_DEL_create(name, model_node_ptr, additional_options.value)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_DEL_create(name, model_node_ptr, additional_options.value)
         if not handle:
             raise RuntimeError(f"Failed to create DataObject '{convert_to_str(name)}'")
         return DataObject(handle, self)
@@ -762,8 +897,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_SPC_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_SPC_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -780,8 +915,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_DPC_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_DPC_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -798,8 +933,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_INC_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_INC_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -816,8 +951,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_ENC_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_ENC_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -835,8 +970,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_BSC_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_BSC_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -855,8 +990,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_ISC_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_ISC_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -875,8 +1010,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_APC_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_APC_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -895,8 +1030,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_BAC_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_BAC_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -916,8 +1051,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_SPV_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_SPV_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -938,8 +1073,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_STV_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_STV_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -962,8 +1097,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_CMD_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_CMD_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -986,8 +1121,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_ALM_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_ALM_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -1008,8 +1143,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_CTE_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_CTE_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -1030,8 +1165,8 @@ class _LogicalNodeOrDataObject(ModelNode):
         control_options: CdcControlModelOptions = CdcControlModelOptions.MODEL_NONE,
     ) -> "DataObject":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CDC_TMS_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CDC_TMS_create(
             name,
             model_node_ptr,
             additional_options.value,
@@ -1049,7 +1184,8 @@ class LogicalNode(_LogicalNodeOrDataObject):
 
     def __init__(self, handle: ModelNodePointer, parent: ModelNode | IedModel) -> None:
         super().__init__(handle, parent)
-        self._handle = ctypes.cast(self._handle, ctypes.POINTER(_cLogicalNode))
+        if not isinstance(self._handle, _P_LOGICAL_NODE):
+            self._handle = ctypes.cast(self._handle, _P_LOGICAL_NODE)
 
     def create_setting_group_control_block(
         self, act_sg: int, num_of_sg: int
@@ -1077,7 +1213,7 @@ class LogicalNode(_LogicalNodeOrDataObject):
         RuntimeError
             _description_
         """
-        handle = Wrapper.lib.SettingGroupControlBlock_create(self._handle, act_sg, num_of_sg)
+        handle = _dynamic_model.SettingGroupControlBlock_create(self._handle, act_sg, num_of_sg)
         if not handle:
             raise RuntimeError("Failed to create SettingGroupControlBlock")
         return SettingGroupControlBlock(handle)
@@ -1101,7 +1237,7 @@ class LogicalNode(_LogicalNodeOrDataObject):
             _description_
         """
         name = convert_to_bytes(name)
-        handle = Wrapper.lib.DataSet_create(name, self._handle)
+        handle = _dynamic_model.DataSet_create(name, self._handle)
         if not handle:
             raise RuntimeError(f"Failed to create Dataset '{convert_to_str(name)}'")
 
@@ -1170,7 +1306,7 @@ class LogicalNode(_LogicalNodeOrDataObject):
         """
         name = convert_to_bytes(name)
         rpt_id = convert_to_bytes(rpt_id)
-        handle = Wrapper.lib.ReportControlBlock_create(
+        handle = _dynamic_model.ReportControlBlock_create(
             name,
             self._handle,
             rpt_id,
@@ -1229,7 +1365,7 @@ class LogicalNode(_LogicalNodeOrDataObject):
         app_id = convert_to_bytes(app_id)
         if dataset_name is not None:
             dataset_name = convert_to_bytes(dataset_name)
-        handle = Wrapper.lib.GSEControlBlock_create(
+        handle = _dynamic_model.GSEControlBlock_create(
             name,
             self.handle,
             app_id,
@@ -1291,7 +1427,7 @@ class LogicalNode(_LogicalNodeOrDataObject):
         sv_id = convert_to_bytes(sv_id)
         if dataset_name is not None:
             dataset_name = convert_to_bytes(dataset_name)
-        handle = Wrapper.lib.SVControlBlock_create(
+        handle = _dynamic_model.SVControlBlock_create(
             name,
             self._handle,
             name,
@@ -1314,7 +1450,9 @@ class DataObject(_LogicalNodeOrDataObject):
 
     def __init__(self, handle: ModelNodePointer, parent: ModelNode | IedModel) -> None:
         super().__init__(handle, parent)
-        self._handle = ctypes.cast(self._handle, ctypes.POINTER(_cDataObject))
+        if not isinstance(self._handle, _P_DATA_OBJECT):
+            # Handles returned by the *_create functions are already typed
+            self._handle = ctypes.cast(self._handle, _P_DATA_OBJECT)
 
     def child_with_fc(
         self,
@@ -1336,8 +1474,8 @@ class DataObject(_LogicalNodeOrDataObject):
             _description_
         """
         obj_ref = convert_to_bytes(obj_ref)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.ModelNode_getChildWithFc(model_node_ptr, obj_ref, fc.value)
+        model_node_ptr = self._model_node_handle
+        handle = _model.ModelNode_getChildWithFc(model_node_ptr, obj_ref, _FC_C_VALUES[fc])
 
         if handle:
             return DataAttribute(handle, self)
@@ -1356,8 +1494,8 @@ class DataObject(_LogicalNodeOrDataObject):
         is_integer_not_float: bool,
     ) -> "DataAttribute":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CAC_AnalogueValue_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CAC_AnalogueValue_create(
             name,
             model_node_ptr,
             fc.value,
@@ -1376,8 +1514,8 @@ class DataObject(_LogicalNodeOrDataObject):
         has_transient_indicator: bool,
     ) -> "DataAttribute":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CAC_ValWithTrans_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CAC_ValWithTrans_create(
             name,
             model_node_ptr,
             fc.value,
@@ -1396,8 +1534,8 @@ class DataObject(_LogicalNodeOrDataObject):
         options,
     ) -> "DataAttribute":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CAC_Vector_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CAC_Vector_create(
             name,
             model_node_ptr,
             options,
@@ -1416,8 +1554,8 @@ class DataObject(_LogicalNodeOrDataObject):
         has_z_val: bool,
     ) -> "DataAttribute":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CAC_Point_create(
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CAC_Point_create(
             name,
             model_node_ptr,
             fc.value,
@@ -1430,8 +1568,8 @@ class DataObject(_LogicalNodeOrDataObject):
 
     def create_cac_scaled_value_config(self, name: str | bytes) -> "DataAttribute":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CAC_ScaledValueConfig_create(name, model_node_ptr)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CAC_ScaledValueConfig_create(name, model_node_ptr)
         if not handle:
             raise RuntimeError(f"Failed to create DataAttribute '{convert_to_str(name)}'")
         return DataAttribute(handle, self)
@@ -1442,19 +1580,45 @@ class DataObject(_LogicalNodeOrDataObject):
         has_magnitude: bool,
     ) -> "DataAttribute":
         name = convert_to_bytes(name)
-        model_node_ptr = ctypes.cast(self._handle, ctypes.POINTER(_cModelNode))
-        handle = Wrapper.lib.CAC_Unit_create(name, model_node_ptr, has_magnitude)
+        model_node_ptr = self._model_node_handle
+        handle = _cdc.CAC_Unit_create(name, model_node_ptr, has_magnitude)
         if not handle:
             raise RuntimeError(f"Failed to create DataAttribute '{convert_to_str(name)}'")
         return DataAttribute(handle, self)
 
 
+# MmsValue setter writing a python value in the value of a data attribute,
+# for each type of data attribute supported by ``DataAttribute.set_value``
+_VALUE_SETTERS = {
+    DataAttributeType.BOOLEAN: "MmsValue_setBoolean",
+    DataAttributeType.INT8: "MmsValue_setInt8",
+    DataAttributeType.INT16: "MmsValue_setInt16",
+    DataAttributeType.INT32: "MmsValue_setInt32",
+    DataAttributeType.INT64: "MmsValue_setInt64",
+    DataAttributeType.INT8U: "MmsValue_setUint8",
+    DataAttributeType.INT16U: "MmsValue_setUint16",
+    DataAttributeType.INT24U: "MmsValue_setUint32",
+    DataAttributeType.INT32U: "MmsValue_setUint32",
+    DataAttributeType.FLOAT32: "MmsValue_setFloat",
+    DataAttributeType.FLOAT64: "MmsValue_setDouble",
+    DataAttributeType.ENUMERATED: "MmsValue_setInt32",
+    DataAttributeType.VISIBLE_STRING_32: "MmsValue_setVisibleString",
+    DataAttributeType.VISIBLE_STRING_64: "MmsValue_setVisibleString",
+    DataAttributeType.VISIBLE_STRING_65: "MmsValue_setVisibleString",
+    DataAttributeType.VISIBLE_STRING_129: "MmsValue_setVisibleString",
+    DataAttributeType.VISIBLE_STRING_255: "MmsValue_setVisibleString",
+    DataAttributeType.QUALITY: "MmsValue_setBitStringFromInteger",
+    DataAttributeType.TIMESTAMP: "MmsValue_setUtcTimeMs",
+}
+
+
 class DataAttribute(ModelNode):
     """DataAttribute according IEC 61850"""
 
     def __init__(self, handle: ModelNodePointer, parent: ModelNode | IedModel) -> None:
         super().__init__(handle, parent)
-        self._handle = ctypes.cast(self._handle, ctypes.POINTER(_cDataAttribute))
+        if not isinstance(self._handle, _P_DATA_ATTRIBUTE):
+            self._handle = ctypes.cast(self._handle, _P_DATA_ATTRIBUTE)
 
     def init_value(self, value: MmsValue):
         """Set the initial value before the server is started
@@ -1464,22 +1628,58 @@ class DataAttribute(ModelNode):
         value : MmsValue
             Value when server will start
         """
-        Wrapper.lib.DataAttribute_setValue(self._handle, value.handle)
+        _dynamic_model.DataAttribute_setValue(self.addressof, value.handle)
+
+    def set_value(self, value: bool | int | float | str | bytes):
+        """Write a python value in the value of the data attribute
+
+        The setter matching the type of the attribute is looked up on the
+        first call only, the value is then written in place without
+        creating a ``MmsValue``. Like ``init_value``, it is meant to set the
+        value before the server is started.
+
+        Parameters
+        ----------
+        value : bool | int | float | str | bytes
+            New value, a timestamp is given in milliseconds since epoch and
+            a quality as an int
+
+        Raises
+        ------
+        TypeError
+            The type of the data attribute is not supported
+        """
+        self._value_setter(value)
+
+    @functools.cached_property
+    def _value_setter(self) -> Callable[[Any], None]:
+        attribute_type = self.attribute_type
+        name = _VALUE_SETTERS.get(attribute_type)
+        if name is None:
+            raise TypeError(f"Cannot set a value of type {attribute_type.name}")
+        mms_value = self._handle.contents.mmsValue
+        if not mms_value:
+            raise RuntimeError(f"DataAttribute '{convert_to_str(self.name)}' has no value")
+
+        setter = functools.partial(getattr(Wrapper.lib, name), mms_value)
+        if name == "MmsValue_setVisibleString":
+            return lambda value: setter(convert_to_bytes(value))
+        return setter
 
     @property
     def attribute_type(self) -> DataAttributeType:
         """Type of the data attribute"""
-        return DataAttributeType(Wrapper.lib.DataAttribute_getType(self._handle))
+        return DataAttributeType(_dynamic_model.DataAttribute_getType(self._handle))
 
     @property
     def trigger_options(self) -> DataAttributeTriggerOptions:
         """Indicate trigger option that can generate an event"""
-        return DataAttributeTriggerOptions(Wrapper.lib.DataAttribute_getTrgOps(self._handle))
+        return DataAttributeTriggerOptions(_dynamic_model.DataAttribute_getTrgOps(self._handle))
 
     @property
     def fc(self) -> FunctionalConstraint:
         """Functional constraint of the data attribute"""
-        return FunctionalConstraint(Wrapper.lib.DataAttribute_getFC(self._handle))
+        return FunctionalConstraint(_dynamic_model.DataAttribute_getFC(self._handle))
 
 
 class SettingGroupControlBlock:
@@ -1493,8 +1693,9 @@ class SettingGroupControlBlock:
         """Pointer to the underlying C structure"""
         return self._handle
 
-    @property
+    @functools.cached_property
     def addressof(self) -> int:
+        """Address of the underlying C structure, the SGCB is never moved"""
         return ctypes.addressof(self._handle.contents)
 
     @property
@@ -1566,7 +1767,7 @@ class Dataset:
         variable = convert_to_bytes(variable)
         if component is not None:
             component = convert_to_bytes(component)
-        handle = Wrapper.lib.DataSetEntry_create(self._handle, variable, index, component)
+        handle = _dynamic_model.DataSetEntry_create(self._handle, variable, index, component)
         if not handle:
             raise RuntimeError(f"Failed to create DatasetEntry '{convert_to_str(variable)}'")
         return DatasetEntry(handle)
@@ -1574,7 +1775,7 @@ class Dataset:
     @property
     def name(self) -> bytes:
         """Name of the dataset"""
-        return Wrapper.lib.DataSet_getName(
+        return _dynamic_model.DataSet_getName(
             self._handle,  # DataSet* self
         ).split(
             b"$"
@@ -1583,7 +1784,7 @@ class Dataset:
     @property
     def size(self) -> int:
         """Number of entry in the dataset"""
-        return Wrapper.lib.DataSet_getSize(
+        return _dynamic_model.DataSet_getSize(
             self._handle,  # DataSet* self
         )
 
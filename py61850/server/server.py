@@ -2,16 +2,15 @@
 
 import ctypes
 import datetime
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from enum import Enum, Flag
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal, get_args
 
-from ..binding.iec61850.model import DataAttribute as _cDataAttribute
+from ..binding.iec61850 import server as _server
 from ..binding.iec61850.model import DataObject as _cDataObject
 from ..binding.iec61850.model import IedModel as _cIedModel
 from ..binding.iec61850.model import LogicalDevice as _cLogicalDevice
 from ..binding.iec61850.model import ModelNode as _cModelNode
-from ..binding.iec61850.model import SettingGroupControlBlock as _cSettingGroupControlBlock
 from ..binding.iec61850.server import (
     ActiveSettingGroupChangedHandler,
     ControlHandler,
@@ -31,7 +30,6 @@ from ..binding.iec61850.server import (
     SVCBEventHandler,
     WriteAccessHandler,
 )
-from ..binding.loader import Wrapper
 from ..binding.mms import MmsValue as _cMmsValue
 from ..common import (
     ControlAddCause,
@@ -46,7 +44,6 @@ from ..common import (
     Timestamp,
 )
 from ..helper import (
-    address_of,
     convert_to_bytes,
     convert_to_datetime,
     convert_to_uint64,
@@ -71,8 +68,6 @@ if TYPE_CHECKING:
     ModelNodePointer = ctypes._Pointer[_cModelNode]
     LogicalDevicePointer = ctypes._Pointer[_cLogicalDevice]
     DataObjectPointer = ctypes._Pointer[_cDataObject]
-    DataAttributePointer = ctypes._Pointer[_cDataAttribute]
-    SGCBPointer = ctypes._Pointer[_cSettingGroupControlBlock]
     MmsValuePointer = ctypes._Pointer[_cMmsValue]
 else:
     Pointer = ctypes.POINTER
@@ -80,8 +75,6 @@ else:
     ModelNodePointer = ctypes.POINTER(_cModelNode)
     LogicalDevicePointer = ctypes.POINTER(_cLogicalDevice)
     DataObjectPointer = ctypes.POINTER(_cDataObject)
-    DataAttributePointer = ctypes.POINTER(_cDataAttribute)
-    SGCBPointer = ctypes.POINTER(_cSettingGroupControlBlock)
     MmsValuePointer = ctypes.POINTER(_cMmsValue)
 
 
@@ -140,20 +133,22 @@ class ReportSetting(Flag):
 class ClientConnection:
     """Client connection with a server"""
 
+    __slots__ = ("_handle",)
+
     def __init__(self, handle: int) -> None:
         self._handle = handle
 
     def local_address(self) -> bytes:
-        return Wrapper.lib.ClientConnection_getPeerAddress(self._handle)
+        return _server.ClientConnection_getPeerAddress(self._handle)
 
     def peer_address(self) -> bytes:
-        return Wrapper.lib.ClientConnection_getLocalAddress(self._handle)
+        return _server.ClientConnection_getLocalAddress(self._handle)
 
     def abort(self):
-        Wrapper.lib.ClientConnection_abort(self._handle)
+        _server.ClientConnection_abort(self._handle)
 
     def release(self):
-        Wrapper.lib.ClientConnection_release(self._handle)
+        _server.ClientConnection_release(self._handle)
 
         # Wrapper.lib.ClientConnection_claimOwnership.argtypes = [
         #     ClientConnection,  # ClientConnection self
@@ -174,6 +169,8 @@ class ClientConnection:
 class ControlAction:
     """Provide additional information on a control action from a client"""
 
+    __slots__ = ("_handle",)
+
     def __init__(self, handle: ctypes.c_void_p) -> None:
         self._handle = handle
 
@@ -185,7 +182,7 @@ class ControlAction:
         error : ControlLastApplError
             _description_
         """
-        Wrapper.lib.ControlAction_setError(self._handle, error.value)
+        _server.ControlAction_setError(self._handle, error.value)
 
     def set_add_cause(self, add_cause: ControlAddCause):
         """Sets the add cause for the next command termination or application error message.
@@ -195,7 +192,7 @@ class ControlAction:
         add_cause : ControlAddCause
             _description_
         """
-        Wrapper.lib.ControlAction_setAddCause(self._handle, add_cause.value)
+        _server.ControlAction_setAddCause(self._handle, add_cause.value)
 
     def get_originator_category(self) -> OrCat:
         """Gets the originator category provided by the client.
@@ -205,7 +202,7 @@ class ControlAction:
         OrCat
             _description_
         """
-        value = Wrapper.lib.ControlAction_getOrCat(self._handle)
+        value = _server.ControlAction_getOrCat(self._handle)
         return OrCat(value)
 
     def get_originator_identifier(self) -> bytes:
@@ -217,7 +214,7 @@ class ControlAction:
             _description_
         """
         or_ident_size = ctypes.c_int(0)
-        ptr = Wrapper.lib.ControlAction_getOrIdent(self._handle, ctypes.byref(or_ident_size))
+        ptr = _server.ControlAction_getOrIdent(self._handle, ctypes.byref(or_ident_size))
         if not ptr:
             return b""
         array_type = ctypes.c_uint8 * or_ident_size.value
@@ -232,7 +229,7 @@ class ControlAction:
         int
             _description_
         """
-        return Wrapper.lib.ControlAction_getCtlNum(self._handle)
+        return _server.ControlAction_getCtlNum(self._handle)
 
     def get_synchro_check(self) -> bool:
         """Gets the synchroCheck bit provided by the client.
@@ -242,7 +239,7 @@ class ControlAction:
         bool
             _description_
         """
-        return Wrapper.lib.ControlAction_getSynchroCheck(self._handle)
+        return _server.ControlAction_getSynchroCheck(self._handle)
 
     def get_interlock_check(self) -> bool:
         """Gets the interlockCheck bit provided by the client.
@@ -252,7 +249,7 @@ class ControlAction:
         bool
             _description_
         """
-        return Wrapper.lib.ControlAction_getInterlockCheck(self._handle)
+        return _server.ControlAction_getInterlockCheck(self._handle)
 
     def is_select(self) -> bool:
         """Check if the control callback is called by a select or operate command.
@@ -262,7 +259,7 @@ class ControlAction:
         bool
             _description_
         """
-        return Wrapper.lib.ControlAction_isSelect(self._handle)
+        return _server.ControlAction_isSelect(self._handle)
 
     def get_client_connection(self) -> ClientConnection:
         """Gets the client object associated with the client that caused the control action.
@@ -272,7 +269,7 @@ class ControlAction:
         ClientConnection
             _description_
         """
-        handle = Wrapper.lib.ControlAction_getClientConnection(self._handle)
+        handle = _server.ControlAction_getClientConnection(self._handle)
         return ClientConnection(handle)
 
     def get_control_object(self) -> DataObject:
@@ -283,7 +280,7 @@ class ControlAction:
         DataObject
             _description_
         """
-        handle = Wrapper.lib.ControlAction_getControlObject(self._handle)
+        handle = _server.ControlAction_getControlObject(self._handle)
         return DataObject(handle)
 
     def get_control_time(self) -> datetime.datetime | None:
@@ -294,7 +291,7 @@ class ControlAction:
         datetime.datetime | None
             None when it is not a timeActivatedControl
         """
-        ms = Wrapper.lib.ControlAction_getControlTime(self._handle)
+        ms = _server.ControlAction_getControlTime(self._handle)
         if ms > 0:
             return convert_to_datetime(ms)
         return None
@@ -307,7 +304,7 @@ class ControlAction:
         Timestamp
             _description_
         """
-        handle = Wrapper.lib.ControlAction_getT(self._handle)
+        handle = _server.ControlAction_getT(self._handle)
         return Timestamp(handle)
 
 
@@ -315,10 +312,10 @@ class IedServerConfig:
     """IedServer configuration object"""
 
     def __init__(self) -> None:
-        self._handle = Wrapper.lib.IedServerConfig_create()
+        self._handle = _server.IedServerConfig_create()
 
     def __del__(self):
-        Wrapper.lib.IedServerConfig_destroy(self._handle)
+        _server.IedServerConfig_destroy(self._handle)
 
     @property
     def handle(self):
@@ -328,137 +325,137 @@ class IedServerConfig:
     @property
     def edition(self) -> Iec61850Edition:
         """Configured IEC 61850 standard edition."""
-        return Iec61850Edition(Wrapper.lib.IedServerConfig_getEdition(self._handle))
+        return Iec61850Edition(_server.IedServerConfig_getEdition(self._handle))
 
     @edition.setter
     def edition(self, value: Iec61850Edition):
-        Wrapper.lib.IedServerConfig_setEdition(self._handle, value.value)
+        _server.IedServerConfig_setEdition(self._handle, value.value)
 
     @property
     def report_buffer_size_brcb(self) -> int:
         """Report buffer size for buffered reporting."""
-        return Wrapper.lib.IedServerConfig_getReportBufferSize(self._handle)
+        return _server.IedServerConfig_getReportBufferSize(self._handle)
 
     @report_buffer_size_brcb.setter
     def report_buffer_size_brcb(self, value: int):
-        Wrapper.lib.IedServerConfig_setReportBufferSize(self._handle, value)
+        _server.IedServerConfig_setReportBufferSize(self._handle, value)
 
     @property
     def report_buffer_size_urcb(self) -> int:
         """Report buffer size for unbuffered reporting."""
-        return Wrapper.lib.IedServerConfig_getReportBufferSizeForURCBs(self._handle)
+        return _server.IedServerConfig_getReportBufferSizeForURCBs(self._handle)
 
     @report_buffer_size_urcb.setter
     def report_buffer_size_urcb(self, value: int):
-        Wrapper.lib.IedServerConfig_setReportBufferSizeForURCBs(self._handle, value)
+        _server.IedServerConfig_setReportBufferSizeForURCBs(self._handle, value)
 
     @property
     def max_mms_connection(self) -> int:
         """Maximum number of MMS (TCP) connections the server accepts."""
-        return Wrapper.lib.IedServerConfig_getMaxMmsConnections(self._handle)
+        return _server.IedServerConfig_getMaxMmsConnections(self._handle)
 
     @max_mms_connection.setter
     def max_mms_connection(self, value: int):
-        Wrapper.lib.IedServerConfig_setMaxMmsConnections(self._handle, value)
+        _server.IedServerConfig_setMaxMmsConnections(self._handle, value)
 
     @property
     def sync_integrity_report_times(self) -> bool:
         """Synchronize integrity report times."""
-        return Wrapper.lib.IedServerConfig_getSyncIntegrityReportTimes(self._handle)
+        return _server.IedServerConfig_getSyncIntegrityReportTimes(self._handle)
 
     @sync_integrity_report_times.setter
     def sync_integrity_report_times(self, value: bool):
-        Wrapper.lib.IedServerConfig_setSyncIntegrityReportTimes(self._handle, value)
+        _server.IedServerConfig_setSyncIntegrityReportTimes(self._handle, value)
 
     @property
     def file_service_enabled(self) -> bool:
         """File services status."""
-        return Wrapper.lib.IedServerConfig_isFileServiceEnabled(self._handle)
+        return _server.IedServerConfig_isFileServiceEnabled(self._handle)
 
     @file_service_enabled.setter
     def file_service_enabled(self, value: bool):
-        Wrapper.lib.IedServerConfig_enableFileService(self._handle, value)
+        _server.IedServerConfig_enableFileService(self._handle, value)
 
     @property
     def file_service_base_path(self) -> bytes:
         """Basepath of the file services."""
-        return Wrapper.lib.IedServerConfig_getFileServiceBasePath(self._handle)
+        return _server.IedServerConfig_getFileServiceBasePath(self._handle)
 
     @file_service_base_path.setter
     def file_service_base_path(self, value: str | bytes):
         value = convert_to_bytes(value)
-        Wrapper.lib.IedServerConfig_setFileServiceBasePath(self._handle, value)
+        _server.IedServerConfig_setFileServiceBasePath(self._handle, value)
 
     @property
     def dynamic_dataset_enabled(self) -> bool:
         """Dynamic dataset support."""
-        return Wrapper.lib.IedServerConfig_isDynamicDataSetServiceEnabled(self._handle)
+        return _server.IedServerConfig_isDynamicDataSetServiceEnabled(self._handle)
 
     @dynamic_dataset_enabled.setter
     def dynamic_dataset_enabled(self, value: bool):
-        Wrapper.lib.IedServerConfig_enableDynamicDataSetService(self._handle, value)
+        _server.IedServerConfig_enableDynamicDataSetService(self._handle, value)
 
     @property
     def max_association_specific_datasets(self) -> int:
         """Maximum allowed number of association specific (non-permanent) data sets."""
-        return Wrapper.lib.IedServerConfig_getMaxAssociationSpecificDataSets(self._handle)
+        return _server.IedServerConfig_getMaxAssociationSpecificDataSets(self._handle)
 
     @max_association_specific_datasets.setter
     def max_association_specific_datasets(self, value: int):
-        Wrapper.lib.IedServerConfig_setMaxAssociationSpecificDataSets(self._handle, value)
+        _server.IedServerConfig_setMaxAssociationSpecificDataSets(self._handle, value)
 
     @property
     def max_domain_specific_datasets(self) -> int:
         """Maximum allowed number of domain specific (permanent) data sets."""
-        return Wrapper.lib.IedServerConfig_getMaxDomainSpecificDataSets(self._handle)
+        return _server.IedServerConfig_getMaxDomainSpecificDataSets(self._handle)
 
     @max_domain_specific_datasets.setter
     def max_domain_specific_datasets(self, value: int):
-        Wrapper.lib.IedServerConfig_setMaxDomainSpecificDataSets(self._handle, value)
+        _server.IedServerConfig_setMaxDomainSpecificDataSets(self._handle, value)
 
     @property
     def max_dataset_entries(self) -> int:
         """Maximum number of entries in dynamic data sets."""
-        return Wrapper.lib.IedServerConfig_getMaxDatasSetEntries(self._handle)
+        return _server.IedServerConfig_getMaxDatasSetEntries(self._handle)
 
     @max_dataset_entries.setter
     def max_dataset_entries(self, value: int):
-        Wrapper.lib.IedServerConfig_setMaxDataSetEntries(self._handle, value)
+        _server.IedServerConfig_setMaxDataSetEntries(self._handle, value)
 
     @property
     def log_service_enabled(self) -> bool:
         """Log services status."""
-        return Wrapper.lib.IedServerConfig_isLogServiceEnabled(self._handle)
+        return _server.IedServerConfig_isLogServiceEnabled(self._handle)
 
     @log_service_enabled.setter
     def log_service_enabled(self, value: bool):
-        Wrapper.lib.IedServerConfig_enableLogService(self._handle, value)
+        _server.IedServerConfig_enableLogService(self._handle, value)
 
     def edit_sg_enabled(self, value: bool):
         """Allow clients to change setting groups"""
-        Wrapper.lib.IedServerConfig_enableEditSG(self._handle, value)
+        _server.IedServerConfig_enableEditSG(self._handle, value)
 
     def enable_resv_tms_sgcb(self, value: bool):
         """Enable/disable the SGCB.ResvTms when EditSG is enabled"""
-        Wrapper.lib.IedServerConfig_enableResvTmsForSGCB(self._handle, value)
+        _server.IedServerConfig_enableResvTmsForSGCB(self._handle, value)
 
     @property
     def enable_resv_tms_brcb(self) -> bool:
         """Enable/disable the presence of BRCB.ResvTms."""
-        return Wrapper.lib.IedServerConfig_isResvTmsForBRCBEnabled(self._handle)
+        return _server.IedServerConfig_isResvTmsForBRCBEnabled(self._handle)
 
     @enable_resv_tms_brcb.setter
     def enable_resv_tms_brcb(self, value: bool):
-        Wrapper.lib.IedServerConfig_enableResvTmsForBRCB(self._handle, value)
+        _server.IedServerConfig_enableResvTmsForBRCB(self._handle, value)
 
     @property
     def enable_owner_for_rcb(self) -> bool:
         """Owner for RCBs enabled (visible)."""
-        return Wrapper.lib.IedServerConfig_isOwnerForRCBEnabled(self._handle)
+        return _server.IedServerConfig_isOwnerForRCBEnabled(self._handle)
 
     @enable_owner_for_rcb.setter
     def enable_owner_for_rcb(self, value: bool):
-        Wrapper.lib.IedServerConfig_enableOwnerForRCB(self._handle, value)
+        _server.IedServerConfig_enableOwnerForRCB(self._handle, value)
 
     def use_integrated_goose_publisher(self, value: bool):
         """Enable/disable using the integrated GOOSE publisher for configured GoCBs.
@@ -468,7 +465,7 @@ class IedServerConfig:
         value : bool
             _description_
         """
-        Wrapper.lib.IedServerConfig_useIntegratedGoosePublisher(self._handle, value)
+        _server.IedServerConfig_useIntegratedGoosePublisher(self._handle, value)
 
     def set_report_setting(self, setting: ReportSetting, is_dyn: bool):
         """Make a configurable report setting writeable or read-only.
@@ -481,7 +478,7 @@ class IedServerConfig:
             _description_
         """
 
-        Wrapper.lib.IedServerConfig_setReportSetting(self._handle, setting, is_dyn)
+        _server.IedServerConfig_setReportSetting(self._handle, setting, is_dyn)
 
     def get_report_setting(self, setting: ReportSetting) -> bool:
         """Check if a configurable report setting is writable or read-only.
@@ -496,7 +493,27 @@ class IedServerConfig:
         bool
             _description_
         """
-        return Wrapper.lib.IedServerConfig_getReportSetting(self._handle, setting)
+        return _server.IedServerConfig_getReportSetting(self._handle, setting)
+
+
+UpdateKind = Literal[
+    "value",
+    "float",
+    "int32",
+    "dbpos",
+    "int64",
+    "uint",
+    "bit_string",
+    "boolean",
+    "string",
+    "utc_time",
+    "utc_time_ns",
+    "timestamp",
+    "quality",
+]
+"""Kind of an update of ``IedServer.update_batch``, selects the ``update_<kind>`` method"""
+
+_UPDATE_KINDS = frozenset(get_args(UpdateKind))
 
 
 class IedServer:
@@ -510,7 +527,7 @@ class IedServer:
         self._data_objects: dict[int, DataObject] = {}
         self._data_attributes: dict[int, DataAttribute] = {}
 
-        self._handle = Wrapper.lib.IedServer_createWithConfig(
+        self._handle = _server.IedServer_createWithConfig(
             ied_model.handle,
             None,
             None if config is None else config.handle,
@@ -539,7 +556,7 @@ class IedServer:
 
         self._on_connection_change: Callable[[ClientConnection, bool], None] | None = None
 
-        Wrapper.lib.IedServer_setConnectionIndicationHandler(
+        _server.IedServer_setConnectionIndicationHandler(
             self._handle, self._connection_handler, None
         )
 
@@ -551,16 +568,16 @@ class IedServer:
         port : int, optional
             TCP port the server is listening, by default 102
         """
-        Wrapper.lib.IedServer_start(self._handle, port)
+        _server.IedServer_start(self._handle, port)
 
     def stop(self):
         """Stop the server"""
-        Wrapper.lib.IedServer_stop(self._handle)
+        _server.IedServer_stop(self._handle)
 
     @property
     def is_running(self) -> bool:
         """Check if IedServer instance is listening for client connections."""
-        return Wrapper.lib.IedServer_isRunning(self._handle)
+        return _server.IedServer_isRunning(self._handle)
 
     def _connection_handler_fn(
         self,
@@ -572,10 +589,10 @@ class IedServer:
         if connected:
             # A client is connected
             client_connection = ClientConnection(connection_handle)
-            self._client_connections.setdefault(address_of(connection_handle), client_connection)
+            self._client_connections.setdefault(connection_handle, client_connection)
         else:
             # A client is disconnected
-            client_connection = self._client_connections.pop(address_of(connection_handle))
+            client_connection = self._client_connections.pop(connection_handle)
 
         if self._on_connection_change is not None:
             self._on_connection_change(client_connection, connected)
@@ -610,16 +627,16 @@ class IedServer:
 
         def fun(
             parameter: int | None,  # void*
-            sgcb_handle: SGCBPointer,
+            sgcb_handle: int,  # SettingGroupControlBlock*
             new_active_setting_group: int,
             connection_handle: int,  # ClientConnection
         ) -> bool:
-            sgcb = self._sgcbs[address_of(sgcb_handle)]
-            client_connection = self._client_connections[address_of(connection_handle)]
+            sgcb = self._sgcbs[sgcb_handle]
+            client_connection = self._client_connections[connection_handle]
             return callback(sgcb, client_connection, new_active_setting_group)
 
         handler = ActiveSettingGroupChangedHandler(fun)
-        Wrapper.lib.IedServer_setActiveSettingGroupChangedHandler(
+        _server.IedServer_setActiveSettingGroupChangedHandler(
             self._handle,
             sgcb.handle,
             handler,
@@ -645,16 +662,16 @@ class IedServer:
 
         def fun(
             parameter: int | None,  # void*
-            sgcb_handle: SGCBPointer,
+            sgcb_handle: int,  # SettingGroupControlBlock*
             new_edit_setting_group: int,
             connection_handle: int,  # ClientConnection
         ) -> bool:
-            sgcb = self._sgcbs[address_of(sgcb_handle)]
-            client_connection = self._client_connections[address_of(connection_handle)]
+            sgcb = self._sgcbs[sgcb_handle]
+            client_connection = self._client_connections[connection_handle]
             return callback(sgcb, client_connection, new_edit_setting_group)
 
         handler = EditSettingGroupChangedHandler(fun)
-        Wrapper.lib.IedServer_setEditSettingGroupChangedHandler(
+        _server.IedServer_setEditSettingGroupChangedHandler(
             self._handle,
             sgcb.handle,
             handler,
@@ -680,14 +697,14 @@ class IedServer:
 
         def fun(
             parameter: int | None,  # void*
-            sgcb_handle: SGCBPointer,
+            sgcb_handle: int,  # SettingGroupControlBlock*
             edit_setting_group: int,
         ):
-            sgcb = self._sgcbs[address_of(sgcb_handle)]
+            sgcb = self._sgcbs[sgcb_handle]
             callback(sgcb, edit_setting_group)
 
         handler = EditSettingGroupConfirmationHandler(fun)
-        Wrapper.lib.IedServer_setEditSettingGroupConfirmationHandler(
+        _server.IedServer_setEditSettingGroupConfirmationHandler(
             self._handle,
             sgcb.handle,
             handler,
@@ -722,11 +739,11 @@ class IedServer:
             ctl_val: MmsValuePointer,  # MmsValue* ctlVal
             test: bool,
         ) -> int:  # bool test
-            data_object = self._data_objects[address_of(parameter)]
+            data_object = self._data_objects[parameter]
             return callback(data_object, ControlAction(action), MmsValue(ctl_val), test).value
 
         handler = ControlHandler(fun)
-        Wrapper.lib.IedServer_setControlHandler(
+        _server.IedServer_setControlHandler(
             self._handle,
             data_object.handle,
             handler,
@@ -767,7 +784,7 @@ class IedServer:
             test: bool,  # bool test
             interlock_check: bool,  # bool interlockCheck
         ) -> int:
-            data_object = self._data_objects[address_of(parameter)]
+            data_object = self._data_objects[parameter]
             return callback(
                 data_object,
                 ControlAction(action),
@@ -777,7 +794,7 @@ class IedServer:
             ).value
 
         handler = ControlPerformCheckHandler(fun)
-        Wrapper.lib.IedServer_setPerformCheckHandler(
+        _server.IedServer_setPerformCheckHandler(
             self._handle,
             data_object.handle,
             handler,
@@ -821,7 +838,7 @@ class IedServer:
             test: bool,  # bool test
             interlock_check: bool,  # bool interlockCheck
         ) -> int:
-            data_object = self._data_objects[address_of(parameter)]
+            data_object = self._data_objects[parameter]
             return callback(
                 data_object,
                 ControlAction(action),
@@ -831,7 +848,7 @@ class IedServer:
             ).value
 
         handler = ControlWaitForExecutionHandler(fun)
-        Wrapper.lib.IedServer_setWaitForExecutionHandler(
+        _server.IedServer_setWaitForExecutionHandler(
             self._handle,
             data_object.handle,
             handler,
@@ -882,7 +899,7 @@ class IedServer:
             )
 
         handler = ControlSelectStateChangedHandler(fun)
-        Wrapper.lib.IedServer_setSelectStateChangedHandler(
+        _server.IedServer_setSelectStateChangedHandler(
             self._handle,
             data_object.handle,
             handler,
@@ -915,13 +932,13 @@ class IedServer:
         self._data_attributes[data_attribute.addressof] = data_attribute
 
         def fun(
-            data_attribute_ptr: DataAttributePointer,  # DataAttribute* dataAttribute
+            data_attribute_address: int,  # DataAttribute* dataAttribute
             value_ptr: MmsValuePointer,  # MmsValue* value,
             connection_handle: int,  #  ClientConnection connection,
             parameter: int | None,  # void*  # void* parameter
         ) -> int:  # MmsDataAccessError
-            client_connection = self._client_connections[address_of(connection_handle)]
-            data_attribute = self._data_attributes[address_of(data_attribute_ptr)]
+            client_connection = self._client_connections[connection_handle]
+            data_attribute = self._data_attributes[data_attribute_address]
             return callback(
                 client_connection,
                 data_attribute,
@@ -929,7 +946,7 @@ class IedServer:
             ).value
 
         handler = WriteAccessHandler(fun)
-        Wrapper.lib.IedServer_handleWriteAccess(
+        _server.IedServer_handleWriteAccess(
             self._handle,
             data_attribute.handle,
             handler,
@@ -950,7 +967,7 @@ class IedServer:
         MmsValue | None
             MmsValue object of the MMS Named Variable or None if the value does not exist.
         """
-        handle = Wrapper.lib.IedServer_getAttributeValue(self._handle, data_attribute.handle)
+        handle = _server.IedServer_getAttributeValue(self._handle, data_attribute.addressof)
         if handle:
             return MmsValue(handle)
         return None
@@ -981,7 +998,7 @@ class IedServer:
         MmsValue | None
             MmsValue object of the MMS Named Variable or None if the value does not exist.
         """
-        handle = Wrapper.lib.IedServer_getFunctionalConstrainedData(
+        handle = _server.IedServer_getFunctionalConstrainedData(
             self._handle,
             data_object.handle,
             fc.value,
@@ -1006,7 +1023,7 @@ class IedServer:
         bool
             Value of the attribute
         """
-        return Wrapper.lib.IedServer_getBooleanAttributeValue(self._handle, data_attribute.handle)
+        return _server.IedServer_getBooleanAttributeValue(self._handle, data_attribute.addressof)
 
     def get_int32(self, data_attribute: DataAttribute) -> int:
         """Get data attribute value of an int32 data attribute.
@@ -1024,7 +1041,7 @@ class IedServer:
         int
             Value of the attribute
         """
-        return Wrapper.lib.IedServer_getInt32AttributeValue(self._handle, data_attribute.handle)
+        return _server.IedServer_getInt32AttributeValue(self._handle, data_attribute.addressof)
 
     def get_int64(self, data_attribute: DataAttribute) -> int:
         """Get data attribute value of an int64 data attribute.
@@ -1042,7 +1059,7 @@ class IedServer:
         int
             Value of the attribute
         """
-        return Wrapper.lib.IedServer_getInt64AttributeValue(self._handle, data_attribute.handle)
+        return _server.IedServer_getInt64AttributeValue(self._handle, data_attribute.addressof)
 
     def get_uint32(self, data_attribute: DataAttribute) -> int:
         """Get data attribute value of an uint32 data attribute.
@@ -1060,7 +1077,7 @@ class IedServer:
         int
             Value of the attribute
         """
-        return Wrapper.lib.IedServer_getUInt32AttributeValue(self._handle, data_attribute.handle)
+        return _server.IedServer_getUInt32AttributeValue(self._handle, data_attribute.addressof)
 
     def get_float(self, data_attribute: DataAttribute) -> float:
         """Get data attribute value of a float data attribute.
@@ -1078,7 +1095,7 @@ class IedServer:
         float
             Value of the attribute
         """
-        return Wrapper.lib.IedServer_getFloatAttributeValue(self._handle, data_attribute.handle)
+        return _server.IedServer_getFloatAttributeValue(self._handle, data_attribute.addressof)
 
     def get_utc_time(self, data_attribute: DataAttribute) -> datetime.datetime:
         """Get data attribute value of an UTC time data attribute.
@@ -1096,7 +1113,7 @@ class IedServer:
         datetime.datetime
             Value of the attribute
         """
-        value = Wrapper.lib.IedServer_getUTCTimeAttributeValue(self._handle, data_attribute.handle)
+        value = _server.IedServer_getUTCTimeAttributeValue(self._handle, data_attribute.addressof)
         return convert_to_datetime(value)
 
     def get_bit_string(self, data_attribute: DataAttribute) -> int:
@@ -1115,9 +1132,7 @@ class IedServer:
         int
             Value of the attribute
         """
-        return Wrapper.lib.IedServer_getBitStringAttributeValue(
-            self._handle, data_attribute.handle
-        )
+        return _server.IedServer_getBitStringAttributeValue(self._handle, data_attribute.addressof)
 
     def get_string(self, data_attribute: DataAttribute) -> bytes:
         """Get data attribute value of a string data attribute.
@@ -1135,7 +1150,7 @@ class IedServer:
         bytes
             Value of the attribute
         """
-        return Wrapper.lib.IedServer_getStringAttributeValue(self._handle, data_attribute.handle)
+        return _server.IedServer_getStringAttributeValue(self._handle, data_attribute.addressof)
 
     def update_value(self, data_attribute: DataAttribute, value: MmsValue):
         """Update the MmsValue object of an IEC 61850 data attribute.
@@ -1150,9 +1165,9 @@ class IedServer:
         value : MmsValue
             MmsValue object used to update the value cached by the server.
         """
-        Wrapper.lib.IedServer_updateAttributeValue(
+        _server.IedServer_updateAttributeValue(
             self._handle,
-            data_attribute.handle,
+            data_attribute.addressof,
             value.handle,
         )
 
@@ -1169,9 +1184,9 @@ class IedServer:
         value : float
             New float value of the data attribute.
         """
-        Wrapper.lib.IedServer_updateFloatAttributeValue(
+        _server.IedServer_updateFloatAttributeValue(
             self._handle,
-            data_attribute.handle,
+            data_attribute.addressof,
             value,
         )
 
@@ -1188,9 +1203,9 @@ class IedServer:
         value : int
             New int32 value of the data attribute.
         """
-        Wrapper.lib.IedServer_updateInt32AttributeValue(
+        _server.IedServer_updateInt32AttributeValue(
             self._handle,
-            data_attribute.handle,
+            data_attribute.addressof,
             value,
         )
 
@@ -1207,9 +1222,9 @@ class IedServer:
         value : Dbpos
             New Dbpos (double point/position) value of the data attribute.
         """
-        Wrapper.lib.IedServer_updateDbposValue(
+        _server.IedServer_updateDbposValue(
             self._handle,
-            data_attribute.handle,
+            data_attribute.addressof,
             value.value,
         )
 
@@ -1226,9 +1241,9 @@ class IedServer:
         value : int
             New int64 value of the data attribute.
         """
-        Wrapper.lib.IedServer_updateInt64AttributeValue(
+        _server.IedServer_updateInt64AttributeValue(
             self._handle,
-            data_attribute.handle,
+            data_attribute.addressof,
             value,
         )
 
@@ -1249,9 +1264,9 @@ class IedServer:
         value : int
             New uint value of the data attribute.
         """
-        Wrapper.lib.IedServer_updateUnsignedAttributeValue(
+        _server.IedServer_updateUnsignedAttributeValue(
             self._handle,
-            data_attribute.handle,
+            data_attribute.addressof,
             value,
         )
 
@@ -1272,9 +1287,9 @@ class IedServer:
         value : int
             New bit string value of the data attribute.
         """
-        Wrapper.lib.IedServer_updateBitStringAttributeValue(
+        _server.IedServer_updateBitStringAttributeValue(
             self._handle,
-            data_attribute.handle,
+            data_attribute.addressof,
             value,
         )
 
@@ -1295,9 +1310,9 @@ class IedServer:
         value : bool
             New boolean value of the data attribute.
         """
-        Wrapper.lib.IedServer_updateBooleanAttributeValue(
+        _server.IedServer_updateBooleanAttributeValue(
             self._handle,
-            data_attribute.handle,
+            data_attribute.addressof,
             value,
         )
 
@@ -1319,9 +1334,9 @@ class IedServer:
             New string value of the data attribute.
         """
         value = convert_to_bytes(value)
-        Wrapper.lib.IedServer_updateVisibleStringAttributeValue(
+        _server.IedServer_updateVisibleStringAttributeValue(
             self._handle,
-            data_attribute.handle,
+            data_attribute.addressof,
             value,
         )
 
@@ -1344,12 +1359,34 @@ class IedServer:
             datetime.datetime.now().astimezone()
         """
         val_uint64 = convert_to_uint64(value)
-        Wrapper.lib.IedServer_updateUTCTimeAttributeValue(
+        _server.IedServer_updateUTCTimeAttributeValue(
             self._handle,
-            data_attribute.handle,
+            data_attribute.addressof,
             val_uint64,
         )
 
+    def update_utc_time_ns(self, data_attribute: DataAttribute, value: int):
+        """Update the value of an IEC 61850 UTC time data attribute from nanoseconds.
+
+        Same as ``update_utc_time`` but without building a
+        ``datetime.datetime``, the value is typically given by
+        ``time.time_ns()``.
+
+        Parameters
+        ----------
+        data_attribute : DataAttribute
+            Data attribute
+        value : int
+            New UTC time value of the data attribute, in nanoseconds since
+            epoch. The UTC time attribute is updated in milliseconds, the
+            sub-millisecond part is truncated.
+        """
+        _server.IedServer_updateUTCTimeAttributeValue(
+            self._handle,
+            data_attribute.addressof,
+            value // 1_000_000,
+        )
+
     def update_timestamp(
         self,
         data_attribute: DataAttribute,
@@ -1367,10 +1404,10 @@ class IedServer:
         value : Timestamp
             New Timestamp value of the data attribute.
         """
-        Wrapper.lib.IedServer_updateTimestampAttributeValue(
+        _server.IedServer_updateTimestampAttributeValue(
             self._handle,
-            data_attribute.handle,
-            value,
+            data_attribute.addressof,
+            value._handle,
         )
 
     def update_quality(self, data_attribute: DataAttribute, value: Quality):
@@ -1386,9 +1423,9 @@ class IedServer:
         value : Quality
             New quality value of the data attribute.
         """
-        Wrapper.lib.IedServer_updateQuality(
+        _server.IedServer_updateQuality(
             self._handle,
-            data_attribute.handle,
+            data_attribute.addressof,
             value,
         )
 
@@ -1411,7 +1448,7 @@ class IedServer:
         already locked! Calling this function inside of a library callback
         may lead to a deadlock condition.
         """
-        Wrapper.lib.IedServer_lockDataModel(self._handle)
+        _server.IedServer_lockDataModel(self._handle)
 
     def unlock_data_model(self):
         """Unlock the data model and process pending client requests.
@@ -1426,7 +1463,52 @@ class IedServer:
         In the context of a library callback the data model is always
         already locked!
         """
-        Wrapper.lib.IedServer_unlockDataModel(self._handle)
+        _server.IedServer_unlockDataModel(self._handle)
+
+    def update_batch(
+        self,
+        updates: Iterable[tuple[DataAttribute, UpdateKind, Any]],
+    ):
+        """Update several data attributes while holding the data model lock once.
+
+        Each update is given as ``(data_attribute, kind, value)`` where
+        ``kind`` selects the ``update_<kind>`` method to use, e.g.
+        ``(temperature, "float", 21.5)``. The kinds are checked before the
+        data model is locked. The data model is locked before the first
+        update and unlocked after the last one, even if one of the updates
+        fails.
+
+        Parameters
+        ----------
+        updates : Iterable[tuple[DataAttribute, UpdateKind, Any]]
+            Updates to apply
+
+        Raises
+        ------
+        ValueError
+            If the kind of an update is not one of ``UpdateKind``, no update
+            is applied
+
+        Notes
+        -----
+        As ``lock_data_model``, this method should never be called inside
+        of a callback function.
+        """
+        updates = list(updates)
+        # The update method of a kind is looked up once for all the updates
+        update_methods: dict[str, Callable[[DataAttribute, Any], None]] = {}
+        for _, kind, _ in updates:
+            if kind not in update_methods:
+                if kind not in _UPDATE_KINDS:
+                    raise ValueError(f"Unknown update kind {kind!r}")
+                update_methods[kind] = getattr(self, f"update_{kind}")
+
+        _server.IedServer_lockDataModel(self._handle)
+        try:
+            for data_attribute, kind, value in updates:
+                update_methods[kind](data_attribute, value)
+        finally:
+            _server.IedServer_unlockDataModel(self._handle)
 
     def set_default_write_policy(
         self,
@@ -1449,7 +1531,7 @@ class IedServer:
         policy : AccessPolicy
             New policy to apply.
         """
-        Wrapper.lib.IedServer_setWriteAccessPolicy(self._handle, fc.value, policy.value)
+        _server.IedServer_setWriteAccessPolicy(self._handle, fc.value, policy.value)
 
     def set_filestore_basepath(self, basepath: str | bytes):
         """Set the virtual filestore basepath for the file services.
@@ -1460,7 +1542,7 @@ class IedServer:
             Local path to the base folder for file service
         """
         basepath = convert_to_bytes(basepath)
-        Wrapper.lib.IedServer_setFilestoreBasepath(
+        _server.IedServer_setFilestoreBasepath(
             self._handle,  # IedServer self
             basepath,  # const char* basepath
         )
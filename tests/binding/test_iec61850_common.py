@@ -0,0 +1,14 @@
+import ctypes
+
+from py61850.binding.iec61850.iec61850_common import Timestamp
+
+
+def test_timestamp_layout():
+    """The raw view of a timestamp keeps the size and alignment of the C union."""
+    assert ctypes.sizeof(Timestamp) == 8
+    assert ctypes.alignment(Timestamp) == 1
+
+    timestamp = Timestamp()
+    timestamp.val[:] = range(1, 9)
+    copy = Timestamp(raw=timestamp.raw)
+    assert bytes(copy.val) == bytes(range(1, 9))
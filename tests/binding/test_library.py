@@ -0,0 +1,108 @@
+import ctypes
+import ctypes.util
+import threading
+
+import pytest
+
+from py61850.binding.library import Library, accessor_names, module_getattr
+
+LIBC = ctypes.util.find_library("c")
+
+
+@pytest.mark.skipif(LIBC is None, reason="C library not found")
+def test_deferred_prototypes():
+    """Deferred prototypes are applied on first access and shared between same signatures."""
+    lib = Library(LIBC)
+    lib.defer_prototypes(
+        [
+            ("toupper", (ctypes.c_int,), ctypes.c_int),
+            ("tolower", (ctypes.c_int,), ctypes.c_int),
+            ("strlen", (ctypes.c_char_p,), ctypes.c_size_t),
+        ]
+    )
+
+    assert lib.toupper(ord("a")) == ord("A")
+    assert lib.tolower(ord("A")) == ord("a")
+    assert lib.strlen(b"py61850") == 7
+    assert lib.strlen.argtypes == (ctypes.c_char_p,)
+    assert type(lib.toupper) is type(lib.tolower)
+    assert type(lib.toupper) is not type(lib.strlen)
+    assert "toupper" in vars(lib)
+
+
+@pytest.mark.skipif(LIBC is None, reason="C library not found")
+def test_deferred_prototypes_keeping_gil():
+    """Prototypes deferred with release_gil=False are called without releasing the GIL."""
+    lib = Library(LIBC)
+    lib.defer_prototypes([("strlen", (ctypes.c_char_p,), ctypes.c_size_t)], release_gil=False)
+    lib.defer_prototypes([("abs", (ctypes.c_int,), ctypes.c_int)])
+
+    assert lib.strlen(b"py61850") == 7
+    assert lib.strlen._flags_ & ctypes._FUNCFLAG_PYTHONAPI
+    assert lib.abs(-3) == 3
+    assert not lib.abs._flags_ & ctypes._FUNCFLAG_PYTHONAPI
+
+
+@pytest.mark.skipif(LIBC is None, reason="C library not found")
+def test_deferred_prototypes_errno():
+    """Deferred prototypes only save errno when the library was loaded with use_errno."""
+    lib = Library(LIBC)
+    lib.defer_prototypes([("abs", (ctypes.c_int,), ctypes.c_int)])
+    lib_errno = Library(LIBC, use_errno=True)
+    lib_errno.defer_prototypes([("abs", (ctypes.c_int,), ctypes.c_int)])
+
+    assert lib.abs(-3) == lib_errno.abs(-3) == 3
+    assert not lib.abs._flags_ & ctypes._FUNCFLAG_USE_ERRNO
+    assert lib_errno.abs._flags_ & ctypes._FUNCFLAG_USE_ERRNO
+
+
+@pytest.mark.skipif(LIBC is None, reason="C library not found")
+def test_deferred_prototypes_threads():
+    """A function accessed by several threads at once is always typed."""
+    lib = Library(LIBC)
+    lib.defer_prototypes([("strlen", (ctypes.c_char_p,), ctypes.c_size_t)])
+    barrier = threading.Barrier(8)
+    functions = []
+
+    def resolve():
+        barrier.wait()
+        functions.append(lib.strlen)
+
+    threads = [threading.Thread(target=resolve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(functions) == 8
+    assert all(function.restype is ctypes.c_size_t for function in functions)
+    assert all(function.argtypes == (ctypes.c_char_p,) for function in functions)
+
+
+@pytest.mark.skipif(LIBC is None, reason="C library not found")
+def test_accessors_keep_gil():
+    """Accessors given to defer_prototypes keep the GIL, the other functions release it."""
+    prototypes = [
+        ("strlen", (ctypes.c_char_p,), ctypes.c_size_t),
+        ("abs", (ctypes.c_int,), ctypes.c_int),
+    ]
+    lib = Library(LIBC)
+    lib.defer_prototypes(prototypes, accessors=accessor_names(prototypes, r"str"))
+
+    assert lib.strlen._flags_ & ctypes._FUNCFLAG_PYTHONAPI
+    assert not lib.abs._flags_ & ctypes._FUNCFLAG_PYTHONAPI
+
+
+@pytest.mark.skipif(LIBC is None, reason="C library not found")
+def test_module_getattr():
+    """Module attributes are the functions of the library, only the prototyped ones."""
+    prototypes = [("strlen", (ctypes.c_char_p,), ctypes.c_size_t)]
+    lib = Library(LIBC)
+    lib.defer_prototypes(prototypes)
+    module_globals = {"__name__": "binding"}
+    getattr_ = module_getattr(module_globals, prototypes, lambda: lib)
+
+    assert getattr_("strlen") is lib.strlen
+    assert module_globals["strlen"] is lib.strlen
+    with pytest.raises(AttributeError, match="'binding' has no attribute 'abs'"):
+        getattr_("abs")
@@ -0,0 +1,21 @@
+import ctypes
+
+from py61850.binding.iec61850.model import ModelNode, unpack_model_node
+
+
+def test_unpack_model_node():
+    """The common fields of a node are read as integers, NULL pointers as 0."""
+    name = ctypes.create_string_buffer(b"GGIO1")
+    parent = ModelNode(0)
+    child = ModelNode(2)
+    node = ModelNode(
+        1, ctypes.addressof(name), ctypes.pointer(parent), None, ctypes.pointer(child)
+    )
+
+    assert unpack_model_node(ctypes.addressof(node)) == (
+        1,
+        ctypes.addressof(name),
+        ctypes.addressof(parent),
+        0,
+        ctypes.addressof(child),
+    )
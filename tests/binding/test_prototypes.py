@@ -0,0 +1,174 @@
+import pathlib
+import re
+from ctypes import CDLL, PyDLL, c_void_p
+from types import SimpleNamespace
+
+import pytest
+
+import py61850
+from py61850.binding.common import linked_list
+from py61850.binding.iec61850 import (
+    cdc,
+    client,
+    config_file_parser,
+    dynamic_model,
+    iec61850_common,
+    model,
+    server,
+)
+from py61850.binding.library import Library
+from py61850.binding.mms import mms_type_spec, mms_value
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        cdc,
+        client,
+        config_file_parser,
+        dynamic_model,
+        iec61850_common,
+        linked_list,
+        mms_type_spec,
+        mms_value,
+        model,
+        server,
+    ],
+)
+def test_prototypes_declared_once(module):
+    """Each function of a prototype table is declared only once."""
+    names = [name for name, _, _ in module._PROTOTYPES]
+    assert len(names) == len(set(names))
+
+
+class _RecordingLibrary:
+    """Stand-in for the library recording the functions given a prototype"""
+
+    def __init__(self) -> None:
+        self.declared: dict[str, SimpleNamespace] = {}
+
+    def defer_prototypes(self, prototypes, release_gil=True, accessors=frozenset()):
+        for name, argtypes, restype in prototypes:
+            self.declared[name] = SimpleNamespace(
+                argtypes=argtypes,
+                restype=restype,
+                release_gil=release_gil and name not in accessors,
+            )
+
+    def __getattr__(self, name: str):
+        return self.declared.setdefault(name, SimpleNamespace())
+
+
+def test_called_functions_have_prototype():
+    """Every function called from the wrappers has a prototype, ctypes would assume int."""
+    lib = _RecordingLibrary()
+    for module in (
+        linked_list,
+        cdc,
+        client,
+        config_file_parser,
+        dynamic_model,
+        iec61850_common,
+        model,
+        server,
+        mms_type_spec,
+        mms_value,
+    ):
+        module.setup_prototypes(lib)
+
+    package = pathlib.Path(py61850.__file__).parent
+    called = set()
+    for path in package.rglob("*.py"):
+        if "binding" in path.parts:
+            continue
+        for line in path.read_text().splitlines():
+            if not line.lstrip().startswith("#"):
+                called.update(
+                    re.findall(
+                        r"(?:Wrapper\.lib|_cdc|_client|_model|_dynamic_model|_server|_mms_value)\.([A-Z]\w+)",
+                        line,
+                    )
+                )
+
+    missing = {name for name in called if not hasattr(lib.declared.get(name), "restype")}
+    assert not missing
+
+
+def test_connection_services_release_gil():
+    """Blocking services of the connection are called without holding the GIL."""
+    lib = _RecordingLibrary()
+    client.setup_prototypes(lib)
+
+    assert issubclass(Library, CDLL) and not issubclass(Library, PyDLL)
+    services = [name for name in lib.declared if name.startswith("IedConnection_")]
+    assert "IedConnection_getFile" in services
+    assert "IedConnection_queryLogByTime" in services
+    assert all(lib.declared[name].release_gil for name in services)
+
+
+def test_model_accessors_keep_gil():
+    """Accessors of the static model are declared and keep the GIL during the call."""
+    lib = _RecordingLibrary()
+    dynamic_model.setup_prototypes(lib)
+
+    assert dynamic_model._ACCESSORS <= lib.declared.keys()
+    assert not lib.declared["DataAttribute_setValue"].release_gil
+    assert lib.declared["ReportControlBlock_getRptEna"].release_gil
+
+
+def test_server_accessors_keep_gil():
+    """Accessors of the server objects keep the GIL, the services release it."""
+    lib = _RecordingLibrary()
+    server.setup_prototypes(lib)
+
+    assert server._ACCESSORS <= lib.declared.keys()
+    assert not lib.declared["ControlAction_getCtlNum"].release_gil
+    assert not lib.declared["IedServerConfig_setEdition"].release_gil
+    assert lib.declared["IedServer_updateFloatAttributeValue"].release_gil
+    assert lib.declared["IedServer_start"].release_gil
+
+
+def test_mms_value_accessors_keep_gil():
+    """Walking the elements of a MmsValue keeps the GIL."""
+    lib = _RecordingLibrary()
+    mms_value.setup_prototypes(lib)
+
+    assert mms_value._ACCESSORS == {
+        "MmsValue_getArraySize",
+        "MmsValue_getElement",
+        "MmsValue_getType",
+    }
+    assert not lib.declared["MmsValue_getElement"].release_gil
+    assert lib.declared["MmsValue_setElement"].release_gil
+
+
+def test_dynamic_model_restypes():
+    """Functions returning nothing are not declared with a pointer restype."""
+    lib = _RecordingLibrary()
+    dynamic_model.setup_prototypes(lib)
+
+    assert lib.declared["DataAttribute_setValue"].restype is None
+    assert lib.declared["ReportControlBlock_create"].restype is not None
+
+
+def test_phy_com_address_takes_bytes():
+    """The destination MAC address of PhyComAddress_create is given as bytes."""
+    lib = _RecordingLibrary()
+    dynamic_model.setup_prototypes(lib)
+
+    dst_address = lib.declared["PhyComAddress_create"].argtypes[3]
+    assert dst_address.from_param(bytes.fromhex("010ccd010001"))
+
+
+def test_attribute_value_services_take_address():
+    """The attribute value services take the data attribute as an address."""
+    lib = _RecordingLibrary()
+    server.setup_prototypes(lib)
+
+    services = [
+        name
+        for name in lib.declared
+        if name.startswith(("IedServer_get", "IedServer_update")) and "AttributeValue" in name
+    ]
+    assert "IedServer_updateFloatAttributeValue" in services
+    assert all(lib.declared[name].argtypes[1] is c_void_p for name in services)
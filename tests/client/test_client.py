@@ -1,13 +1,18 @@
+import asyncio
+import ctypes
 from unittest.mock import Mock
 
 import pytest
 
+from py61850.binding.iec61850 import client as client_binding
 from py61850.client import (
+    IedBatch,
     IedClientError,
     IedConnection,
     IedConnectionException,
     IedConnectionState,
 )
+from py61850.client import batch as client_batch
 from py61850.common import ACSIClass, FunctionalConstraint
 from py61850.server import IedServer
 
@@ -168,3 +173,174 @@ def test_get_dataset_directory(ied_server_model_port: tuple[IedServer, int]):
     assert b"simpleIOGenericIO/GGIO1.SPCSO2.opRcvd[OR]" in dataset_entries
     assert b"simpleIOGenericIO/GGIO1.SPCSO2.opOk[OR]" in dataset_entries
     ied_connection.close()
+
+
+def test_batch_read(ied_server_model_port: tuple[IedServer, int]):
+    """Read several data attributes with a single IedBatch flush"""
+    ied_server, port = ied_server_model_port
+    ied_connection = IedConnection()
+    ied_connection.connect("127.0.0.1", port)
+
+    batch = IedBatch(ied_connection)
+    stval = batch.queue_read(b"simpleIOGenericIO/GGIO1.Ind1.stVal", FunctionalConstraint.ST)
+    mag = batch.queue_read(b"simpleIOGenericIO/GGIO1.AnIn1.mag.f", FunctionalConstraint.MX)
+    unknown = batch.queue_read(b"simpleIOGenericIO/GGIO1.Unknown.stVal", FunctionalConstraint.ST)
+    futures = batch.flush(max_inflight=2)
+
+    assert futures == [stval, mag, unknown]
+    assert stval.result().get_value() is False
+    assert mag.result().get_value() == 0.0
+    with pytest.raises(IedConnectionException):
+        unknown.result()
+    ied_connection.close()
+
+
+def test_batch_flush_timeout(monkeypatch: pytest.MonkeyPatch):
+    """Requests without an answer when the timeout expires are failed and forgotten"""
+
+    def send(self, object_reference, fc, value, future, slots):
+        # Request sent but never answered
+        key = next(client_batch._keys)
+        client_batch._inflight[key] = (future, value, slots)
+        return key
+
+    monkeypatch.setattr(client_batch.IedBatch, "_send", send)
+    ied_batch = IedBatch(Mock())
+    for _ in range(3):
+        ied_batch.queue_read(b"simpleIOGenericIO/GGIO1.Ind1.stVal", FunctionalConstraint.ST)
+    futures = ied_batch.flush(max_inflight=2, timeout=0.1)
+
+    assert all(future.done() for future in futures)
+    for future in futures:
+        with pytest.raises(IedConnectionException) as exc_info:
+            future.result()
+        assert exc_info.value.error_code == IedClientError.TIMEOUT
+    assert not client_batch._inflight
+
+    # The values of the sent requests are only released by their late answer
+    sent = list(client_batch._timed_out)
+    assert len(sent) == 2
+    for key in sent:
+        client_batch._complete(key, IedClientError.OK.value)
+    assert not client_batch._timed_out
+
+
+def test_batch_flush_timeout_keeps_dataset(monkeypatch: pytest.MonkeyPatch):
+    """A data set polled by a timed-out request is kept alive until the answer"""
+
+    def send(self, object_reference, fc, value, future, slots):
+        key = next(client_batch._keys)
+        client_batch._inflight[key] = (future, value, slots)
+        return key
+
+    monkeypatch.setattr(client_batch.IedBatch, "_send", send)
+    dataset = Mock(reference=b"simpleIOGenericIO/LLN0.Events")
+    ied_batch = IedBatch(Mock())
+    future = ied_batch.queue_dataset_update(dataset)
+    ied_batch.flush(max_inflight=1, timeout=0.05)
+
+    assert isinstance(future.exception(), IedConnectionException)
+    (key,) = [key for key, value in client_batch._timed_out.items() if value is dataset]
+    client_batch._on_dataset(0, key, IedClientError.OK.value, 0)
+    assert key not in client_batch._timed_out
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        b"\x01\x02\x03",
+        bytearray(b"\x01\x02\x03"),
+        memoryview(b"\x01\x02\x03"),
+        memoryview(b"\x01\x00\x02\x00\x03")[::2],
+    ],
+)
+def test_write_octet_string_buffers(monkeypatch: pytest.MonkeyPatch, value):
+    """Every accepted buffer, even a non-contiguous memoryview, is written as is"""
+    written = []
+
+    def write(handle, error, object_reference, fc, buffer, length):
+        written.append(ctypes.string_at(buffer, length))
+        error._obj.value = IedClientError.OK.value
+
+    for name, function in (
+        ("IedConnection_create", lambda: 1),
+        ("IedConnection_destroy", lambda handle: None),
+        ("IedConnection_writeOctetString", write),
+    ):
+        monkeypatch.setitem(vars(client_binding), name, function)
+    ied_connection = IedConnection()
+    ied_connection.write_octet_string(
+        b"simpleIOGenericIO/GGIO1.NamPlt.vendor", FunctionalConstraint.DC, value
+    )
+    del ied_connection
+
+    assert written == [b"\x01\x02\x03"]
+
+
+def test_register_report_handler_replace(monkeypatch: pytest.MonkeyPatch):
+    """The previous report handler is only released once the new one is installed"""
+    installed = []
+
+    def install(handle, rcb_reference, rpt_id, report_handler, parameter):
+        # The handler registered before is still referenced during the call
+        installed.append((report_handler, ied_connection._report_handlers[rcb_reference][1]))
+
+    for name, function in (
+        ("IedConnection_create", lambda: 1),
+        ("IedConnection_destroy", lambda handle: None),
+        ("IedConnection_installReportHandler", install),
+    ):
+        monkeypatch.setitem(vars(client_binding), name, function)
+    ied_connection = IedConnection()
+    rcb_reference = b"simpleIOGenericIO/LLN0.RP.EventsRCB01"
+    ied_connection._report_handlers[rcb_reference] = (print, "previous")
+    ied_connection.register_report_handler(rcb_reference, b"Events", lambda report: None)
+
+    ((report_handler, during_install),) = installed
+    assert during_install == "previous"
+    assert ied_connection._report_handlers[rcb_reference][1] is report_handler
+    del ied_connection
+
+
+def test_read_many(ied_server_model_port: tuple[IedServer, int]):
+    """Read several data attributes with read_many"""
+    ied_server, port = ied_server_model_port
+    ied_connection = IedConnection()
+    ied_connection.connect("127.0.0.1", port)
+
+    values = ied_connection.read_many(
+        [
+            (b"simpleIOGenericIO/GGIO1.Ind1.stVal", FunctionalConstraint.ST),
+            (b"simpleIOGenericIO/GGIO1.AnIn1.mag.f", FunctionalConstraint.MX),
+        ]
+    )
+    assert [value.get_value() for value in values] == [False, 0.0]
+    ied_connection.close()
+
+
+def test_update_datasets_values(ied_server_model_port: tuple[IedServer, int]):
+    """Update the values of several datasets with update_datasets_values"""
+    ied_server, port = ied_server_model_port
+    ied_connection = IedConnection()
+    ied_connection.connect("127.0.0.1", port)
+
+    dataset = ied_connection.read_dataset(b"simpleIOGenericIO/LLN0.ControlEvents")
+    ied_connection.update_datasets_values([dataset])
+    assert dataset.size == 12
+    assert dataset.reference == b"simpleIOGenericIO/LLN0.ControlEvents"
+    ied_connection.close()
+
+
+def test_read_value_async(ied_server_model_port: tuple[IedServer, int]):
+    """Read a data attribute from an asyncio event loop"""
+    ied_server, port = ied_server_model_port
+    ied_connection = IedConnection()
+    ied_connection.connect("127.0.0.1", port)
+
+    value = asyncio.run(
+        ied_connection.read_value_async(
+            b"simpleIOGenericIO/GGIO1.AnIn1.mag.f", FunctionalConstraint.MX
+        )
+    )
+    assert value.get_value() == 0.0
+    ied_connection.close()
@@ -0,0 +1,20 @@
+import ctypes
+
+from py61850.binding.common.linked_list import SLinkedList
+from py61850.common import LinkedList
+
+
+def test_to_string_list():
+    strings = [ctypes.create_string_buffer(name) for name in (b"LLN0", b"LPHD1", b"GGIO1")]
+    # Like the lists built by the library, the head element holds no data
+    nodes = [SLinkedList()] + [SLinkedList(ctypes.addressof(string)) for string in strings]
+    for node, next_node in zip(nodes, nodes[1:]):
+        node.next = ctypes.pointer(next_node)
+
+    linked_list = LinkedList(ctypes.pointer(nodes[0]))
+    assert linked_list.to_string_list() == [b"LLN0", b"LPHD1", b"GGIO1"]
+    assert linked_list.to_pointer_list() == [ctypes.addressof(string) for string in strings]
+
+
+def test_to_string_list_null_handle():
+    assert LinkedList(None).to_string_list() == []
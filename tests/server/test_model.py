@@ -3,6 +3,7 @@ import pytest
 from py61850.common import (
     CdcControlModelOptions,
     CdcOptions,
+    MmsValue,
     ReportOptions,
     ReportTriggerOptions,
 )
@@ -100,3 +101,74 @@ def test_model_creation():
     lln0_health1 = ied.model_node_by_reference("testmodelld0/LLN0.Health")
     assert lln0_health1 is not None
     assert isinstance(lln0_health1, DataObject)
+
+
+def test_create_data_objects():
+    ied = IedModel("testbatch")
+    ld = ied.create_logical_device("ld0")
+    ggio1 = ld.create_logical_node("GGIO1")
+
+    ind1, ind2, an_out1 = ggio1.create_data_objects(
+        [
+            ("sps", "Ind1", {}),
+            ("sps", "Ind2", {}),
+            ("apc", "AnOut1", {"is_integer_not_float": False}),
+        ]
+    )
+    assert ind1.name == b"Ind1"
+    assert ind2.name == b"Ind2"
+    assert an_out1.name == b"AnOut1"
+
+    an_out1_ref = ied.model_node_by_reference("testbatchld0/GGIO1.AnOut1")
+    assert isinstance(an_out1_ref, DataObject)
+
+
+def test_children():
+    ied = IedModel("testmodel")
+    ld = ied.create_logical_device("ld0")
+    lln0 = ld.create_logical_node("LLN0")
+    mod = lln0.create_cdc_ens("Mod")
+    health = lln0.create_cdc_ens("Health")
+
+    assert [child.name for child in lln0.children] == [b"Mod", b"Health"]
+    assert lln0.children[0] is lln0.child("Mod")
+    assert mod.child("stVal") in mod.children
+    assert health.children[0].model_type == ModelNodeType.DATA_ATTRIBUTE
+
+
+def test_descendants():
+    ied = IedModel("testmodel")
+    ld = ied.create_logical_device("ld0")
+    lln0 = ld.create_logical_node("LLN0")
+    mod = lln0.create_cdc_ens("Mod")
+    ggio1 = ld.create_logical_node("GGIO1")
+    ind1 = ggio1.create_cdc_sps("Ind1")
+
+    addresses = [node.addressof for node in ld.descendants()]
+    assert addresses[:2] == [lln0.addressof, mod.addressof]
+    assert mod.child("stVal").addressof in addresses
+    assert ind1.child("stVal").addressof in addresses
+    assert addresses.index(ggio1.addressof) > addresses.index(mod.child("stVal").addressof)
+
+
+def test_logical_devices():
+    ied = IedModel("testmodel")
+    ld0 = ied.create_logical_device("ld0")
+    ld1 = ied.create_logical_device("ld1")
+
+    assert [ld.addressof for ld in ied.logical_devices] == [ld0.addressof, ld1.addressof]
+    assert ied.logical_devices[1].name == b"ld1"
+
+
+def test_set_value():
+    ied = IedModel("testmodel")
+    ld = ied.create_logical_device("ld0")
+    ttmp1 = ld.create_logical_node("TTMP1")
+    tmp_sv = ttmp1.create_cdc_sav("TmpSv", False)
+
+    temperature = tmp_sv.child("instMag.f")
+    temperature.set_value(21.5)
+    assert MmsValue(temperature.handle.contents.mmsValue).to_float() == 21.5
+
+    with pytest.raises(TypeError):
+        tmp_sv.child("instMag").set_value(21.5)
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+import pytest
+
+from py61850.binding.iec61850 import server as server_binding
+from py61850.server import IedServer
+
+
+@pytest.fixture
+def recorded_server(monkeypatch: pytest.MonkeyPatch) -> tuple[IedServer, list]:
+    """IedServer whose calls to the server functions are recorded instead of made"""
+    calls = []
+
+    def record(name):
+        return lambda *args: calls.append((name, *args[1:]))
+
+    for name in (
+        "IedServer_lockDataModel",
+        "IedServer_unlockDataModel",
+        "IedServer_updateFloatAttributeValue",
+        "IedServer_updateBooleanAttributeValue",
+        "IedServer_updateUTCTimeAttributeValue",
+    ):
+        monkeypatch.setitem(vars(server_binding), name, record(name))
+    ied_server = IedServer.__new__(IedServer)
+    ied_server._handle = 1
+    return ied_server, calls
+
+
+def test_update_batch(recorded_server: tuple[IedServer, list]):
+    """All the updates are applied between a single lock and unlock"""
+    ied_server, calls = recorded_server
+    magnitude = SimpleNamespace(addressof=0x10)
+    state = SimpleNamespace(addressof=0x20)
+
+    ied_server.update_batch([(magnitude, "float", 21.5), (state, "boolean", True)])
+
+    assert calls == [
+        ("IedServer_lockDataModel",),
+        ("IedServer_updateFloatAttributeValue", 0x10, 21.5),
+        ("IedServer_updateBooleanAttributeValue", 0x20, True),
+        ("IedServer_unlockDataModel",),
+    ]
+
+
+def test_update_batch_unknown_kind(recorded_server: tuple[IedServer, list]):
+    """An unknown kind is rejected before the data model is locked"""
+    ied_server, calls = recorded_server
+    magnitude = SimpleNamespace(addressof=0x10)
+
+    for kind in ("flaot", "batch"):
+        with pytest.raises(ValueError):
+            ied_server.update_batch([(magnitude, "float", 21.5), (magnitude, kind, 1)])
+    assert calls == []
+
+
+def test_update_batch_failure_unlocks(recorded_server: tuple[IedServer, list]):
+    """The data model is unlocked when an update fails"""
+    ied_server, calls = recorded_server
+    magnitude = SimpleNamespace(addressof=0x10)
+    invalid = SimpleNamespace()
+
+    with pytest.raises(AttributeError):
+        ied_server.update_batch([(magnitude, "float", 21.5), (invalid, "float", 1.0)])
+    assert calls == [
+        ("IedServer_lockDataModel",),
+        ("IedServer_updateFloatAttributeValue", 0x10, 21.5),
+        ("IedServer_unlockDataModel",),
+    ]
+
+
+def test_update_utc_time_ns(recorded_server: tuple[IedServer, list]):
+    """The nanoseconds are given to the library as truncated milliseconds"""
+    ied_server, calls = recorded_server
+    timestamp = SimpleNamespace(addressof=0x30)
+
+    ied_server.update_utc_time_ns(timestamp, 1_700_000_000_123_999_999)
+
+    assert calls == [("IedServer_updateUTCTimeAttributeValue", 0x30, 1_700_000_000_123)]